@@ -6,9 +6,10 @@ import os
 import sys
 import shutil
 import subprocess
+from array import array
 from datetime import datetime, timedelta
 from logging.handlers import RotatingFileHandler
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 import atexit
 
 import yaml
@@ -43,6 +44,8 @@ DEFAULT_CONFIG = {
     "sounds_dir": None,
     "default_manual_indices": [5, 7, 11, 13, 16, 18, 22, 24, 27, 29, 31],
     "prefer_mci": True,
+    "timeline_days": 7,
+    "schedule_file": "",
 }
 
 def get_base_dir() -> str:
@@ -148,17 +151,69 @@ def get_tz(tz_name: str):
     return zone
 
 
-def load_schedule(csv_path: str = SCHEDULE_CSV) -> List[Tuple[int, str]]:
+def get_schedule_path(config: dict) -> str:
+    """schedule_file from config (CSV or YAML, relative to the app dir), else schedule.csv."""
+    path = str(config.get("schedule_file") or "").strip().strip('"')
+    if not path:
+        return SCHEDULE_CSV
+    return path if os.path.isabs(path) else get_resource_path(path)
+
+
+def _read_schedule_rows(path: str) -> List[Tuple[int, str]]:
+    if os.path.splitext(path)[1].lower() in (".yaml", ".yml"):
+        with open(path, "r", encoding="utf-8") as f:
+            raw = yaml.safe_load(f) or []
+        if isinstance(raw, dict):
+            raw = raw.get("bells") or []
+        rows = []
+        for n, item in enumerate(raw, start=1):
+            if isinstance(item, dict):
+                rows.append((n, item.get("index"), item.get("time")))
+            elif isinstance(item, (list, tuple)) and len(item) >= 2:
+                rows.append((n, item[0], item[1]))
+            else:
+                rows.append((n, item, None))
+    else:
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            reader = csv.DictReader(f)
+            rows = [(reader.line_num, row.get("index"), row.get("time")) for row in reader]
     items: List[Tuple[int, str]] = []
-    with open(csv_path, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            idx = int(row["index"])  # may raise if invalid
-            hhmm = str(row["time"]).zfill(4)
-            items.append((idx, hhmm))
+    for line, index, time_str in rows:
+        # Bad rows are reported and skipped instead of aborting the whole schedule
+        try:
+            idx = int(str(index).strip())
+            text = str(time_str if time_str is not None else "").strip()
+            hhmm = text.replace(":", "").zfill(4)
+            if not text or not hhmm.isdigit() or len(hhmm) != 4 or int(hhmm[:2]) > 23 or int(hhmm[2:]) > 59:
+                raise ValueError(f"invalid time {time_str!r}")
+        except (TypeError, ValueError) as e:
+            logging.warning(f"Skipping schedule row {line} in {path}: {e}")
+            continue
+        items.append((idx, hhmm))
     return items
 
 
+# path -> ((mtime_ns, size), minute offsets, indices); compiled once per file version
+_SCHEDULE_CACHE: Dict[str, Tuple[Tuple[int, int], array, array]] = {}
+
+
+def load_schedule(csv_path: str = SCHEDULE_CSV) -> List[Tuple[int, str]]:
+    """Load a CSV/YAML schedule as [(index, "HHMM")] sorted by time.
+
+    The parsed file is kept as compact minute/index arrays keyed by mtime and size,
+    so reloading an unchanged file costs one stat() call.
+    """
+    st = os.stat(csv_path)
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _SCHEDULE_CACHE.get(csv_path)
+    if cached is None or cached[0] != key:
+        rows = sorted((int(hhmm[:2]) * 60 + int(hhmm[2:]), idx) for idx, hhmm in _read_schedule_rows(csv_path))
+        cached = (key, array("H", (m for m, _ in rows)), array("i", (idx for _, idx in rows)))
+        _SCHEDULE_CACHE[csv_path] = cached
+    _, minutes, indices = cached
+    return [(idx, f"{m // 60:02d}{m % 60:02d}") for m, idx in zip(minutes, indices)]
+
+
 def hhmm_to_today(hhmm: str, zone) -> datetime:
     hour = int(hhmm[:2])
     minute = int(hhmm[2:])
@@ -395,23 +450,64 @@ def play_sound_for_index(index: int, config: dict) -> None:
     logging.error("No available audio backend: provide ffplay (FFmpeg) or use compatible format for MCI.")
 
 
-def schedule_today(sched, items: List[Tuple[int, str]], zone, config: dict) -> int:
+def is_schedule_day(day, config: dict) -> bool:
+    """workdays_only 설정에 따라 해당 날짜에 종을 울릴지 판단합니다."""
+    if config.get("workdays_only", True) and not config.get("allow_weekend", False):
+        return day.weekday() <= 4
+    return True
+
+
+def get_timeline_days(config: dict) -> int:
+    """미리 등록할 날 수 (다음 날 자동 재생을 끄면 오늘만)"""
+    if not bool(config.get("autoplay_next_day", True)):
+        return 1
+    return max(1, int(config.get("timeline_days", 7)))
+
+
+def schedule_days(sched, items: List[Tuple[int, str]], zone, config: dict) -> int:
+    """오늘부터 timeline_days일치 종 작업을 스케줄 파일 내용에 맞춥니다.
+
+    작업 id에 날짜가 들어가므로(bell-YYYYMMDD-인덱스) 매일 호출해도 새로 들어온 날만
+    추가됩니다. 이미 등록된 종은 그대로 두되, 시각이 바뀐 종은 새 시각으로 옮기고
+    파일에서 빠졌거나 더 이상 종을 울리지 않는 날의 종은 지웁니다.
+    """
     now = datetime.now(tz=zone)
-    count = 0
-    for idx, hhmm in items:
-        run_at = hhmm_to_today(hhmm, zone)
-        if run_at > now:
-            sched.add_job(
-                play_sound_for_index,
-                trigger=DateTrigger(run_date=run_at),
-                args=[idx, config],
-                id=f"bell-{idx}",
-                misfire_grace_time=int(config.get("misfire_grace_seconds", 60)),
-                replace_existing=True,
-            )
-            count += 1
-    logging.info(f"Scheduled {count} jobs for today (remaining only)")
-    return count
+    wanted: Dict[str, Tuple[datetime, int]] = {}
+    for offset in range(get_timeline_days(config)):
+        day = (now + timedelta(days=offset)).date()
+        if not is_schedule_day(day, config):
+            continue
+        for idx, hhmm in items:
+            run_at = datetime(day.year, day.month, day.day, int(hhmm[:2]), int(hhmm[2:]), tzinfo=zone)
+            if run_at > now:
+                wanted[f"bell-{day:%Y%m%d}-{idx}"] = (run_at, idx)
+
+    moved = removed = 0
+    for job in sched.get_jobs():
+        if not job.id.startswith("bell-"):
+            continue
+        target = wanted.get(job.id)
+        if target is None:
+            sched.remove_job(job.id)
+            removed += 1
+        elif getattr(job.trigger, "run_date", None) == target[0]:
+            del wanted[job.id]
+        else:
+            moved += 1
+
+    for job_id, (run_at, idx) in wanted.items():
+        sched.add_job(
+            play_sound_for_index,
+            trigger=DateTrigger(run_date=run_at),
+            args=[idx, config],
+            id=job_id,
+            misfire_grace_time=int(config.get("misfire_grace_seconds", 60)),
+            replace_existing=True,
+        )
+    added = len(wanted) - moved
+    logging.info(f"Scheduled {added} new jobs, moved {moved}, removed {removed} "
+                 f"(next {get_timeline_days(config)} days, remaining only)")
+    return added
 
 
 def schedule_test_mode(sched, config: dict, zone) -> None:
@@ -428,25 +524,46 @@ def schedule_test_mode(sched, config: dict, zone) -> None:
     logging.info("TEST MODE: 1..31 scheduled at 3s intervals")
 
 
+def _parse_refresh_time(value) -> Tuple[int, int]:
+    # YAML은 따옴표 없는 H:MM 중 시가 0이 아닌 값(예: 12:30)을 60진수 정수(750분)로 읽으므로
+    # 정수도 허용 (00:01처럼 0으로 시작하면 문자열 그대로)
+    if isinstance(value, int):
+        return value // 60, value % 60
+    hh, mm = map(int, str(value).strip('"').split(":"))
+    return hh, mm
+
+
 def schedule_next_day_refresh(sched, config: dict, zone) -> None:
-    hh, mm = map(int, str(config.get("refresh_time", "00:01")).split(":"))
+    """다음 refresh_time에 새로 들어온 날의 종을 추가하는 작업을 등록합니다.
+
+    스케줄 파일은 갱신할 때마다 다시 읽고 이미 등록된 날의 종도 파일에 맞춰 옮기거나
+    지우므로, schedule.csv를 고치면 재시작 없이 다음 갱신부터 반영됩니다.
+    """
+    try:
+        hh, mm = _parse_refresh_time(config.get("refresh_time", "00:01"))
+    except ValueError:
+        logging.warning("Invalid refresh_time format, using default 00:01")
+        hh, mm = 0, 1
     now = datetime.now(tz=zone)
     refresh = datetime(now.year, now.month, now.day, hh, mm, tzinfo=zone)
     if refresh <= now:
         refresh += timedelta(days=1)
 
-    def refresh_jobs():
+    def extend_jobs():
         try:
-            logging.info("Refreshing schedule for new day...")
-            sched.remove_all_jobs()
-            start_scheduler(sched, config, background=True)
+            logging.info("Extending schedule for new day...")
+            schedule_days(sched, load_schedule(get_schedule_path(config)), zone, config)
         except Exception as e:
-            logging.exception(f"Failed to refresh schedule: {e}")
+            logging.exception(f"Failed to extend schedule: {e}")
+        finally:
+            schedule_next_day_refresh(sched, config, zone)
 
+    # 날짜별 id: 실행 중인 작업이 정리되는 동안 다음 작업 등록과 겹치지 않게 함
     sched.add_job(
-        refresh_jobs,
+        extend_jobs,
         trigger=DateTrigger(run_date=refresh),
-        id="daily-refresh",
+        id=f"daily-refresh-{refresh:%Y%m%d}",
+        misfire_grace_time=None,
         replace_existing=True,
     )
     logging.info(f"Next refresh at {refresh}")
@@ -455,19 +572,16 @@ def schedule_next_day_refresh(sched, config: dict, zone) -> None:
 def start_scheduler(sched: Optional[BackgroundScheduler], config: dict, background: bool = False):
     zone = get_tz(config.get("timezone", "Asia/Seoul"))
 
-    if config.get("workdays_only", True) and not config.get("allow_weekend", False):
-        if not is_workday(zone):
-            logging.info("Weekend detected; skipping schedule (workdays_only=true)")
-            return None
-
     if sched is None:
         sched = BackgroundScheduler(timezone=zone) if background else BlockingScheduler(timezone=zone)
 
     if bool(config.get("test_mode", False)):
         schedule_test_mode(sched, config, zone)
     else:
-        items = load_schedule(SCHEDULE_CSV)
-        schedule_today(sched, items, zone, config)
+        items = load_schedule(get_schedule_path(config))
+        if not is_schedule_day(datetime.now(tz=zone).date(), config):
+            logging.info("Weekend detected; today's bells skipped (workdays_only=true)")
+        schedule_days(sched, items, zone, config)
         if bool(config.get("autoplay_next_day", True)):
             schedule_next_day_refresh(sched, config, zone)
 
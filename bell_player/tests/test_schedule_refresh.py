@@ -0,0 +1,111 @@
+"""
+Daily refresh picks up schedule file edits
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+# Make the app module importable from the parent directory
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+import app
+
+
+class FakeScheduler:
+    """Minimal scheduler that records jobs by id"""
+
+    def __init__(self):
+        self.jobs = {}
+
+    def add_job(self, func, trigger=None, args=None, id=None, **_ignored):
+        self.jobs[id] = SimpleNamespace(id=id, func=func, trigger=trigger, args=args)
+
+    def get_job(self, job_id):
+        return self.jobs.get(job_id)
+
+    def get_jobs(self):
+        return list(self.jobs.values())
+
+    def remove_job(self, job_id):
+        del self.jobs[job_id]
+
+
+class TestScheduleRefresh(unittest.TestCase):
+    """schedule_next_day_refresh / load_schedule cache"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "schedule.csv")
+        self._write("index,time\n1,0805\n")
+        self.config = {"schedule_file": self.path, "timeline_days": 3,
+                       "workdays_only": False, "allow_weekend": True}
+        self.zone = app.get_tz("Asia/Seoul")
+
+    def tearDown(self):
+        app._SCHEDULE_CACHE.pop(self.path, None)
+        self.tmp.cleanup()
+
+    def _write(self, text):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def _refresh(self, sched):
+        refresh_id = max(job_id for job_id in sched.jobs if job_id.startswith("daily-refresh-"))
+        sched.jobs.pop(refresh_id).func()
+
+    def _touch(self):
+        # Bump the mtime so an edit within the same second is still seen by the cache
+        os.utime(self.path, ns=(time.time_ns(), time.time_ns() + 1_000_000_000))
+
+    def _bells(self, sched):
+        # Today's bells may already have passed while the test runs, so compare the later days only
+        today = f"bell-{datetime.now(tz=self.zone):%Y%m%d}-"
+        return {job_id: job.trigger.run_date for job_id, job in sched.jobs.items()
+                if job_id.startswith("bell-") and not job_id.startswith(today)}
+
+    def test_refresh_reloads_edited_file(self):
+        """Editing the schedule between two refreshes adds the new bells without a restart"""
+        sched = FakeScheduler()
+        app.schedule_next_day_refresh(sched, self.config, self.zone)
+        self._refresh(sched)
+        self.assertFalse(any(job_id.endswith("-2") for job_id in sched.jobs))
+
+        self._write("index,time\n1,0805\n2,0810\n")
+        self._touch()
+        self._refresh(sched)
+        self.assertTrue(any(job_id.startswith("bell-") and job_id.endswith("-2") for job_id in sched.jobs))
+
+    def test_edited_and_removed_bells_are_updated(self):
+        """Moving or removing a bell in the file updates the days that are already registered"""
+        self._write("index,time\n1,2358\n2,2359\n")
+        sched = FakeScheduler()
+        app.schedule_days(sched, app.load_schedule(self.path), self.zone, self.config)
+        before = self._bells(sched)
+        ids_1 = [job_id for job_id in before if job_id.endswith("-1")]
+        self.assertGreaterEqual(len(ids_1), 2)
+
+        self._write("index,time\n1,2357\n")
+        self._touch()
+        app.schedule_days(sched, app.load_schedule(self.path), self.zone, self.config)
+        after = self._bells(sched)
+        self.assertEqual(sorted(after), sorted(ids_1))
+        for job_id in ids_1:
+            self.assertEqual(after[job_id], before[job_id] - timedelta(minutes=1))
+
+    def test_unchanged_file_is_cache_hit(self):
+        """An unchanged file is not parsed again"""
+        first = app.load_schedule(self.path)
+        cached = app._SCHEDULE_CACHE[self.path]
+        self.assertEqual(app.load_schedule(self.path), first)
+        self.assertIs(app._SCHEDULE_CACHE[self.path], cached)
+
+
+if __name__ == '__main__':
+    unittest.main()
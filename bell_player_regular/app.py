@@ -1,27 +1,51 @@
 from __future__ import annotations
 
 import csv
+import hashlib
 import logging
 import os
 import sys
 import shutil
+import sqlite3
 import subprocess
 from datetime import datetime, timedelta
 from logging.handlers import RotatingFileHandler
-from typing import List, Tuple, Optional, Union
+from typing import Callable, List, Tuple, Optional
 import atexit
 import requests
 import json
 from contextlib import contextmanager
 import threading
 import time
+import weakref
 
 import yaml
-from apscheduler.schedulers.background import BackgroundScheduler
-from apscheduler.schedulers.blocking import BlockingScheduler
-from apscheduler.triggers.date import DateTrigger
 from dateutil import tz
 
+from clock_watch import ClockWatch
+from resume_catchup import CATCHUP_POLICIES, ResumeCatchUp, coalesce_missed
+from heap_scheduler import HeapScheduler
+from timer_wheel import TimerWheelScheduler
+from precise_timing import JitterTracker, sleep_until
+from job_planner import JobPlan, PlannedJob, apply_plan, diff_jobs, snapshot_jobs
+from timeline import BellTimeline, at_hhmm, bell_job_day, bell_job_id
+from week_index import WeekIndex
+from recurrence import ScheduleRule, ScheduleRuleSet, named_schedules, parse_schedule_rules
+from holiday_calendar import CalendarFile
+from schedule_files import ScheduleFile
+from state_store import FIRED, MISSED, StateStore
+from schedule_validator import DurationCache, ScheduleIssue, log_issues, plan_day, validate_plan
+from zones import BellZone, ZoneDispatcher, parse_zones
+from time_sync import (
+    SourceHealthRegistry,
+    TimeSample,
+    TimeSyncService,
+    query_concurrently,
+    select_best_sample,
+    split_host_port,
+)
+from time_sync_async import AsyncTimeSyncClient
+
 try:
     from pydub import AudioSegment
 except Exception:
@@ -81,6 +105,10 @@ SUNDAY_SCHEDULE = [
 # 하위 호환성을 위한 기본 스케줄 (월~토요일과 동일)
 REGULAR_SCHEDULE = WEEKDAY_SCHEDULE
 
+# 스케줄 파일을 지정하지 않았을 때 쓰는 내장 스케줄 (파일을 쓰면 위 목록의 내용만 교체됨)
+BUILTIN_WEEKDAY_SCHEDULE = list(WEEKDAY_SCHEDULE)
+BUILTIN_SUNDAY_SCHEDULE = list(SUNDAY_SCHEDULE)
+
 DEFAULT_CONFIG = {
     "timezone": "Asia/Seoul",
     "volume": 1.0,
@@ -95,8 +123,39 @@ DEFAULT_CONFIG = {
     "sounds_dir": None,
     "sounds_dir_sunday": None,
     "prefer_mci": True,
+    "time_sync_interval_seconds": 600,
+    "time_sync_max_interval_seconds": 21600,
+    "time_sync_state_max_age_hours": 48,
+    "clock_jump_threshold_seconds": 2.0,
+    "resume_threshold_seconds": 10.0,
+    "resume_catchup_policy": "latest",
+    "resume_replay_window_seconds": 300,
+    "offset_corrected_firing": True,
+    "offset_retime_tolerance_seconds": 0.5,
+    "ntp_servers": [
+        "time.windows.com",
+        "pool.ntp.org",
+        "time.google.com",
+        "time.cloudflare.com",
+    ],
+    "ntp_deadline_seconds": 3.0,
+    "worldtime_api_url": "http://worldtimeapi.org/api/timezone/Asia/Seoul",
+    "time_source_backoff_seconds": 30,
+    "time_source_max_backoff_seconds": 1800,
+    "scheduler_engine": "apscheduler",
+    "timeline_days": 7,
+    "precision_firing": False,
+    "preroll_seconds": 2.0,
+    "weekday_schedule_file": "",
+    "sunday_schedule_file": "",
+    "zones": [],
+    "schedule_rules": [],
+    "holiday_calendar_file": "",
+    "state_store_file": "",
 }
 
+SCHEDULER_ENGINES = ("apscheduler", "heap", "wheel")
+
 def get_base_dir() -> str:
     """Return app base directory in source mode."""
     return os.path.dirname(os.path.abspath(__file__))
@@ -307,6 +366,7 @@ def load_config(path: str = CONFIG_YAML) -> dict:
     
     # 설정 값 검증
     validated_cfg = validate_config(cfg)
+    configure_schedule_files(validated_cfg)
     return validated_cfg
 
 
@@ -394,6 +454,203 @@ def validate_config(config: dict) -> dict:
     except (TypeError, ValueError):
         logging.warning(f"잘못된 미스파이어 유예 시간 ({misfire_grace}), 기본값 사용")
         validated["misfire_grace_seconds"] = 60
+
+    # 시간 동기화 주기 검증 (최소 10초)
+    sync_interval = config.get("time_sync_interval_seconds", 600)
+    try:
+        sync_interval = float(sync_interval)
+        if sync_interval < 10:
+            raise ValueError("너무 짧은 주기")
+        validated["time_sync_interval_seconds"] = sync_interval
+    except (TypeError, ValueError):
+        logging.warning(f"잘못된 시간 동기화 주기 ({sync_interval}), 기본값 사용")
+        validated["time_sync_interval_seconds"] = 600
+
+    # 드리프트 모델 예측이 맞을 때 늘릴 수 있는 최대 동기화 주기 검증
+    sync_max_interval = config.get("time_sync_max_interval_seconds", 21600)
+    try:
+        sync_max_interval = float(sync_max_interval)
+        if sync_max_interval < validated["time_sync_interval_seconds"]:
+            raise ValueError("기본 주기보다 짧음")
+        validated["time_sync_max_interval_seconds"] = sync_max_interval
+    except (TypeError, ValueError):
+        logging.warning(f"잘못된 최대 동기화 주기 ({sync_max_interval}), 기본값 사용")
+        validated["time_sync_max_interval_seconds"] = max(21600, validated["time_sync_interval_seconds"])
+
+    # 시계 점프 감지 임계값 검증 (0.5초 이상)
+    jump_threshold = config.get("clock_jump_threshold_seconds", 2.0)
+    try:
+        jump_threshold = float(jump_threshold)
+        if jump_threshold < 0.5:
+            raise ValueError("너무 작은 값")
+        validated["clock_jump_threshold_seconds"] = jump_threshold
+    except (TypeError, ValueError):
+        logging.warning(f"잘못된 시계 점프 임계값 ({jump_threshold}), 기본값 사용")
+        validated["clock_jump_threshold_seconds"] = 2.0
+
+    # 절전 복귀 감지 임계값 검증 (3초 이상)
+    resume_threshold = config.get("resume_threshold_seconds", 10.0)
+    try:
+        resume_threshold = float(resume_threshold)
+        if resume_threshold < 3:
+            raise ValueError("너무 작은 값")
+        validated["resume_threshold_seconds"] = resume_threshold
+    except (TypeError, ValueError):
+        logging.warning(f"잘못된 절전 복귀 임계값 ({resume_threshold}), 기본값 사용")
+        validated["resume_threshold_seconds"] = 10.0
+
+    # 절전 복귀 후 놓친 종 정책 검증 (latest, skip, replay)
+    policy = config.get("resume_catchup_policy", "latest")
+    if isinstance(policy, str) and policy.strip().lower() in CATCHUP_POLICIES:
+        validated["resume_catchup_policy"] = policy.strip().lower()
+    else:
+        logging.warning(f"지원하지 않는 놓친 종 정책 ({policy}), 기본값 사용")
+        validated["resume_catchup_policy"] = "latest"
+
+    # 놓친 종 다시 재생 구간 검증 (0초 ~ 1일)
+    replay_window = config.get("resume_replay_window_seconds", 300)
+    try:
+        replay_window = int(replay_window)
+        if not 0 <= replay_window <= 86400:
+            raise ValueError("범위 초과")
+        validated["resume_replay_window_seconds"] = replay_window
+    except (TypeError, ValueError):
+        logging.warning(f"잘못된 다시 재생 구간 ({replay_window}), 기본값 사용")
+        validated["resume_replay_window_seconds"] = 300
+
+    # 오프셋 보정 발사 재조정 허용 오차 검증 (0.01 ~ 60초)
+    retime_tolerance = config.get("offset_retime_tolerance_seconds", 0.5)
+    try:
+        retime_tolerance = float(retime_tolerance)
+        if not 0.01 <= retime_tolerance <= 60:
+            raise ValueError("범위 초과")
+        validated["offset_retime_tolerance_seconds"] = retime_tolerance
+    except (TypeError, ValueError):
+        logging.warning(f"잘못된 재조정 허용 오차 ({retime_tolerance}), 기본값 사용")
+        validated["offset_retime_tolerance_seconds"] = 0.5
+
+    # 저장된 시간 오프셋의 유효 기간 검증 (시간 단위, 0이면 사용 안 함)
+    state_max_age = config.get("time_sync_state_max_age_hours", 48)
+    try:
+        state_max_age = float(state_max_age)
+        if state_max_age < 0:
+            raise ValueError("음수 값")
+        validated["time_sync_state_max_age_hours"] = state_max_age
+    except (TypeError, ValueError):
+        logging.warning(f"잘못된 시간 오프셋 유효 기간 ({state_max_age}), 기본값 사용")
+        validated["time_sync_state_max_age_hours"] = 48
+
+    # NTP 서버 목록 검증
+    ntp_servers = config.get("ntp_servers", DEFAULT_CONFIG["ntp_servers"])
+    if isinstance(ntp_servers, str):
+        ntp_servers = [ntp_servers]
+    if isinstance(ntp_servers, list):
+        ntp_servers = [str(x).strip() for x in ntp_servers if str(x).strip()]
+    else:
+        ntp_servers = []
+    if not ntp_servers:
+        logging.warning("NTP 서버 목록이 비어 있거나 잘못됨, 기본값 사용")
+        ntp_servers = list(DEFAULT_CONFIG["ntp_servers"])
+    validated["ntp_servers"] = ntp_servers
+
+    # NTP 전체 마감 시간 검증 (0.2 ~ 30초)
+    ntp_deadline = config.get("ntp_deadline_seconds", 3.0)
+    try:
+        ntp_deadline = float(ntp_deadline)
+        if not 0.2 <= ntp_deadline <= 30:
+            raise ValueError("범위 초과")
+        validated["ntp_deadline_seconds"] = ntp_deadline
+    except (TypeError, ValueError):
+        logging.warning(f"잘못된 NTP 마감 시간 ({ntp_deadline}), 기본값 사용")
+        validated["ntp_deadline_seconds"] = 3.0
+
+    # 실패한 시간 소스의 백오프 시간 검증
+    for key, default in (("time_source_backoff_seconds", 30), ("time_source_max_backoff_seconds", 1800)):
+        value = config.get(key, default)
+        try:
+            value = float(value)
+            if value < 1:
+                raise ValueError("너무 작은 값")
+            validated[key] = value
+        except (TypeError, ValueError):
+            logging.warning(f"잘못된 백오프 시간 ({key}: {value}), 기본값 사용")
+            validated[key] = default
+    
+    # 미리 등록할 타임라인 일수 검증 (1 ~ 31일)
+    timeline_days = config.get("timeline_days", 7)
+    try:
+        timeline_days = int(timeline_days)
+        if not 1 <= timeline_days <= 31:
+            raise ValueError("범위 초과")
+        validated["timeline_days"] = timeline_days
+    except (TypeError, ValueError):
+        logging.warning(f"잘못된 타임라인 일수 ({timeline_days}), 기본값 사용")
+        validated["timeline_days"] = 7
+
+    # 정밀 발사 pre-roll 검증 (0.1 ~ 30초)
+    preroll = config.get("preroll_seconds", 2.0)
+    try:
+        preroll = float(preroll)
+        if not 0.1 <= preroll <= 30:
+            raise ValueError("범위 초과")
+        validated["preroll_seconds"] = preroll
+    except (TypeError, ValueError):
+        logging.warning(f"잘못된 pre-roll 시간 ({preroll}), 기본값 사용")
+        validated["preroll_seconds"] = 2.0
+
+    # 구역 목록 검증 (잘못된 구역은 parse_zones가 경고 후 제외)
+    zones = config.get("zones") or []
+    if not isinstance(zones, list):
+        logging.warning(f"잘못된 구역 목록 ({zones}), 기본값 사용")
+        zones = []
+    valid_names = {z.name for z in parse_zones(zones, WEEKDAY_SCHEDULE, SUNDAY_SCHEDULE, BASE_DIR)}
+    validated["zones"] = [z for z in zones if isinstance(z, dict) and str(z.get("name", "")).strip() in valid_names]
+
+    # 평일/일요일 스케줄 파일 경로 검증 (빈 문자열이면 내장 스케줄 사용)
+    for key in ("weekday_schedule_file", "sunday_schedule_file"):
+        schedule_file = config.get(key, "")
+        if schedule_file is None:
+            schedule_file = ""
+        if isinstance(schedule_file, str):
+            validated[key] = schedule_file.strip().strip('"')
+        else:
+            logging.warning(f"잘못된 스케줄 파일 경로 ({key}: {schedule_file}), 기본값 사용")
+            validated[key] = ""
+
+    # 반복 규칙 목록 검증 (잘못된 규칙은 parse_schedule_rules가 경고 후 제외)
+    rules = config.get("schedule_rules") or []
+    if not isinstance(rules, list):
+        logging.warning(f"잘못된 반복 규칙 목록 ({rules}), 기본값 사용")
+        rules = []
+    validated["schedule_rules"] = [rule.source for rule in _parse_schedule_rules(rules)]
+
+    # 공휴일/예외 달력 파일 경로 검증 (빈 문자열이면 사용 안 함)
+    calendar_file = config.get("holiday_calendar_file", "")
+    if calendar_file is None:
+        calendar_file = ""
+    if isinstance(calendar_file, str):
+        validated["holiday_calendar_file"] = calendar_file.strip().strip('"')
+    else:
+        logging.warning(f"잘못된 달력 파일 경로 ({calendar_file}), 기본값 사용")
+        validated["holiday_calendar_file"] = ""
+
+    # 상태 저장소(SQLite) 파일 경로 검증 (빈 문자열이면 사용 안 함)
+    store_file = config.get("state_store_file", "")
+    if store_file is None:
+        store_file = ""
+    if isinstance(store_file, str):
+        validated["state_store_file"] = store_file.strip().strip('"')
+    else:
+        logging.warning(f"잘못된 상태 저장소 경로 ({store_file}), 기본값 사용")
+        validated["state_store_file"] = ""
+
+    # 스케줄러 엔진 검증 (apscheduler 또는 내장 heap/wheel)
+    engine = config.get("scheduler_engine", "apscheduler")
+    if isinstance(engine, str) and engine.strip().lower() in SCHEDULER_ENGINES:
+        validated["scheduler_engine"] = engine.strip().lower()
+    else:
+        logging.warning(f"지원하지 않는 스케줄러 엔진 ({engine}), 기본값 사용")
+        validated["scheduler_engine"] = "apscheduler"
     
     # FFplay 경로 검증
     ffplay_path = config.get("ffplay_path", "")
@@ -404,7 +661,8 @@ def validate_config(config: dict) -> dict:
         validated["ffplay_path"] = ffplay_path
     
     # 부울 값들 검증
-    bool_keys = ["test_mode", "workdays_only", "allow_weekend", "autoplay_next_day", "prefer_mci"]
+    bool_keys = ["test_mode", "workdays_only", "allow_weekend", "autoplay_next_day", "prefer_mci",
+                 "offset_corrected_firing", "precision_firing"]
     for key in bool_keys:
         value = config.get(key, DEFAULT_CONFIG.get(key, False))
         if not isinstance(value, bool):
@@ -450,77 +708,259 @@ def setup_logging(log_path: str) -> None:
     logger.addHandler(sh)
 
 
-def get_ntp_time():
-    """NTP 서버에서 정확한 시간을 가져옵니다."""
+NTP_SERVERS = list(DEFAULT_CONFIG["ntp_servers"])
+NTP_DEADLINE_SECONDS = float(DEFAULT_CONFIG["ntp_deadline_seconds"])
+
+WORLDTIME_API_URL = DEFAULT_CONFIG["worldtime_api_url"]
+WORLDTIME_SOURCE_NAME = "worldtimeapi"
+
+# 시간 소스별 상태 (실패한 서버는 지수 백오프 동안 조회하지 않음)
+source_health = SourceHealthRegistry()
+
+
+def query_ntp_server(server: str, timeout: float) -> Optional[TimeSample]:
+    """NTP 서버 하나에 질의해 로컬 시계 대비 오프셋을 측정합니다."""
+    import ntplib
+    import socket
+
+    host, port = split_host_port(server)
     try:
-        import ntplib
-        import socket
-        
-        # 여러 NTP 서버 시도
-        ntp_servers = [
-            'time.windows.com',
-            'pool.ntp.org',
-            'time.google.com',
-            'time.cloudflare.com'
-        ]
-        
-        for server in ntp_servers:
-            try:
-                client = ntplib.NTPClient()
-                response = client.request(server, version=3, timeout=3)
-                ntp_time = datetime.fromtimestamp(response.tx_time)
-                logging.info(f"NTP 시간 동기화 성공: {server}")
-                return ntp_time
-            except (socket.timeout, socket.gaierror, ntplib.NTPException) as e:
-                logging.debug(f"NTP 서버 {server} 연결 실패: {e}")
-                continue
-                
+        client = ntplib.NTPClient()
+        response = client.request(host, version=3, port=port, timeout=timeout)
+    except (socket.timeout, socket.gaierror, OSError, ntplib.NTPException) as e:
+        logging.debug(f"NTP 서버 {server} 연결 실패: {e}")
+        return None
+    return TimeSample(
+        offset=response.offset,
+        delay=response.delay,
+        source=server,
+        dispersion=response.root_dispersion,
+    )
+
+
+def _query_ntp_with_health(server: str, timeout: float) -> Optional[TimeSample]:
+    """NTP 서버를 조회하고 결과를 source_health에 기록합니다."""
+    t0 = time.monotonic()
+    sample = None
+    try:
+        sample = query_ntp_server(server, timeout)
+    finally:
+        if sample is not None:
+            source_health.record_success(server, time.monotonic() - t0)
+        else:
+            source_health.record_failure(server)
+    return sample
+
+
+def get_ntp_sample(servers: Optional[List[str]] = None,
+                   deadline: Optional[float] = None) -> Optional[TimeSample]:
+    """설정된 NTP 서버 전체에 병렬로 질의해 가장 좋은 측정값을 반환합니다.
+
+    전체 대기 시간은 deadline(초)으로 제한되며, 중앙값에서 크게 벗어난 서버를
+    제외한 뒤 RTT가 가장 작은 측정값을 선택합니다. 최근 실패해 백오프 중인
+    서버는 조회하지 않습니다.
+    """
+    servers = list(servers if servers is not None else NTP_SERVERS)
+    deadline = float(deadline if deadline is not None else NTP_DEADLINE_SECONDS)
+    try:
+        import ntplib  # noqa: F401
     except ImportError:
         logging.warning("ntplib 모듈을 찾을 수 없습니다. pip install ntplib로 설치하세요.")
+        return None
+
+    candidates = source_health.available(servers)
+    if not candidates:
+        logging.debug("모든 NTP 서버가 백오프 중이라 조회를 건너뜁니다")
+        return None
+
+    try:
+        samples = query_concurrently(
+            [lambda server=server: _query_ntp_with_health(server, deadline) for server in candidates],
+            deadline,
+        )
+        best = select_best_sample(samples)
+        if best is not None:
+            logging.info(f"NTP 시간 동기화 성공: {best.source} "
+                         f"(응답 {len(samples)}/{len(candidates)}개 서버)")
+        return best
     except Exception as e:
         logging.warning(f"NTP 시간 동기화 실패: {e}")
-    
+
     return None
 
-def get_worldtime_api():
+
+def get_ntp_time():
+    """NTP 서버에서 정확한 시간을 가져옵니다."""
+    sample = get_ntp_sample()
+    if sample is None:
+        return None
+    return datetime.now() + timedelta(seconds=sample.offset)
+
+
+def _fetch_worldtime(url: Optional[str] = None) -> Optional[datetime]:
+    """WorldTimeAPI 응답의 시간을 timezone-aware datetime으로 반환합니다."""
+    # 한국 시간대로 API 요청
+    response = requests.get(url or WORLDTIME_API_URL, timeout=5)
+    if response.status_code != 200:
+        return None
+    data = response.json()
+    # 2025-10-28T15:30:45.123456+09:00 형식
+    time_str = data.get('datetime', '')
+    if not time_str:
+        return None
+    return datetime.fromisoformat(time_str.replace('Z', '+00:00'))
+
+
+def get_worldtime_api(url: Optional[str] = None):
     """WorldTimeAPI를 사용해 정확한 시간을 가져옵니다."""
     try:
-        # 한국 시간대로 API 요청
-        response = requests.get("http://worldtimeapi.org/api/timezone/Asia/Seoul", timeout=5)
-        if response.status_code == 200:
-            data = response.json()
-            # ISO 8601 형식의 시간 파싱
-            time_str = data.get('datetime', '')
-            if time_str:
-                # 2025-10-28T15:30:45.123456+09:00 형식
-                import re
-                # 마이크로초 제거 (파싱 호환성을 위해)
-                time_str = re.sub(r'\.\d+', '', time_str)
-                parsed_time = datetime.fromisoformat(time_str.replace('Z', '+00:00'))
-                logging.info("WorldTimeAPI 시간 동기화 성공")
-                return parsed_time.replace(tzinfo=None)  # naive datetime으로 변환
+        parsed_time = _fetch_worldtime(url)
+        if parsed_time is not None:
+            logging.info("WorldTimeAPI 시간 동기화 성공")
+            # 마이크로초 제거, naive datetime으로 변환
+            return parsed_time.replace(microsecond=0, tzinfo=None)
     except (requests.RequestException, ValueError, KeyError) as e:
         logging.debug(f"WorldTimeAPI 연결 실패: {e}")
     except Exception as e:
         logging.warning(f"WorldTimeAPI 시간 동기화 실패: {e}")
-    
+
+    return None
+
+
+def get_worldtime_sample(url: Optional[str] = None) -> Optional[TimeSample]:
+    """WorldTimeAPI로 로컬 시계 대비 오프셋을 측정합니다 (요청 중간 시점 기준).
+
+    최근 실패해 백오프 중이면 요청하지 않고 None을 반환합니다.
+    """
+    if not source_health.allowed(WORLDTIME_SOURCE_NAME):
+        return None
+    try:
+        t0 = time.time()
+        parsed_time = _fetch_worldtime(url)
+        t1 = time.time()
+        if parsed_time is not None:
+            logging.info("WorldTimeAPI 시간 동기화 성공")
+            source_health.record_success(WORLDTIME_SOURCE_NAME, t1 - t0)
+            return TimeSample(
+                offset=parsed_time.timestamp() - (t0 + t1) / 2.0,
+                delay=t1 - t0,
+                source=WORLDTIME_SOURCE_NAME,
+            )
+    except (requests.RequestException, ValueError, KeyError) as e:
+        logging.debug(f"WorldTimeAPI 연결 실패: {e}")
+    except Exception as e:
+        logging.warning(f"WorldTimeAPI 시간 동기화 실패: {e}")
+
+    source_health.record_failure(WORLDTIME_SOURCE_NAME)
     return None
 
+
+# 전역 시간 동기화 서비스 (NTP 우선, 실패 시 WorldTimeAPI)
+# 테스트에서 patch가 적용되도록 모듈 함수를 호출 시점에 조회합니다.
+time_sync = TimeSyncService([
+    lambda: get_ntp_sample(),
+    lambda: get_worldtime_sample(),
+])
+
+
+TIME_SYNC_STATE_PATH = os.path.join(LOGS_DIR, "time_sync_state.json")
+TIME_SYNC_STATUS_PATH = os.path.join(LOGS_DIR, "time_sync_status.json")
+
+
+def start_time_sync(config: dict) -> TimeSyncService:
+    """설정을 반영해 백그라운드 시간 동기화를 시작합니다.
+
+    처음 시작할 때는 디스크에 저장된 오프셋을 먼저 불러오므로, 첫 NTP 조회가
+    끝나기 전에 만드는 스케줄도 보정된 시간을 사용합니다.
+    """
+    global NTP_SERVERS, NTP_DEADLINE_SECONDS, WORLDTIME_API_URL
+    NTP_SERVERS = list(config.get("ntp_servers") or DEFAULT_CONFIG["ntp_servers"])
+    WORLDTIME_API_URL = str(config.get("worldtime_api_url") or DEFAULT_CONFIG["worldtime_api_url"])
+    NTP_DEADLINE_SECONDS = float(config.get("ntp_deadline_seconds", 3.0))
+    source_health.base_backoff_seconds = float(config.get("time_source_backoff_seconds", 30))
+    source_health.max_backoff_seconds = max(
+        source_health.base_backoff_seconds,
+        float(config.get("time_source_max_backoff_seconds", 1800)),
+    )
+    time_sync.interval_seconds = float(config.get("time_sync_interval_seconds", 600))
+    time_sync.max_interval_seconds = max(
+        time_sync.interval_seconds,
+        float(config.get("time_sync_max_interval_seconds", 21600)),
+    )
+    if not time_sync.running:
+        time_sync.state_path = TIME_SYNC_STATE_PATH
+        time_sync.status_path = TIME_SYNC_STATUS_PATH
+        if not time_sync.synced:
+            max_age_seconds = float(config.get("time_sync_state_max_age_hours", 48)) * 3600
+            stored = _state_store.get("time_sync") if _state_store is not None else None
+            if not (stored and time_sync.restore_state(stored, max_age_seconds)):
+                time_sync.load_state(TIME_SYNC_STATE_PATH, max_age_seconds)
+    time_sync.start()
+    return time_sync
+
+
+def create_async_time_sync_client() -> AsyncTimeSyncClient:
+    """현재 설정(NTP 서버, 마감 시간, 백오프 상태)을 공유하는 asyncio 동기화 클라이언트를 만듭니다.
+
+    이벤트 루프에서 client.run_forever()를 돌릴 때는 스레드 기반 time_sync.start()를
+    함께 쓰지 않아도 되며, 결과는 같은 time_sync 서비스에 기록됩니다.
+    """
+    return AsyncTimeSyncClient(time_sync, NTP_SERVERS, WORLDTIME_API_URL,
+                               deadline=NTP_DEADLINE_SECONDS, health=source_health)
+
+
+def get_time_sync_status() -> dict:
+    """시간 동기화 품질 요약 (오프셋, RTT, 분산, 선택된 서버, 마지막 성공 후 경과 시간 등)
+
+    정밀 발사 모드의 최근 발사 오차도 "firing"에 함께 담습니다.
+    """
+    status = time_sync.status()
+    status["firing"] = firing_jitter.summary()
+    return status
+
+
+def describe_clock_quality() -> str:
+    """종 발사 로그에 남길 한 줄짜리 시계 상태 (늦은 종의 원인 구분용)"""
+    status = time_sync.status()
+    if not status["synced"]:
+        return f"시계 미동기화 (오프셋 {status['offset_ms']:+.1f}ms, 연속 실패 {status['consecutive_failures']}회)"
+    return (f"오프셋 {status['offset_ms']:+.1f}ms, RTT {status['rtt_ms']:.1f}ms, "
+            f"소스 {status['source']}, 마지막 동기화 {status['last_success_age_seconds']:.0f}초 전")
+
+
+# 시뮬레이터가 주입하는 가상 시계와 오디오 출력 (None이면 실제 시계/재생 사용)
+_virtual_clock: Optional[Callable[[], datetime]] = None
+_audio_sink: Optional[Callable[[int, str, Optional[str]], None]] = None
+
+
+def set_virtual_clock(clock: Optional[Callable[[], datetime]]) -> None:
+    """현재 시각 조회를 clock()(시간대 포함 datetime 반환)으로 대체합니다. None이면 해제."""
+    global _virtual_clock
+    _virtual_clock = clock
+
+
+def set_audio_sink(sink: Optional[Callable[[int, str, Optional[str]], None]]) -> None:
+    """재생 대신 sink(인덱스, 사운드 폴더, 파일 경로 또는 None)를 호출합니다. None이면 해제."""
+    global _audio_sink
+    _audio_sink = sink
+
+
+def local_now(zone) -> datetime:
+    """zone 시간대의 현재 로컬 시각 (가상 시계가 있으면 그 시각)"""
+    if _virtual_clock is not None:
+        return _virtual_clock().astimezone(zone)
+    return datetime.now(tz=zone)
+
+
 def get_current_time():
-    """현재 시간을 가져옵니다 (외부 시간 동기화 우선, 실패 시 로컬 시간)."""
-    # 1. NTP 서버 시도
-    ntp_time = get_ntp_time()
-    if ntp_time:
-        return ntp_time
-    
-    # 2. WorldTimeAPI 시도  
-    api_time = get_worldtime_api()
-    if api_time:
-        return api_time
-    
-    # 3. 로컬 시간 사용
-    logging.info("외부 시간 동기화 실패, 로컬 시간 사용")
-    return datetime.now()
+    """현재 시간을 가져옵니다 (로컬 시계 + 드리프트 모델이 예측한 외부 시간 오프셋).
+
+    네트워크 조회는 time_sync 서비스의 백그라운드 스레드에서만 수행되므로
+    GUI 시계나 스케줄 생성 경로가 네트워크 지연으로 멈추지 않습니다.
+    """
+    if _virtual_clock is not None:
+        return _virtual_clock()
+    return time_sync.now()
 
 def get_tz(tz_name: str):
     zone = tz.gettz(tz_name)
@@ -530,28 +970,34 @@ def get_tz(tz_name: str):
 
 
 def hhmm_to_today(hhmm: str, zone) -> datetime:
-    # 콜론이 포함된 시간 형식 처리 (예: "06:00" -> "0600")
-    if ':' in hhmm:
-        hhmm = hhmm.replace(':', '')
-    hour = int(hhmm[:2])
-    minute = int(hhmm[2:])
-    now = datetime.now(tz=zone)
-    return datetime(now.year, now.month, now.day, hour, minute, tzinfo=zone)
+    # "06:00"과 "0600" 형식 모두 처리
+    return at_hhmm(local_now(zone).date(), hhmm, zone)
 
 
 def is_workday(zone) -> bool:
-    w = datetime.now(tz=zone).weekday()
+    w = local_now(zone).weekday()
     return w <= 4
 
 
 def is_sunday(zone) -> bool:
     """일요일인지 확인합니다."""
-    w = datetime.now(tz=zone).weekday()
+    w = local_now(zone).weekday()
     return w == 6  # 월요일=0, 일요일=6
 
 
 def get_schedule_for_today(zone) -> List[Tuple[int, str, str]]:
     """오늘 날짜에 맞는 스케줄을 반환합니다."""
+    calendar = _calendar_file.calendar
+    if calendar is not None:
+        entry = calendar.lookup(local_now(zone).date())
+        if entry is not None:
+            logging.info(f"예외 일정 스케줄을 사용합니다: {entry.description or entry.schedule or '지정 시간표'}")
+            return entry.resolve(WEEKDAY_SCHEDULE, SUNDAY_SCHEDULE)
+    rules = _schedule_rules
+    if rules is not None:
+        rule = rules.rule_for_date(local_now(zone).date())
+        logging.info(f"반복 규칙 스케줄을 사용합니다: {rule.name if rule else '해당 규칙 없음'}")
+        return rule.items if rule else []
     if is_sunday(zone):
         logging.info("일요일 스케줄을 사용합니다")
         return SUNDAY_SCHEDULE
@@ -560,6 +1006,160 @@ def get_schedule_for_today(zone) -> List[Tuple[int, str, str]]:
         return WEEKDAY_SCHEDULE
 
 
+def schedule_for_weekday(weekday: int) -> List[Tuple[int, str, str]]:
+    """요일(월=0 ~ 일=6)에 맞는 스케줄을 반환합니다."""
+    return SUNDAY_SCHEDULE if weekday == 6 else WEEKDAY_SCHEDULE
+
+
+# weekday_schedule_file/sunday_schedule_file (파일이 바뀌었을 때만 다시 파싱)
+_schedule_files = {
+    "weekday_schedule_file": (ScheduleFile(), WEEKDAY_SCHEDULE, BUILTIN_WEEKDAY_SCHEDULE),
+    "sunday_schedule_file": (ScheduleFile(), SUNDAY_SCHEDULE, BUILTIN_SUNDAY_SCHEDULE),
+}
+
+
+def configure_schedule_files(config: dict) -> bool:
+    """설정의 스케줄 파일을 적용하고, 평일/일요일 스케줄이 바뀌었으면 True를 반환합니다.
+
+    WEEKDAY_SCHEDULE/SUNDAY_SCHEDULE 목록을 제자리에서 교체하므로 이 목록을 import한
+    모듈(GUI 등)에도 그대로 반영됩니다.
+    """
+    global _schedule_rules_raw, _parsed_rules
+    changed = False
+    for key, (schedule_file, target, builtin) in _schedule_files.items():
+        path = str(config.get(key) or "")
+        if path and not os.path.isabs(path):
+            path = os.path.join(BASE_DIR, path)
+        compiled, file_changed = schedule_file.get(path)
+        if file_changed:
+            target[:] = compiled.items() if compiled is not None else builtin
+            changed = True
+    if changed:
+        # 반복 규칙의 weekday/sunday 참조도 새 스케줄로 다시 파싱
+        _schedule_rules_raw = None
+        _parsed_rules = (None, [])
+        invalidate_week_index()
+    return changed
+
+
+# 설정의 schedule_rules로 만든 반복 규칙 (없으면 요일별 내장 스케줄 사용)
+_schedule_rules: Optional[ScheduleRuleSet] = None
+_schedule_rules_raw: list = []
+# 마지막으로 파싱한 (유효한 규칙의 원본 목록, 규칙): validate_config가 걸러 낸 목록을
+# configure_schedule_rules가 다시 파싱하지 않고(경고도 두 번 남기지 않고) 그대로 씀
+_parsed_rules: Tuple[Optional[list], List[ScheduleRule]] = (None, [])
+
+
+def _parse_schedule_rules(raw: list) -> List[ScheduleRule]:
+    global _parsed_rules
+    cached_raw, rules = _parsed_rules
+    if raw != cached_raw:
+        rules = parse_schedule_rules(raw, named_schedules(WEEKDAY_SCHEDULE, SUNDAY_SCHEDULE))
+        _parsed_rules = ([rule.source for rule in rules], rules)
+    return rules
+
+
+def configure_schedule_rules(config: dict) -> bool:
+    """설정의 반복 규칙을 적용하고, 규칙이 바뀌었으면 True를 반환합니다.
+
+    규칙 자체만 파싱해 두고 날짜별 펼치기는 타임라인이 필요한 날에만 수행합니다.
+    """
+    global _schedule_rules, _schedule_rules_raw
+    raw = list(config.get("schedule_rules") or [])
+    if raw == _schedule_rules_raw:
+        return False
+    rules = _parse_schedule_rules(raw)
+    _schedule_rules = ScheduleRuleSet(rules) if rules else None
+    _schedule_rules_raw = raw
+    if rules:
+        logging.info(f"반복 규칙 {len(rules)}개 적용: {', '.join(r.name for r in rules)}")
+    invalidate_week_index()
+    return True
+
+
+# holiday_calendar_file로 읽은 공휴일/예외 달력 (파일이 바뀌면 다시 컴파일)
+_calendar_file = CalendarFile()
+
+
+def configure_holiday_calendar(config: dict) -> bool:
+    """설정의 달력 파일을 (바뀌었으면) 다시 읽고, 달력이 바뀌었으면 True를 반환합니다."""
+    path = str(config.get("holiday_calendar_file") or "")
+    if path and not os.path.isabs(path):
+        path = os.path.join(BASE_DIR, path)
+    _, changed = _calendar_file.get(path)
+    if changed:
+        invalidate_week_index()
+    return changed
+
+
+def zone_schedule_for_date(bell_zone: BellZone) -> Callable:
+    """구역의 날짜별 스케줄 함수 (예외 달력의 해당 구역/전체 항목을 먼저 확인)"""
+    def schedule(day) -> List[Tuple[int, str, str]]:
+        calendar = _calendar_file.calendar
+        if calendar is not None:
+            items = calendar.items_for(day, bell_zone.name, bell_zone.weekday_schedule,
+                                       bell_zone.sunday_schedule)
+            if items is not None:
+                return items
+        return bell_zone.schedule_for_date(day)
+    return schedule
+
+
+def schedule_for_date(day) -> List[Tuple[int, str, str]]:
+    """해당 날짜의 스케줄을 반환합니다 (타임라인 컴파일용).
+
+    예외 달력에 있는 날은 그 일정, 반복 규칙이 있으면 그 날 처음 맞는 규칙의 종 목록,
+    둘 다 아니면 요일별 내장 스케줄.
+    """
+    calendar = _calendar_file.calendar
+    if calendar is not None:
+        items = calendar.items_for(day, "", WEEKDAY_SCHEDULE, SUNDAY_SCHEDULE)
+        if items is not None:
+            return items
+    rules = _schedule_rules
+    if rules is not None:
+        return rules.items_for_date(day)
+    return schedule_for_weekday(day.weekday())
+
+
+# 컴파일된 주간 종 인덱스 (스케줄이 바뀌면 invalidate_week_index()로 다시 만듦)
+_week_index: Optional[WeekIndex] = None
+_week_index_week = None
+_week_index_lock = threading.Lock()
+
+
+def get_week_index(day=None, zone=None) -> WeekIndex:
+    """다음/이전 종 조회용 주간 인덱스 (처음 호출할 때 한 번 컴파일)
+
+    반복 규칙이나 예외 달력이 있으면 주마다 스케줄이 달라질 수 있으므로 day(기본은 zone
+    시간대의 오늘)가 속한 주의 날짜로 컴파일하고, 주가 바뀌면 다시 컴파일합니다.
+    zone은 설정의 timezone이어야 호스트 시간대와 달라도 자정 기준이 맞습니다.
+    """
+    global _week_index, _week_index_week
+    dated = _schedule_rules is not None or _calendar_file.calendar is not None
+    monday = None
+    if dated:
+        if day is None:
+            day = local_now(zone).date()
+        monday = day - timedelta(days=day.weekday())
+    with _week_index_lock:
+        if _week_index is None or _week_index_week != monday:
+            if not dated:
+                _week_index = WeekIndex.from_schedule(schedule_for_weekday)
+            else:
+                _week_index = WeekIndex.from_schedule(
+                    lambda weekday: schedule_for_date(monday + timedelta(days=weekday)))
+            _week_index_week = monday
+        return _week_index
+
+
+def invalidate_week_index() -> None:
+    """스케줄이 바뀌었을 때 다음 조회에서 인덱스를 다시 컴파일하도록 비웁니다."""
+    global _week_index
+    with _week_index_lock:
+        _week_index = None
+
+
 def get_sounds_dir(config: dict) -> str:
     """기본 사운드 디렉토리를 반환합니다 (평일용)."""
     custom = config.get("sounds_dir")
@@ -584,6 +1184,15 @@ def get_sounds_dir_for_day(config: dict, zone) -> str:
         return get_sounds_dir(config)
 
 
+def sounds_dir_for_date(config: dict, day) -> str:
+    """해당 날짜에 쓸 사운드 디렉토리 (일요일은 일요일 전용 디렉토리가 있으면 그것)"""
+    if day.weekday() == 6:
+        custom_sunday = config.get("sounds_dir_sunday")
+        if custom_sunday and isinstance(custom_sunday, str) and os.path.isdir(custom_sunday):
+            return custom_sunday
+    return get_sounds_dir(config)
+
+
 def find_existing_sound(index: int, config: dict, zone=None) -> Optional[str]:
     # zone이 없으면 기본 타임존 사용
     if zone is None:
@@ -680,8 +1289,11 @@ def _mci_send(command: str) -> int:
     return int(mciSendStringW(command, buf, 254, None))
 
 
-def _mci_play_blocking(path: str) -> bool:
-    """Play file with MCI in blocking mode. Returns True on success."""
+def _mci_play_blocking(path: str, before_start: Optional[Callable[[], None]] = None) -> bool:
+    """Play file with MCI in blocking mode. Returns True on success.
+
+    before_start는 파일을 연 뒤 재생 직전에 호출됩니다 (정밀 발사 대기용).
+    """
     if not _mci_available():
         return False
     import uuid
@@ -696,6 +1308,8 @@ def _mci_play_blocking(path: str) -> bool:
                 rc = _mci_send(f"open \"{path}\" alias {alias}")
             if rc != 0:
                 return False
+            if before_start is not None:
+                before_start()
 
             # Play (wait blocks until completion)
             rc = _mci_send(f"play {alias} wait")
@@ -733,15 +1347,20 @@ def _mci_stop_all() -> None:
 
 
 
+# 사운드 파일별 재생 길이 캐시 (파일이 바뀌면 다시 측정)
+# 테스트에서 patch가 적용되도록 모듈 함수를 호출 시점에 조회합니다.
+sound_durations = DurationCache(lambda path: probe_duration_seconds(path))
+
+
 def get_sound_duration_seconds(index: int, config: dict, zone=None) -> Optional[float]:
     """Get duration in seconds for the sound mapped to index (01..20)."""
     path = find_existing_sound(index, config, zone)
     if not path:
         return None
-    return probe_duration_seconds(path)
+    return sound_durations.get(path)
 
 
-def try_ffplay(path: str, config: dict) -> bool:
+def try_ffplay(path: str, config: dict, before_start: Optional[Callable[[], None]] = None) -> bool:
     custom = str(config.get("ffplay_path") or "").strip().strip('"')
     cand = []
     if custom:
@@ -756,6 +1375,8 @@ def try_ffplay(path: str, config: dict) -> bool:
         cand.append(portable_ff)
     for ff in cand:
         try:
+            if before_start is not None:
+                before_start()
             # 새로운 리소스 매니저를 사용한 안전한 프로세스 관리
             with resource_manager.managed_process([ff, "-nodisp", "-autoexit", "-loglevel", "error", path]) as proc:
                 proc.wait()
@@ -781,23 +1402,27 @@ def try_ffplay(path: str, config: dict) -> bool:
     return False
 
 
-def play_sound_for_index(index: int, config: dict, zone=None) -> None:
+def play_sound_for_index(index: int, config: dict, zone=None,
+                         before_start: Optional[Callable[[], None]] = None) -> None:
     if zone is None:
         zone = get_tz(config.get("timezone", "Asia/Seoul"))
         
-    logging.info(f"Play start: index={index}")
+    logging.info(f"Play start: index={index} ({describe_clock_quality()})")
     path = find_existing_sound(index, config, zone)
+    if _audio_sink is not None:
+        _audio_sink(index, get_sounds_dir_for_day(config, zone), path)
+        return
     if not path:
         base = get_sounds_dir_for_day(config, zone)
         logging.error(f"Sound file not found for index {index} in {base}")
         return
 
-    _play_sound_from_path(index, path, config)
+    _play_sound_from_path(index, path, config, before_start)
 
 
 def play_sound_for_index_sunday(index: int, config: dict) -> None:
     """일요일 전용 사운드 재생 (항상 일요일 폴더 사용)"""
-    logging.info(f"Play start (Sunday mode): index={index}")
+    logging.info(f"Play start (Sunday mode): index={index} ({describe_clock_quality()})")
     
     # 일요일 폴더에서 직접 찾기
     sunday_dir = config.get("sounds_dir_sunday")
@@ -806,6 +1431,9 @@ def play_sound_for_index_sunday(index: int, config: dict) -> None:
         sunday_dir = get_sounds_dir(config)
     
     path = _find_sound_in_dir(index, sunday_dir, config)
+    if _audio_sink is not None:
+        _audio_sink(index, sunday_dir, path)
+        return
     if not path:
         logging.error(f"Sunday sound file not found for index {index} in {sunday_dir}")
         return
@@ -829,32 +1457,38 @@ def _find_sound_in_dir(index: int, directory: str, config: dict) -> Optional[str
     return None
 
 
-def _play_sound_from_path(index: int, path: str, config: dict) -> None:
-    """공통 사운드 재생 로직"""
+def _play_sound_from_path(index: int, path: str, config: dict,
+                          before_start: Optional[Callable[[], None]] = None) -> None:
+    """공통 사운드 재생 로직 (before_start는 재생 백엔드가 시작하기 직전에 한 번 호출됨)"""
 
+    prep_start = time.monotonic()
     final_path = apply_volume_with_pydub(path, float(config.get("volume", 1.0)))
+    # 재생 시작 전 준비 지연: 시계 오차와 오디오 시작 지연을 구분하기 위해 기록
+    logging.info(f"Audio prepared in {(time.monotonic() - prep_start) * 1000:.0f}ms: index={index}")
 
     # Preferred order: configurable
     prefer_mci = bool(config.get("prefer_mci", False))
     if prefer_mci:
         # MCI → ffplay → playsound
-        if _mci_play_blocking(final_path):
+        if _mci_play_blocking(final_path, before_start):
             logging.info(f"Play done via MCI: index={index}")
             return
-        if try_ffplay(final_path, config):
+        if try_ffplay(final_path, config, before_start):
             logging.info(f"Play done via ffplay: index={index}")
             return
     else:
         # ffplay → MCI → playsound
-        if try_ffplay(final_path, config):
+        if try_ffplay(final_path, config, before_start):
             logging.info(f"Play done via ffplay: index={index}")
             return
-        if _mci_play_blocking(final_path):
+        if _mci_play_blocking(final_path, before_start):
             logging.info(f"Play done via MCI: index={index}")
             return
 
     if playsound_blocking is not None:
         try:
+            if before_start is not None:
+                before_start()
             playsound_blocking(final_path)
             logging.info(f"Play done via playsound: index={index}")
             return
@@ -864,33 +1498,275 @@ def _play_sound_from_path(index: int, path: str, config: dict) -> None:
     logging.error("No available audio backend: provide ffplay (FFmpeg) or use compatible format for MCI.")
 
 
-def schedule_today(sched, config: dict, zone) -> int:
+# 정밀 발사 모드의 최근 발사 오차
+firing_jitter = JitterTracker()
+
+
+def _run_once(func: Callable[[], None]) -> Callable[[], None]:
+    # 재생 백엔드를 차례로 시도해도 대기는 한 번만 하도록 감쌈
+    done = []
+
+    def wrapper() -> None:
+        if not done:
+            done.append(True)
+            func()
+    return wrapper
+
+
+# 구역별 재생 작업자 (zones 설정을 쓸 때 구역마다 스레드 하나)
+zone_dispatcher = ZoneDispatcher()
+
+# state_store_file로 연 SQLite 상태 저장소 (설정하지 않으면 None)
+_state_store: Optional[StateStore] = None
+# 종 상태를 며칠 동안 보관할지
+STATE_KEEP_DAYS = 30
+
+
+def open_state_store(config: dict) -> Optional[StateStore]:
+    """설정의 상태 저장소를 엽니다 (경로가 바뀌었으면 다시 열고, 비어 있으면 닫음)."""
+    global _state_store
+    path = str(config.get("state_store_file") or "")
+    if path and not os.path.isabs(path):
+        path = os.path.join(BASE_DIR, path)
+    if _state_store is not None and _state_store.path == path:
+        return _state_store
+    if _state_store is not None:
+        _state_store.close()
+        _state_store = None
+    if path:
+        try:
+            _state_store = StateStore(path)
+            logging.info(f"상태 저장소 사용: {path}")
+        except (sqlite3.Error, OSError) as e:
+            logging.error(f"상태 저장소를 열 수 없어 사용하지 않습니다 ({path}): {e}")
+    return _state_store
+
+
+def _mark_bell(job_id: str, day, state: str, run_at: Optional[float] = None) -> bool:
+    # 저장소가 없거나 쓰기에 실패하면 재생을 막지 않도록 True
+    store = _state_store
+    if store is None:
+        return True
+    try:
+        return store.mark(job_id, day, state, run_at)
+    except sqlite3.Error as e:
+        logging.warning(f"종 상태 기록 실패 ({job_id}): {e}")
+        return True
+
+
+def fire_bell(index: int, config: dict, zone, target_ts: Optional[float] = None,
+              zone_name: Optional[str] = None, job_id: Optional[str] = None) -> None:
+    """타임라인 종 작업.
+
+    precision_firing이 켜져 있으면 작업은 preroll_seconds 일찍 실행되어 사운드를 준비하고,
+    재생 직전에 target_ts(실제 시간 기준 종 시각)까지 정밀하게 기다린 뒤 오차를 기록합니다.
+    zone_name이 있으면 해당 구역의 작업자 스레드에서 재생합니다. job_id는 타임라인의 작업 id로,
+    재생 상태를 계획한 날짜의 종으로 기록하는 데 씁니다 (없으면 현재 날짜로 만듦).
+    절전 복귀 직후 몰려 실행되는 지난 종은 재생하지 않고 놓친 종 정책에 맡깁니다.
+    """
+    clock_watch.check_resume()
+    if resume_catchup.absorbing():
+        logging.info(f"절전 복귀 직후라 종 {index} 재생을 놓친 종 처리로 넘깁니다")
+        return
+    # 재시작 전에 이미 울린 종(상태 저장소 기록)은 다시 울리지 않음
+    if job_id is not None:
+        day = bell_job_day(job_id)
+    else:
+        day = (datetime.fromtimestamp(target_ts, tz=zone) if target_ts is not None else local_now(zone)).date()
+        job_id = bell_job_id(day, index, zone_name or "")
+    if not _mark_bell(job_id, day, FIRED, target_ts):
+        logging.info(f"이미 재생한 종이라 건너뜁니다: index={index}, 구역={zone_name or '기본'}")
+        return
+    if zone_name:
+        zone_dispatcher.submit(zone_name, play_bell, index, config, zone, target_ts)
+        return
+    play_bell(index, config, zone, target_ts)
+
+
+def play_bell(index: int, config: dict, zone, target_ts: Optional[float] = None) -> None:
+    """종 하나를 재생합니다 (정밀 발사 모드면 target_ts까지 기다린 뒤 시작)."""
+    if target_ts is None or not bool(config.get("precision_firing", False)):
+        play_sound_for_index(index, config, zone)
+        return
+
+    # 대기 중 시계 점프나 오프셋 변화가 있어도 실제 시각에 맞도록 발사 직전에 다시 계산
+    offset = time_sync.predict_offset() if bool(config.get("offset_corrected_firing", True)) else 0.0
+    local_target = target_ts - offset
+
+    def wait_for_bell() -> None:
+        lateness = sleep_until(local_target)
+        firing_jitter.record(lateness)
+        stats = firing_jitter.summary()
+        logging.info(f"Precision fire: index={index}, 오차 {lateness * 1000:+.2f}ms "
+                     f"(최근 {stats['count']}회 p95 {stats['p95_ms']:.2f}ms)")
+
+    play_sound_for_index(index, config, zone, before_start=_run_once(wait_for_bell))
+
+
+# 스케줄러별 롤링 타임라인 (이미 작업으로 등록된 날짜를 기억)
+# (구역 이름 → 타임라인, 기본 구역은 "")
+_timelines: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+# 스케줄러별로 종 작업들이 공유하는 설정 (구역 이름 → 설정)
+_live_configs: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def get_timeline_days(config: dict) -> int:
+    """미리 등록할 날 수 (다음 날 자동 재생을 끄면 오늘만)"""
+    if not bool(config.get("autoplay_next_day", True)):
+        return 1
+    return int(config.get("timeline_days", 7))
+
+
+def get_bell_zones(config: dict) -> List[BellZone]:
+    """설정된 구역 목록 (zones가 없으면 내장 스케줄과 기본 설정을 쓰는 이름 없는 구역 하나)"""
+    zones = parse_zones(config.get("zones"), WEEKDAY_SCHEDULE, SUNDAY_SCHEDULE, BASE_DIR)
+    return zones or [BellZone("", WEEKDAY_SCHEDULE, SUNDAY_SCHEDULE, {})]
+
+
+def _live_config(sched, config: dict, zone_name: str = "") -> dict:
+    """스케줄러의 작업들이 공유하는 설정 dict (제자리 갱신해 작업을 다시 만들지 않음)"""
+    per_zone = _live_configs.get(sched)
+    if per_zone is None:
+        per_zone = _live_configs[sched] = {}
+    live = per_zone.setdefault(zone_name, {})
+    if config is not live:
+        live.clear()
+        live.update(config)
+    return live
+
+
+def _plan_fingerprint(config: dict, bell_zone: BellZone, zone) -> str:
+    """저장된 계획을 그대로 써도 되는지 판단하는 스케줄 입력의 지문"""
+    inputs = (bell_zone.weekday_schedule, bell_zone.sunday_schedule, config.get("schedule_rules"),
+              _calendar_file.signature, str(zone))
+    return hashlib.sha1(repr(inputs).encode("utf-8")).hexdigest()[:16]
+
+
+def _firing_offset(sched, config: dict) -> float:
+    # 오프셋 보정 모드: 실제(외부) 시간 hh:mm에 울리도록 로컬 발사 시각을 오프셋만큼 당기거나 미룸.
+    # 이미 등록된 작업과 같은 오프셋을 써야 이후 재조정이 모든 작업에 똑같이 적용됨
+    if not bool(config.get("offset_corrected_firing", True)):
+        _firing_state.pop(sched, None)
+        return 0.0
+    state = _firing_state.get(sched)
+    if state is None:
+        state = _firing_state[sched] = {"offset": time_sync.predict_offset()}
+    state["tolerance"] = float(config.get("offset_retime_tolerance_seconds", 0.5))
+    return state["offset"]
+
+
+def plan_schedule(sched, config: dict, zone, recompile: bool = False) -> JobPlan:
+    """타임라인에서 원하는 작업 목록을 만들어 현재 작업과의 차이를 계산합니다."""
+    # 계획보다 먼저 현재 작업을 찍어 두어야, 그 사이 실행된 종을 다시 추가하지 않음
+    scheduled = snapshot_jobs(sched)
+
     # 외부 시간 동기화 우선 사용
     now = get_current_time()
     if now.tzinfo is None:
         now = now.replace(tzinfo=zone)
-    count = 0
-    
-    # 오늘 날짜에 맞는 스케줄 선택
-    today_schedule = get_schedule_for_today(zone)
-    schedule_name = "일요일" if is_sunday(zone) else "평일(월~토)"
-    
-    for idx, hhmm, description in today_schedule:
-        run_at = hhmm_to_today(hhmm, zone)
-        if run_at > now:
-            sched.add_job(
-                play_sound_for_index,
-                trigger=DateTrigger(run_date=run_at),
-                args=[idx, config, zone],
-                id=f"bell-{idx}",
-                misfire_grace_time=int(config.get("misfire_grace_seconds", 60)),
-                replace_existing=True,
-            )
-            count += 1
-            logging.info(f"Scheduled [{schedule_name}]: {hhmm} - {description} (index: {idx})")
-    
-    logging.info(f"Scheduled {count} jobs for today ({schedule_name}, remaining only)")
-    return count
+
+    offset = _firing_offset(sched, config)
+    # 정밀 발사 모드는 pre-roll만큼 일찍 깨우고 실제 종 시각을 인자로 넘김
+    # (종 시각이 바뀌면 인자도 바뀌므로 해당 작업은 재조정 대신 교체됨)
+    precision = bool(config.get("precision_firing", False))
+    preroll = float(config.get("preroll_seconds", 2.0)) if precision else 0.0
+    offset += preroll
+
+    # 스케줄 파일, 규칙이나 달력이 바뀌면 이미 컴파일한 날도 다시 계산
+    if configure_schedule_files(config):
+        recompile = True
+    if configure_schedule_rules(config):
+        recompile = True
+    if configure_holiday_calendar(config):
+        recompile = True
+
+    days = get_timeline_days(config)
+    timelines = _timelines.get(sched)
+    if timelines is None:
+        timelines = _timelines[sched] = {}
+    bell_zones = get_bell_zones(config)
+    for name in set(timelines) - {z.name for z in bell_zones}:
+        del timelines[name]  # 설정에서 빠진 구역 (해당 작업은 diff에서 삭제됨)
+
+    store = _state_store
+    # 상태 저장소가 있으면 유예 시간 안에 지난 종 중 아직 울리지 않은 종도 (재시작 직후) 울림.
+    # 없으면 pre-roll 구간에 든 종은 작업이 이미 실행되어 빠졌으므로 다시 추가하지 않음
+    since = now + timedelta(seconds=preroll)
+    states = {}
+    if store is not None:
+        since = now - timedelta(seconds=int(config.get("misfire_grace_seconds", 60)))
+        try:
+            store.prune(now.date(), STATE_KEEP_DAYS)
+            states = store.states_for_day(now.date())
+        except sqlite3.Error as e:
+            logging.warning(f"상태 저장소 조회 실패: {e}")
+
+    desired = []
+    for bell_zone in bell_zones:
+        timeline = timelines.get(bell_zone.name)
+        fingerprint = _plan_fingerprint(config, bell_zone, zone) if store is not None else ""
+        if (timeline is None or recompile or timeline.zone != zone or timeline.horizon_days != days
+                or timeline.store is not store or timeline.fingerprint != fingerprint):
+            # 기본 구역은 예외 달력/반복 규칙/요일별 내장 스케줄(schedule_for_date)을 사용
+            schedule = zone_schedule_for_date(bell_zone) if bell_zone.name else schedule_for_date
+            timeline = timelines[bell_zone.name] = BellTimeline(zone, schedule, days, bell_zone.name,
+                                                                store, fingerprint)
+        timeline.prune(now.date())
+        timeline.extend(now.date())
+
+        if store is not None:
+            # 유예 시간이 지나도록 울리지 않은 오늘 종은 놓친 것으로 기록
+            for entry in timeline.between(now.replace(hour=0, minute=0, second=0, microsecond=0)
+                                          - timedelta(microseconds=1), since):
+                if entry.job_id not in states:
+                    states[entry.job_id] = MISSED
+                    _mark_bell(entry.job_id, now.date(), MISSED, entry.run_at.timestamp())
+
+        live = _live_config(sched, bell_zone.config_for(config), bell_zone.name)
+        for entry in timeline.pending(since):
+            if entry.job_id in states:
+                continue  # 이미 울렸거나 놓친 것으로 처리한 종
+            # 작업 id를 함께 넘겨, 자정 근처에 당겨 울리는 종도 계획한 날짜로 상태를 기록
+            args = (entry.index, live, zone, entry.run_at.timestamp() if precision else None,
+                    bell_zone.name or None, entry.job_id)
+            desired.append(PlannedJob(entry.job_id, entry.run_at - timedelta(seconds=offset), args))
+    return diff_jobs(desired, scheduled)
+
+
+def reconcile_schedule(sched, config: dict, zone=None, recompile: bool = True) -> JobPlan:
+    """새 설정/스케줄과 등록된 작업의 차이만 반영합니다 (바뀐 종만 추가, 삭제, 이동)."""
+    if zone is None:
+        zone = get_tz(config.get("timezone", "Asia/Seoul"))
+    if recompile:
+        invalidate_week_index()
+    plan = plan_schedule(sched, config, zone, recompile=recompile)
+    apply_plan(sched, plan, fire_bell, int(config.get("misfire_grace_seconds", 60)))
+    if plan.changed:
+        logging.info(f"스케줄 변경 반영: {plan.summary()}")
+    return plan
+
+
+def schedule_timeline(sched, config: dict, zone) -> int:
+    """롤링 타임라인에 새로 들어온 날의 종만 작업으로 등록합니다.
+
+    처음 호출하면 오늘부터 timeline_days일치를 등록하고, 이후에는 날짜가 바뀌어
+    새로 들어온 날만 추가하므로 이미 등록된 작업은 건드리지 않습니다.
+    """
+    plan = reconcile_schedule(sched, config, zone, recompile=False)
+
+    per_day = {}
+    for job in plan.add:
+        per_day[job.run_at.date()] = per_day.get(job.run_at.date(), 0) + 1
+    for day, n in sorted(per_day.items()):
+        schedule_name = "일요일" if day.weekday() == 6 else "평일(월~토)"
+        logging.info(f"Scheduled {n} jobs for {day} ({schedule_name})")
+    offset = _firing_state.get(sched, {}).get("offset", 0.0)
+    if offset and plan.add:
+        logging.info(f"로컬 발사 시각에 시간 오프셋 {offset * 1000:+.1f}ms 보정 적용")
+    timelines = _timelines[sched]
+    compiled = max((len(t.days) for t in timelines.values()), default=0)
+    logging.info(f"Timeline extended: {len(plan.add)} new jobs, {compiled} days compiled, {len(timelines)} zone(s)")
+    return len(plan.add)
 
 
 def schedule_test_mode(sched, config: dict, zone) -> None:
@@ -904,7 +1780,8 @@ def schedule_test_mode(sched, config: dict, zone) -> None:
         run_at = base + timedelta(seconds=3 * i)
         sched.add_job(
             play_sound_for_index,
-            trigger=DateTrigger(run_date=run_at),
+            trigger="date",
+            run_date=run_at,
             args=[idx, config, zone],
             id=f"test-bell-{idx}",
             replace_existing=True,
@@ -913,58 +1790,278 @@ def schedule_test_mode(sched, config: dict, zone) -> None:
 
 
 def schedule_next_day_refresh(sched, config: dict, zone) -> None:
+    """다음 refresh_time에 타임라인을 하루 연장하는 작업을 등록합니다.
+
+    기존 작업을 지우거나 스케줄러를 다시 시작하지 않고 새로 들어온 날만 추가하며,
+    실행 후 다음 날의 연장 작업을 다시 등록합니다.
+    """
     try:
         refresh_time_str = str(config.get("refresh_time", "0001")).strip('"')
         hh = int(refresh_time_str[:2])
         mm = int(refresh_time_str[2:])
-        now = datetime.now(tz=zone)
+        now = local_now(zone)
         refresh = datetime(now.year, now.month, now.day, hh, mm, tzinfo=zone)
         if refresh <= now:
             refresh += timedelta(days=1)
     except (ValueError, IndexError) as e:
         logging.warning(f"Invalid refresh_time format, using default 00:01: {e}")
-        now = datetime.now(tz=zone)
+        now = local_now(zone)
         refresh = datetime(now.year, now.month, now.day, 0, 1, tzinfo=zone)
         if refresh <= now:
             refresh += timedelta(days=1)
 
-    def refresh_jobs():
+    def extend_jobs():
         try:
-            logging.info("Refreshing schedule for new day...")
-            sched.remove_all_jobs()
-            start_scheduler(sched, config, background=True)
+            logging.info("Extending bell timeline for new day...")
+            schedule_timeline(sched, config, zone)
         except Exception as e:
-            logging.exception(f"Failed to refresh schedule: {e}")
+            logging.exception(f"Failed to extend schedule: {e}")
+        finally:
+            schedule_next_day_refresh(sched, config, zone)
 
+    # 날짜별 id: 실행 중인 작업을 스케줄러가 정리하는 동안 다음 작업 등록과 겹치지 않게 함
     sched.add_job(
-        refresh_jobs,
-        trigger=DateTrigger(run_date=refresh),
-        id="daily-refresh",
+        extend_jobs,
+        trigger="date",
+        run_date=refresh,
+        id=f"daily-refresh-{refresh:%Y%m%d}",
+        misfire_grace_time=None,  # 절전 등으로 늦어져도 반드시 연장
         replace_existing=True,
     )
-    logging.info(f"Next refresh at {refresh}")
+    logging.info(f"Next timeline extension at {refresh}")
+
+
+# 시계 점프 시 대기 중인 종 작업을 다시 맞출 스케줄러 목록
+_watched_schedulers: "weakref.WeakSet" = weakref.WeakSet()
+# 오프셋 보정 모드인 스케줄러별로 현재 작업에 적용된 오프셋과 재조정 허용 오차
+_firing_state: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+clock_watch = ClockWatch()
 
 
-def start_scheduler(sched: Optional[BackgroundScheduler], config: dict, background: bool = False):
+def shift_pending_jobs(sched, delta_seconds: float) -> int:
+    """대기 중인 종 작업의 실행 시각만 delta_seconds만큼 옮깁니다.
+
+    시계가 점프해도 실제 경과 시간(단조 시계) 기준으로 같은 순간에 울리도록
+    해당 작업만 개별적으로 재등록하며, 다른 작업(daily-refresh 등)은 건드리지 않습니다.
+    """
+    moved = 0
+    for job in sched.get_jobs():
+        if not job.id.startswith(("bell-", "test-bell-")):
+            continue
+        run_at = getattr(job, "next_run_time", None)
+        if run_at is None:
+            continue
+        new_run_at = run_at + timedelta(seconds=delta_seconds)
+        sched.reschedule_job(job.id, trigger="date", run_date=new_run_at)
+        moved += 1
+    return moved
+
+
+def _on_clock_jump(jump_seconds: float) -> None:
+    time_sync.apply_clock_step(jump_seconds)
+    for sched in list(_watched_schedulers):
+        if not getattr(sched, "running", False):
+            continue
+        moved = shift_pending_jobs(sched, jump_seconds)
+        # 시간 동기화 모델도 같은 크기만큼 오프셋을 옮겼으므로 적용 오프셋을 맞춰 둠
+        state = _firing_state.get(sched)
+        if state is not None:
+            state["offset"] -= jump_seconds
+        logging.info(f"시계 점프 {jump_seconds:+.1f}초 보정: 대기 중인 작업 {moved}개 재조정")
+
+
+def retime_for_offset(sched, new_offset: float) -> int:
+    """새로 측정된 오프셋이 허용 오차 이상 바뀌었으면 대기 중인 종 작업을 다시 맞춥니다."""
+    state = _firing_state.get(sched)
+    if state is None:
+        return 0
+    delta = new_offset - state["offset"]
+    if abs(delta) < state["tolerance"]:
+        return 0
+    # 로컬 발사 시각 = 실제 시각 - 오프셋 이므로 오프셋 변화의 반대로 이동
+    moved = shift_pending_jobs(sched, -delta)
+    state["offset"] = new_offset
+    logging.info(f"시간 오프셋 {delta * 1000:+.1f}ms 변화: 대기 중인 작업 {moved}개 재조정")
+    return moved
+
+
+def _on_time_sync(service: TimeSyncService) -> None:
+    store = _state_store
+    if store is not None:
+        state = service.export_state()
+        if state is not None:
+            try:
+                store.put("time_sync", state)
+            except sqlite3.Error as e:
+                logging.warning(f"시간 동기화 상태 저장 실패: {e}")
+    for sched in list(_watched_schedulers):
+        if getattr(sched, "running", False):
+            retime_for_offset(sched, service.predict_offset())
+
+
+def _play_in_order(indexes: List[int], config: dict, zone) -> None:
+    for index in indexes:
+        play_bell(index, config, zone)
+
+
+def catch_up_missed_bells(start_ts: float, end_ts: float) -> int:
+    """절전 구간(start_ts ~ end_ts)에 놓친 종을 정책대로 재생하고 재생한 종 수를 반환합니다.
+
+    구역마다 놓친 종을 한 번에 모아 고르고, 고른 종은 구역별로 하나씩 순서대로 재생하므로
+    겹쳐 재생되지 않습니다. 지난 날의 종은 다시 울리지 않습니다.
+    """
+    played = 0
+    for sched in list(_watched_schedulers):
+        timelines = _timelines.get(sched) or {}
+        configs = _live_configs.get(sched) or {}
+        for zone_name, timeline in list(timelines.items()):
+            end = datetime.fromtimestamp(end_ts, tz=timeline.zone)
+            start = max(datetime.fromtimestamp(start_ts, tz=timeline.zone),
+                        end.replace(hour=0, minute=0, second=0, microsecond=0))
+            states = {}
+            if _state_store is not None:
+                try:
+                    states = _state_store.states_for_day(end.date())
+                except sqlite3.Error as e:
+                    logging.warning(f"상태 저장소 조회 실패: {e}")
+            missed = [e for e in timeline.between(start, end) if states.get(e.job_id) != FIRED]
+            chosen = coalesce_missed(missed, resume_catchup.policy,
+                                     resume_catchup.replay_window_seconds, end_ts)
+            chosen_ids = {e.job_id for e in chosen}
+            for entry in missed:
+                state = FIRED if entry.job_id in chosen_ids else MISSED
+                _mark_bell(entry.job_id, end.date(), state, entry.run_at.timestamp())
+            logging.info(f"절전 복귀: 구역 {zone_name or '기본'}에서 놓친 종 {len(missed)}개 중 "
+                         f"{len(chosen)}개 재생 (정책 {resume_catchup.policy})")
+            if not chosen:
+                continue
+            config = configs.get(zone_name, {})
+            if zone_name:
+                for entry in chosen:
+                    zone_dispatcher.submit(zone_name, play_bell, entry.index, config, timeline.zone)
+            else:
+                threading.Thread(target=_play_in_order, args=([e.index for e in chosen], config, timeline.zone),
+                                 name="resume-catchup", daemon=True).start()
+            played += len(chosen)
+    return played
+
+
+# 절전 복귀 직후의 지난 종 작업을 흡수했다가 한 번에 처리
+resume_catchup = ResumeCatchUp(catch_up_missed_bells)
+
+
+def _on_resume(gap_seconds: float) -> None:
+    resume_catchup.begin(gap_seconds)
+
+
+clock_watch.add_listener(_on_clock_jump)
+clock_watch.add_resume_listener(_on_resume)
+time_sync.add_listener(_on_time_sync)
+
+
+def start_clock_watch(config: dict) -> ClockWatch:
+    """설정을 반영해 시계 점프와 절전 복귀 감지를 시작합니다."""
+    clock_watch.threshold_seconds = float(config.get("clock_jump_threshold_seconds", 2.0))
+    clock_watch.resume_threshold_seconds = float(config.get("resume_threshold_seconds", 10.0))
+    resume_catchup.policy = str(config.get("resume_catchup_policy", "latest"))
+    resume_catchup.replay_window_seconds = float(config.get("resume_replay_window_seconds", 300))
+    clock_watch.start()
+    return clock_watch
+
+
+def create_scheduler(config: dict, zone, background: bool = False):
+    """설정된 엔진(scheduler_engine)으로 스케줄러를 만듭니다.
+
+    heap/wheel 엔진은 타이머 스레드 하나로 동작하며 APScheduler를 import하지 않습니다.
+    wheel은 수십만 개 이상의 작업(많은 구역 × 긴 타임라인)을 등록할 때 사용합니다.
+    """
+    engine = str(config.get("scheduler_engine", "apscheduler")).lower()
+    if engine == "heap":
+        return HeapScheduler(timezone=zone, blocking=not background)
+    if engine == "wheel":
+        return TimerWheelScheduler(timezone=zone, blocking=not background)
+    if background:
+        from apscheduler.schedulers.background import BackgroundScheduler
+        return BackgroundScheduler(timezone=zone)
+    from apscheduler.schedulers.blocking import BlockingScheduler
+    return BlockingScheduler(timezone=zone)
+
+
+def validate_schedule(config: dict, zone=None, days: int = 7) -> List[ScheduleIssue]:
+    """앞으로 days일 동안 모든 구역의 종 재생 겹침과 누락된 사운드 파일을 찾습니다."""
+    if zone is None:
+        zone = get_tz(config.get("timezone", "Asia/Seoul"))
+    configure_schedule_files(config)
+    configure_schedule_rules(config)
+    configure_holiday_calendar(config)
+    today = local_now(zone).date()
+    sounds = []
+    for bell_zone in get_bell_zones(config):
+        zone_config = bell_zone.config_for(config)
+        schedule = zone_schedule_for_date(bell_zone) if bell_zone.name else schedule_for_date
+        for offset in range(days):
+            day = today + timedelta(days=offset)
+            directory = sounds_dir_for_date(zone_config, day)
+            sounds.extend(plan_day(day, schedule(day), zone,
+                                   lambda idx: _find_sound_in_dir(idx, directory, zone_config),
+                                   sound_durations.get, bell_zone.name))
+    return validate_plan(sounds)
+
+
+def check_schedule(config: dict, zone=None,
+                   on_done: Optional[Callable[[List[ScheduleIssue]], None]] = None) -> threading.Thread:
+    """스케줄 검사를 백그라운드에서 실행하고 문제를 로그로 남깁니다 (사운드 길이 측정이 느릴 수 있음)."""
+    def _run() -> None:
+        try:
+            issues = validate_schedule(config, zone)
+        except Exception as e:
+            logging.exception(f"스케줄 검사 중 오류: {e}")
+            return
+        if issues:
+            log_issues(issues)
+        else:
+            logging.info("스케줄 검사: 재생 겹침이나 누락된 사운드 파일 없음")
+        if on_done is not None:
+            on_done(issues)
+
+    thread = threading.Thread(target=_run, name="schedule-check", daemon=True)
+    thread.start()
+    return thread
+
+
+def start_scheduler(sched, config: dict, background: bool = False):
     zone = get_tz(config.get("timezone", "Asia/Seoul"))
 
+    open_state_store(config)
+    start_time_sync(config)
+
     if sched is None:
-        sched = BackgroundScheduler(timezone=zone) if background else BlockingScheduler(timezone=zone)
+        sched = create_scheduler(config, zone, background)
 
     if bool(config.get("test_mode", False)):
         schedule_test_mode(sched, config, zone)
     else:
-        schedule_today(sched, config, zone)
+        schedule_timeline(sched, config, zone)
         if bool(config.get("autoplay_next_day", True)):
             schedule_next_day_refresh(sched, config, zone)
+        check_schedule(config, zone)
 
+    _watched_schedulers.add(sched)
+    start_clock_watch(config)
     sched.start()
     return sched
 
 
 def stop_scheduler(sched) -> None:
+    if sched is not None:
+        _watched_schedulers.discard(sched)
+        _firing_state.pop(sched, None)
+        _timelines.pop(sched, None)
+        _live_configs.pop(sched, None)
     if sched and getattr(sched, "running", False):
         sched.shutdown(wait=False)
+    # 아직 재생을 시작하지 않은 구역별 종은 버림
+    zone_dispatcher.clear()
     # Ensure any lingering playback is stopped when scheduler stops
     stop_all_playback()
 
@@ -974,10 +2071,9 @@ def main(start_scheduler_flag: bool = True) -> None:
     setup_logging(os.path.join(BASE_DIR, config.get("log_file", "logs/bell.log")))
 
     if start_scheduler_flag:
-        sched = start_scheduler(None, config, background=False)
+        # 블로킹 스케줄러는 종료될 때까지 start_scheduler 안에서 실행됨
         try:
-            if isinstance(sched, BlockingScheduler):
-                pass
+            start_scheduler(None, config, background=False)
         except (KeyboardInterrupt, SystemExit):
             logging.info("Shutting down...")
 
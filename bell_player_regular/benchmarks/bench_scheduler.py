@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+스케줄러 엔진 벤치마크 (APScheduler vs 내장 heap 엔진)
+
+엔진별로 import 시간, 스케줄러 생성 + 작업 등록 후 메모리 증가량, 발사 정밀도
+(예정 시각 대비 실제 실행 지연)를 측정합니다. import 시간과 메모리는 새 프로세스에서
+측정하므로 서로 영향을 주지 않습니다.
+
+    python benchmarks/bench_scheduler.py [--jobs 20] [--spacing 0.05] [--runs 5]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+# 새 프로세스에서 실행할 측정 코드: import 시간, tracemalloc 메모리, 발사 지연
+PROBE = r"""
+import json, sys, threading, time, tracemalloc
+sys.path.insert(0, {base!r})
+engine, jobs, spacing = {engine!r}, {jobs}, {spacing}
+
+tracemalloc.start()
+t0 = time.perf_counter()
+if engine == "heap":
+    from heap_scheduler import HeapScheduler
+    sched = HeapScheduler()
+else:
+    from apscheduler.schedulers.background import BackgroundScheduler
+    sched = BackgroundScheduler()
+import_ms = (time.perf_counter() - t0) * 1000
+
+from datetime import datetime, timedelta
+lateness, done = [], threading.Event()
+
+def fire(expected):
+    lateness.append(time.time() - expected)
+    if len(lateness) == jobs:
+        done.set()
+
+sched.start()
+start = datetime.now().astimezone() + timedelta(seconds=0.3)
+for i in range(jobs):
+    run_at = start + timedelta(seconds=i * spacing)
+    sched.add_job(fire, "date", run_date=run_at, args=[run_at.timestamp()], id=f"bell-{{i}}")
+memory_kb = tracemalloc.get_traced_memory()[0] / 1024
+threads = threading.active_count()
+done.wait(30)
+sched.shutdown(wait=False)
+print(json.dumps({{"import_ms": import_ms, "memory_kb": memory_kb, "threads": threads,
+                  "lateness": lateness}}))
+"""
+
+
+def run_probe(engine: str, jobs: int, spacing: float) -> dict:
+    code = PROBE.format(base=str(BASE_DIR), engine=engine, jobs=jobs, spacing=spacing)
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=120)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def _percentile(values, pct):
+    ordered = sorted(values)
+    k = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[k]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스케줄러 엔진 벤치마크")
+    parser.add_argument("--jobs", type=int, default=20, help="실행당 등록할 일회성 작업 수")
+    parser.add_argument("--spacing", type=float, default=0.05, help="작업 간격(초)")
+    parser.add_argument("--runs", type=int, default=5, help="엔진별 반복 횟수 (새 프로세스)")
+    args = parser.parse_args()
+
+    print("⏱️  스케줄러 엔진 벤치마크")
+    print("=" * 70)
+    for engine in ("apscheduler", "heap"):
+        imports, memory, threads, lateness = [], [], [], []
+        for _ in range(args.runs):
+            probe = run_probe(engine, args.jobs, args.spacing)
+            imports.append(probe["import_ms"])
+            memory.append(probe["memory_kb"])
+            threads.append(probe["threads"])
+            lateness.extend(probe["lateness"])
+        late_ms = [x * 1000 for x in lateness]
+        print(f"\n[{engine}]")
+        print(f"  import+생성  중앙 {statistics.median(imports):7.1f}ms")
+        print(f"  메모리 증가  중앙 {statistics.median(memory):7.0f}KB   스레드 {max(threads)}개")
+        print(f"  발사 지연    p50 {_percentile(late_ms, 50):6.2f}ms  p95 {_percentile(late_ms, 95):6.2f}ms  "
+              f"최대 {max(late_ms):6.2f}ms  ({len(late_ms)}/{args.jobs * args.runs} 실행)")
+
+
+if __name__ == "__main__":
+    main()
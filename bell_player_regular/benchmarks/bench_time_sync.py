@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+시간 동기화 벤치마크
+
+로컬 가짜 NTP/WorldTimeAPI 서버(tests/fake_time_servers.py)를 지연, 지터, 오프셋,
+누락 비율별로 띄워 get_ntp_sample, get_worldtime_api, get_current_time의 지연시간과
+정확도(측정 오프셋 오차)를 측정합니다. 인터넷 연결이 필요 없습니다.
+
+    python benchmarks/bench_time_sync.py [--iterations 20]
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+sys.path.insert(0, str(BASE_DIR / "tests"))
+
+import app  # noqa: E402
+from fake_time_servers import FakeNTPServer, FakeWorldTimeServer  # noqa: E402
+from time_sync import TimeSyncService  # noqa: E402
+
+# (이름, 지연, 지터, 오프셋, 누락 비율)
+SCENARIOS = [
+    ("이상적", 0.001, 0.0, 0.5, 0.0),
+    ("LAN", 0.005, 0.002, 0.5, 0.0),
+    ("WAN", 0.080, 0.030, -1.2, 0.0),
+    ("불안정", 0.150, 0.100, 2.0, 0.3),
+    ("오프라인", 0.0, 0.0, 0.0, 1.0),
+]
+
+
+def _percentile(values, pct):
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    k = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[k]
+
+
+def _summary(latencies, errors, total):
+    ok = len(errors)
+    return (
+        f"p50 {_percentile(latencies, 50) * 1000:7.1f}ms  "
+        f"p95 {_percentile(latencies, 95) * 1000:7.1f}ms  "
+        f"오차중앙 {statistics.median(errors) * 1000 if errors else float('nan'):6.2f}ms  "
+        f"성공 {ok}/{total}"
+    )
+
+
+def bench_ntp(delay, jitter, offset, drop, iterations, deadline):
+    latencies, errors = [], []
+    servers = [FakeNTPServer(offset=offset, delay=delay, jitter=jitter, drop_rate=drop, seed=i)
+               for i in range(4)]
+    for s in servers:
+        s.start()
+    try:
+        addresses = [s.address for s in servers]
+        for _ in range(iterations):
+            app.source_health.reset()  # 백오프 없이 매번 실제 조회 비용을 측정
+            t0 = time.perf_counter()
+            sample = app.get_ntp_sample(addresses, deadline=deadline)
+            latencies.append(time.perf_counter() - t0)
+            if sample is not None:
+                errors.append(abs(sample.offset - offset))
+    finally:
+        for s in servers:
+            s.stop()
+    return _summary(latencies, errors, iterations)
+
+
+def bench_worldtime(delay, jitter, offset, drop, iterations):
+    latencies, errors = [], []
+    with FakeWorldTimeServer(offset=offset, delay=delay, jitter=jitter, drop_rate=drop, seed=0) as api:
+        for _ in range(iterations):
+            app.source_health.reset()
+            t0 = time.perf_counter()
+            sample = app.get_worldtime_sample(api.url)
+            latencies.append(time.perf_counter() - t0)
+            if sample is not None:
+                errors.append(abs(sample.offset - offset))
+        # 기존 API(초 단위 naive datetime)도 지연시간만 측정
+        t0 = time.perf_counter()
+        app.get_worldtime_api(api.url)
+        legacy = time.perf_counter() - t0
+    return _summary(latencies, errors, iterations) + f"  (get_worldtime_api {legacy * 1000:.1f}ms)"
+
+
+def bench_current_time(delay, jitter, offset, drop, calls, deadline):
+    """동기화 후 get_current_time 핫패스 비용과 정확도"""
+    with FakeNTPServer(offset=offset, delay=delay, jitter=jitter, drop_rate=drop, seed=1) as ntp:
+        app.source_health.reset()
+        service = TimeSyncService([lambda: app.get_ntp_sample([ntp.address], deadline=deadline)])
+        synced = service.sync_once()
+    original = app.time_sync
+    app.time_sync = service
+    try:
+        t0 = time.perf_counter()
+        for _ in range(calls):
+            app.get_current_time()
+        per_call = (time.perf_counter() - t0) / calls
+        error = abs(service.predict_offset() - offset) if synced else float("nan")
+    finally:
+        app.time_sync = original
+    return f"호출당 {per_call * 1e6:6.2f}µs  오차 {error * 1000:6.2f}ms  동기화 {'성공' if synced else '실패'}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="시간 동기화 벤치마크")
+    parser.add_argument("--iterations", type=int, default=20, help="시나리오별 조회 횟수")
+    parser.add_argument("--calls", type=int, default=100000, help="get_current_time 호출 횟수")
+    parser.add_argument("--deadline", type=float, default=0.5, help="NTP 전체 마감 시간(초)")
+    args = parser.parse_args()
+
+    os.chdir(BASE_DIR)
+    logging.basicConfig(level=logging.ERROR)
+    print("⏱️  시간 동기화 벤치마크")
+    print("=" * 70)
+    for name, delay, jitter, offset, drop in SCENARIOS:
+        print(f"\n[{name}] 지연 {delay * 1000:.0f}ms, 지터 ±{jitter * 1000:.0f}ms, "
+              f"오프셋 {offset:+.1f}s, 누락 {drop:.0%}")
+        print(f"  get_ntp_sample      {bench_ntp(delay, jitter, offset, drop, args.iterations, args.deadline)}")
+        print(f"  get_worldtime       {bench_worldtime(delay, jitter, offset, drop, args.iterations)}")
+        print(f"  get_current_time    {bench_current_time(delay, jitter, offset, drop, args.calls, args.deadline)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+대량 작업 벤치마크 (내장 heap 엔진 vs 계층형 타이머 휠)
+
+작업 수(기본 1만/10만/100만)마다 새 프로세스에서 같은 계획(구역 × 날 × 종을 흉내 낸
+30일에 걸친 일회성 작업)을 등록하고 다음을 측정합니다.
+
+- 등록: heap은 add_job 반복, wheel은 add_jobs 일괄 등록 (작업당 µs)
+- 메모리: 등록된 작업과 자료구조가 차지하는 tracemalloc 증가량 (작업당 바이트)
+- 취소: 10% 작업 remove_job (작업당 µs)
+- 발사: 시간을 끝까지 진행하며 만료 작업을 꺼내는 비용 (작업당 µs)
+
+    python benchmarks/bench_timer_wheel.py [--counts 10000 100000 1000000] [--days 30]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+PROBE = r"""
+import gc, json, random, sys, time, tracemalloc
+sys.path.insert(0, {base!r})
+from datetime import datetime, timedelta
+from heap_scheduler import HeapScheduler
+from job_planner import PlannedJob
+from timer_wheel import TimerWheelScheduler
+engine, count, days = {engine!r}, {count}, {days}
+
+def noop(*args):
+    pass
+
+rng = random.Random(1)
+base = datetime.now().astimezone() + timedelta(hours=1)
+span = days * 86400
+planned = [PlannedJob(f"bell-z{{i % 64}}-{{i}}", base + timedelta(seconds=rng.uniform(0, span)), (i,))
+           for i in range(count)]
+
+def make():
+    return TimerWheelScheduler() if engine == "wheel" else HeapScheduler()
+
+def insert(sched):
+    if engine == "wheel":
+        sched.add_jobs(noop, planned, misfire_grace_time=60)
+    else:
+        for job in planned:
+            sched.add_job(noop, "date", run_date=job.run_at, args=job.args, id=job.job_id,
+                          misfire_grace_time=60, replace_existing=True)
+
+gc.collect()
+sched = make()
+t0 = time.perf_counter()
+insert(sched)
+insert_s = time.perf_counter() - t0
+
+victims = [job.job_id for job in planned[::10]]
+t0 = time.perf_counter()
+for job_id in victims:
+    sched.remove_job(job_id)
+cancel_s = time.perf_counter() - t0
+
+end = base + timedelta(seconds=span + 1)
+t0 = time.perf_counter()
+if engine == "wheel":
+    fired = len(sched._advance(sched._tick_of(end.timestamp())))
+else:
+    fired = len(sched._pop_due(end.timestamp())[0])
+fire_s = time.perf_counter() - t0
+
+del sched
+gc.collect()
+tracemalloc.start()
+before = tracemalloc.get_traced_memory()[0]
+sched = make()
+insert(sched)
+memory = tracemalloc.get_traced_memory()[0] - before
+tracemalloc.stop()
+
+print(json.dumps({{"insert_s": insert_s, "cancel_s": cancel_s, "cancelled": len(victims),
+                  "fire_s": fire_s, "fired": fired, "memory": memory}}))
+"""
+
+
+def run_probe(engine: str, count: int, days: int) -> dict:
+    code = PROBE.format(base=str(BASE_DIR), engine=engine, count=count, days=days)
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=1800)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="대량 작업 스케줄러 벤치마크")
+    parser.add_argument("--counts", type=int, nargs="+", default=[10_000, 100_000, 1_000_000],
+                        help="등록할 작업 수 목록")
+    parser.add_argument("--days", type=int, default=30, help="작업이 퍼져 있는 일수")
+    args = parser.parse_args()
+
+    print("⏱️  대량 작업 벤치마크 (heap vs wheel)")
+    print("=" * 78)
+    print(f"{'작업 수':>10} {'엔진':>6} {'등록':>12} {'취소':>12} {'발사':>12} {'메모리':>16}")
+    for count in args.counts:
+        for engine in ("heap", "wheel"):
+            r = run_probe(engine, count, args.days)
+            print(f"{count:>10,} {engine:>6} "
+                  f"{r['insert_s'] / count * 1e6:8.2f}µs/개 "
+                  f"{r['cancel_s'] / r['cancelled'] * 1e6:8.2f}µs/개 "
+                  f"{r['fire_s'] / max(1, r['fired']) * 1e6:8.2f}µs/개 "
+                  f"{r['memory'] / 2 ** 20:7.1f}MB ({r['memory'] / count:4.0f}B/개)")
+
+
+if __name__ == "__main__":
+    main()
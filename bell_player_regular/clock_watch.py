@@ -0,0 +1,160 @@
+"""
+시스템 시계 점프 감지
+
+벽시계(time.time)와 단조 시계의 차이를 주기적으로 비교해, Windows 시간 동기화나
+사용자 조작으로 시스템 시계가 임계값 이상 움직이면 등록된 리스너에 알립니다.
+비교 한 번은 시계 두 번 읽는 비용뿐이라 짧은 주기로 돌려도 부담이 없습니다.
+
+resume_threshold_seconds를 지정하면 절전 복귀도 감지합니다. 감시 스레드가 예정보다
+임계값 이상 늦게 깨어났거나(늦은 깨어남), 절전 시간을 포함하는 시계와 포함하지 않는
+단조 시계(Linux의 time.monotonic)의 차이가 벌어지면 복귀 리스너에 절전 시간을 알립니다.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Callable, List, Optional
+
+
+# 절전(suspend) 시간을 포함하는 단조 시계 (초).
+# Windows의 time.monotonic()은 절전 시간을 포함하지만 Linux는 포함하지 않으므로
+# 가능하면 CLOCK_BOOTTIME을 사용합니다. 덕분에 절전/복귀가 시계 점프로 오인되지 않습니다.
+if hasattr(time, "CLOCK_BOOTTIME"):
+    def steady_clock() -> float:
+        return time.clock_gettime(time.CLOCK_BOOTTIME)
+else:
+    steady_clock = time.monotonic
+
+
+ClockJumpListener = Callable[[float], None]
+ResumeListener = Callable[[float], None]
+
+
+class ClockWatch:
+    """벽시계 점프를 감지해 리스너에 점프 크기(초, 앞으로 가면 양수)를 전달합니다."""
+
+    def __init__(self, threshold_seconds: float = 2.0, interval_seconds: float = 1.0,
+                 wall_clock: Callable[[], float] = time.time,
+                 steady: Callable[[], float] = steady_clock,
+                 resume_threshold_seconds: Optional[float] = None,
+                 awake_clock: Callable[[], float] = time.monotonic):
+        self.threshold_seconds = float(threshold_seconds)
+        self.interval_seconds = float(interval_seconds)
+        self.resume_threshold_seconds = resume_threshold_seconds
+        self._wall_clock = wall_clock
+        self._steady = steady
+        self._awake = awake_clock
+        self._listeners: List[ClockJumpListener] = []
+        self._resume_listeners: List[ResumeListener] = []
+        self._baseline = self._wall_clock() - self._steady()
+        self._last_steady = self._steady()
+        self._last_awake = self._awake()
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def add_listener(self, listener: ClockJumpListener) -> None:
+        with self._lock:
+            if listener not in self._listeners:
+                self._listeners.append(listener)
+
+    def remove_listener(self, listener: ClockJumpListener) -> None:
+        with self._lock:
+            try:
+                self._listeners.remove(listener)
+            except ValueError:
+                pass
+
+    def add_resume_listener(self, listener: ResumeListener) -> None:
+        with self._lock:
+            if listener not in self._resume_listeners:
+                self._resume_listeners.append(listener)
+
+    def remove_resume_listener(self, listener: ResumeListener) -> None:
+        with self._lock:
+            try:
+                self._resume_listeners.remove(listener)
+            except ValueError:
+                pass
+
+    def check_resume(self, interval: Optional[float] = None) -> float:
+        """직전 확인 이후 절전에서 복귀했으면 절전 시간(초)을 반환합니다 (아니면 0).
+
+        interval은 직전 확인 이후 예정된 대기 시간이며, 생략하면 감시 스레드가 돌고 있을
+        때만 interval_seconds를 사용합니다 (스레드가 없으면 늦은 깨어남은 판단하지 않음).
+        감시 스레드 외에 종 작업에서도 호출할 수 있으며, 복귀 한 번은 한 번만 알립니다.
+        """
+        if self.resume_threshold_seconds is None:
+            return 0.0
+        if interval is None and self.running:
+            interval = self.interval_seconds
+        with self._lock:
+            steady, awake = self._steady(), self._awake()
+            elapsed = steady - self._last_steady
+            # 늦은 깨어남: 예정된 대기보다 늦어진 만큼
+            late = elapsed - interval if interval is not None else 0.0
+            # 절전 시간을 포함하는 시계만 흘렀으면 그만큼 절전 (Windows에서는 항상 0)
+            asleep = elapsed - (awake - self._last_awake)
+            self._last_steady, self._last_awake = steady, awake
+            gap = max(late, asleep)
+            if gap < self.resume_threshold_seconds:
+                return 0.0
+            listeners = list(self._resume_listeners)
+
+        logging.warning(f"절전 복귀 감지: 약 {gap:.1f}초 동안 멈춤")
+        for listener in listeners:
+            try:
+                listener(gap)
+            except Exception as e:
+                logging.exception(f"절전 복귀 처리 중 오류: {e}")
+        return gap
+
+    def check(self) -> float:
+        """직전 확인 이후의 시계 점프 크기를 반환합니다 (임계값 미만이면 0).
+
+        임계값 미만의 변화는 기준값에 흡수하므로 NTP 슬루 같은 완만한 보정은
+        누적되어 점프로 오인되지 않습니다.
+        """
+        diff = self._wall_clock() - self._steady()
+        jump = diff - self._baseline
+        self._baseline = diff
+        if abs(jump) < self.threshold_seconds:
+            return 0.0
+
+        logging.warning(f"시스템 시계 점프 감지: {jump:+.3f}초")
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(jump)
+            except Exception as e:
+                logging.exception(f"시계 점프 처리 중 오류: {e}")
+        return jump
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._baseline = self._wall_clock() - self._steady()
+        with self._lock:
+            self._last_steady, self._last_awake = self._steady(), self._awake()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="clock-watch", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=2.0)
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval_seconds):
+            self.check()
+            self.check_resume(self.interval_seconds)
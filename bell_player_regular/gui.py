@@ -19,11 +19,17 @@ from app import (
     play_sound_for_index_sunday,
     get_sound_duration_seconds,
     REGULAR_SCHEDULE,
-    WEEKDAY_SCHEDULE,
     SUNDAY_SCHEDULE,
     get_schedule_for_today,
     is_sunday,
     get_tz,
+    local_now,
+    start_time_sync,
+    get_time_sync_status,
+    reconcile_schedule,
+    get_week_index,
+    invalidate_week_index,
+    check_schedule,
 )
 import yaml
 
@@ -35,6 +41,8 @@ class BellRegularGUI:
         self.sched = None
         self.config = load_config(CONFIG_YAML)
         setup_logging(os.path.join(os.path.dirname(CONFIG_YAML), self.config.get("log_file", "logs/bell.log")))
+        # 외부 시간 오프셋은 백그라운드에서 측정 (시계 갱신 시 네트워크 대기 없음)
+        start_time_sync(self.config)
 
         self.var_sounds = tk.StringVar(value=self.config.get("sounds_dir") or "")
         self.var_sounds_sunday = tk.StringVar(value=self.config.get("sounds_dir_sunday") or "")
@@ -45,6 +53,7 @@ class BellRegularGUI:
         # 메인 화면 시계 관련 변수
         self.main_clock_label = None
         self.main_date_label = None
+        self.next_bell_label = None
         self.clock_update_job = None
         self.use_naver_time = tk.BooleanVar(value=False)
 
@@ -100,6 +109,12 @@ class BellRegularGUI:
                                        fg="#333333", bg="#f0f8ff")
         self.main_date_label.pack(side="left", padx=10, pady=5)
 
+        # 다음 종 표시
+        self.next_bell_label = tk.Label(clock_frame, text="다음 종 --:--",
+                                        font=("맑은 고딕", 10),
+                                        fg="#555555", bg="#f0f8ff")
+        self.next_bell_label.pack(side="left", padx=10, pady=5)
+
         # 외부 시간 동기화 컨트롤
         sync_frame = tk.Frame(clock_frame, bg="#f0f8ff")
         sync_frame.pack(side="right", padx=10, pady=5)
@@ -312,13 +327,10 @@ class BellRegularGUI:
         try:
             zone = get_tz(self.config.get("timezone", "Asia/Seoul"))
             
-            # 현재 요일에 맞는 스케줄 선택
-            if is_sunday(zone):
-                self.current_schedule = SUNDAY_SCHEDULE
-                schedule_name = "일요일 스케줄"
-            else:
-                self.current_schedule = WEEKDAY_SCHEDULE
-                schedule_name = "평일 스케줄 (월~토)"
+            # 현재 요일에 맞는 스케줄 선택 (주간 인덱스에서 오늘 요일 구간만 잘라 씀)
+            today = local_now(zone).date()
+            self.current_schedule = get_week_index(today, zone).items_for_weekday(today.weekday())
+            schedule_name = "일요일 스케줄" if today.weekday() == 6 else "평일 스케줄 (월~토)"
             
             # 라벨 업데이트
             self.index_labels = [
@@ -439,6 +451,7 @@ class BellRegularGUI:
     def refresh_schedule(self):
         """현재 요일에 맞게 스케줄을 새로고침합니다."""
         try:
+            invalidate_week_index()
             self.update_schedule_display()
             self.create_schedule_checkboxes()
             self.refresh_durations()
@@ -448,9 +461,17 @@ class BellRegularGUI:
                 self.var_status.set("일요일 스케줄로 업데이트됨")
             else:
                 self.var_status.set("평일 스케줄로 업데이트됨 (월~토)")
+            self.apply_schedule_changes()
+            check_schedule(self.config, zone, on_done=self._on_schedule_checked)
         except Exception as e:
             self.var_status.set(f"스케줄 새로고침 오류: {e}")
 
+    def _on_schedule_checked(self, issues):
+        """스케줄 검사 결과를 상태 표시줄에 알림 (검사 스레드에서 호출됨)"""
+        if issues:
+            first = issues[0].message
+            self.root.after(0, lambda: self.var_status.set(f"스케줄 검사: 문제 {len(issues)}건 - {first}"))
+
     # ---------- Menu & basic actions ----------
     def on_exit(self):
         try:
@@ -520,7 +541,8 @@ class BellRegularGUI:
     def start(self):
         self.save_config()
         if self.sched is not None and getattr(self.sched, "running", False):
-            self.var_status.set("이미 실행 중")
+            # 실행 중이면 바뀐 종만 반영
+            self.apply_schedule_changes()
             return
 
         def _run():
@@ -531,6 +553,19 @@ class BellRegularGUI:
                 self.var_status.set(f"실행 오류: {e}")
         threading.Thread(target=_run, daemon=True).start()
 
+    def apply_schedule_changes(self):
+        """실행 중인 스케줄러에 현재 설정/스케줄과의 차이만 반영합니다."""
+        if self.sched is None or not getattr(self.sched, "running", False):
+            return
+        if self.config.get("test_mode", False):
+            self.var_status.set("실행 중 (테스트 모드는 재시작해야 반영됨)")
+            return
+        try:
+            plan = reconcile_schedule(self.sched, self.config)
+            self.var_status.set(f"실행 중 - 변경 반영 ({plan.summary()})")
+        except Exception as e:
+            self.var_status.set(f"변경 반영 오류: {e}")
+
     def stop(self):
         try:
             stop_scheduler(self.sched)
@@ -739,11 +774,18 @@ class BellRegularGUI:
             
             if self.main_date_label:
                 self.main_date_label.config(text=full_date_str, fg=weekday_color)
+
+            # 다음 종 카운트다운 (컴파일된 주간 인덱스에서 O(log n) 조회)
+            # 스케줄은 설정 시간대 기준이므로 호스트 시간대와 달라도 그 시간대의 시각으로 조회
+            if self.next_bell_label:
+                zone = get_tz(self.config.get("timezone", "Asia/Seoul"))
+                zoned_now = now.astimezone(zone)
+                self.next_bell_label.config(
+                    text=self.format_next_bell(zoned_now, get_week_index(zoned_now.date(), zone)))
             
-            # 동기화 상태 표시
+            # 동기화 상태 표시 (실제 동기화 품질 기준)
             if self.use_naver_time.get():
-                sync_text = "NTP/API 동기화 활성"
-                sync_color = "#008000"  # 녹색
+                sync_text, sync_color = self.format_sync_status(get_time_sync_status())
             else:
                 sync_text = "로컬 시계 사용"
                 sync_color = "#666666"  # 회색
@@ -758,6 +800,47 @@ class BellRegularGUI:
         if self.main_clock_label:
             self.clock_update_job = self.root.after(500, self.update_main_clock)
 
+    @staticmethod
+    def format_next_bell(now, index) -> str:
+        """다음 종과 남은 시간을 표시 문자열로 변환"""
+        found = index.next_bell(now)
+        if found is None:
+            return "다음 종 없음"
+        at, bell = found
+        remaining = int((at - now).total_seconds())
+        hours, rest = divmod(remaining, 3600)
+        minutes, seconds = divmod(rest, 60)
+        left = f"{hours}시간 {minutes}분" if hours else f"{minutes}분 {seconds:02d}초"
+        day = "" if at.date() == now.date() else f"{'월화수목금토일'[at.weekday()]} "
+        return f"다음 종 {day}{bell.hhmm} {bell.description} ({left} 후)"
+
+    @staticmethod
+    def format_sync_status(status: dict):
+        """시간 동기화 상태를 (표시 문자열, 색상)으로 변환"""
+        def age_text(age):
+            if age < 60:
+                return f"{age:.0f}초 전"
+            if age < 3600:
+                return f"{age / 60:.0f}분 전"
+            return f"{age / 3600:.1f}시간 전"
+
+        if not status.get("synced"):
+            if status.get("restored"):
+                # 아직 동기화 전이지만 저장된 오프셋(드리프트 보정)을 쓰는 중
+                age = status.get("restored_age_seconds") or 0
+                return (f"저장된 오프셋 {status.get('offset_ms', 0):+.0f}ms 사용 중 "
+                        f"({age_text(age)} 측정) · 동기화 대기", "#cc7700")  # 주황색
+            return "동기화 실패 - 로컬 시계 사용 중", "#cc0000"  # 빨간색
+
+        age = status.get("last_success_age_seconds") or 0
+        text = (f"{status.get('source')} {status.get('offset_ms', 0):+.0f}ms "
+                f"(RTT {status.get('rtt_ms') or 0:.0f}ms, {age_text(age)})")
+
+        # 연속 실패가 있거나 마지막 성공이 오래되면 주의 색상
+        if status.get("consecutive_failures", 0) >= 3 or age > 2 * status.get("next_sync_seconds", 600):
+            return text + " · 동기화 지연", "#cc7700"  # 주황색
+        return text, "#008000"  # 녹색
+
     def stop_main_clock(self):
         """메인 화면 시계 업데이트 정지"""
         if self.clock_update_job:
@@ -0,0 +1,233 @@
+"""
+경량 힙 기반 종 스케줄러
+
+하루 20개 남짓한 일회성 작업을 울리는 데 APScheduler의 스레드 풀, 잡 스토어,
+트리거 계층은 필요 이상이므로, 타이머 스레드 하나가 heapq에서 가장 이른 작업까지
+Event.wait(timeout)으로 기다렸다가 실행하는 엔진을 제공합니다.
+
+app.py가 사용하는 APScheduler API 일부(add_job(trigger="date", run_date=...), get_jobs,
+get_job, reschedule_job, remove_job, remove_all_jobs, start, shutdown, running)를
+같은 이름으로 제공하므로 설정(scheduler_engine: heap)만으로 교체할 수 있습니다.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from datetime import datetime, tzinfo
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from dateutil import tz
+
+# 시계 보정(슬루)을 따라가기 위해 아무리 멀어도 이 간격마다 한 번은 깨어나 다시 계산
+MAX_WAIT_SECONDS = 60.0
+
+# misfire_grace_time 미지정 표시 (None은 APScheduler처럼 "늦어도 항상 실행"을 뜻함)
+_UNDEFINED = object()
+
+
+class ConflictingIdError(KeyError):
+    """같은 id의 작업이 이미 있을 때 (replace_existing=False)"""
+
+
+class JobLookupError(KeyError):
+    """해당 id의 작업이 없을 때"""
+
+
+class HeapJob:
+    """일회성 작업 (APScheduler Job과 같은 주요 속성 이름 사용)"""
+
+    __slots__ = ("id", "name", "func", "args", "kwargs", "next_run_time",
+                 "misfire_grace_time", "_fire_at", "_seq")
+
+    def __init__(self, job_id: str, func: Callable, args, kwargs, run_date: datetime,
+                 misfire_grace_time: Optional[float], name: Optional[str] = None):
+        self.id = job_id
+        self.name = name or getattr(func, "__name__", job_id)
+        self.func = func
+        self.args = tuple(args or ())
+        self.kwargs = dict(kwargs or {})
+        self.misfire_grace_time = misfire_grace_time
+        self.next_run_time = run_date
+        self._fire_at = run_date.timestamp()
+        self._seq = 0
+
+    def __repr__(self) -> str:
+        return f"<HeapJob id={self.id!r} next_run_time={self.next_run_time}>"
+
+
+class HeapScheduler:
+    """타이머 스레드 하나와 heapq로 일회성 작업을 실행하는 스케줄러
+
+    blocking=True이면 start()가 shutdown()까지 호출한 스레드에서 실행됩니다
+    (BlockingScheduler 대응). 작업 함수는 재생이 길어져도 다음 종을 막지 않도록
+    작업마다 데몬 스레드에서 실행합니다.
+    """
+
+    def __init__(self, timezone: Optional[tzinfo] = None, blocking: bool = False,
+                 misfire_grace_time: float = 1.0):
+        self.timezone = timezone or tz.tzlocal()
+        self.blocking = blocking
+        self.misfire_grace_time = misfire_grace_time
+        self._jobs: Dict[str, HeapJob] = {}
+        self._heap: List[Tuple[float, int, HeapJob]] = []
+        self._counter = itertools.count()
+        self._lock = threading.RLock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._paused = False
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    # ----- 작업 관리 -----
+
+    def _resolve_run_date(self, trigger: Any, run_date: Optional[datetime]) -> datetime:
+        if trigger is not None and not isinstance(trigger, str):
+            run_date = getattr(trigger, "run_date", None)  # DateTrigger 호환
+            if run_date is None:
+                raise TypeError(f"지원하지 않는 트리거: {trigger!r}")
+        elif trigger not in (None, "date"):
+            raise ValueError(f"HeapScheduler는 'date' 트리거만 지원합니다: {trigger}")
+        if run_date is None:
+            return datetime.now(tz=self.timezone)
+        if run_date.tzinfo is None:
+            run_date = run_date.replace(tzinfo=self.timezone)
+        return run_date.astimezone(self.timezone)
+
+    def _push(self, job: HeapJob) -> None:
+        job._seq = next(self._counter)
+        heapq.heappush(self._heap, (job._fire_at, job._seq, job))
+        self._wakeup.set()
+
+    def add_job(self, func: Callable, trigger: Any = None, args=None, kwargs=None,
+                id: Optional[str] = None, name: Optional[str] = None,
+                misfire_grace_time: Any = _UNDEFINED, replace_existing: bool = False,
+                run_date: Optional[datetime] = None, **_ignored) -> HeapJob:
+        job_id = id or f"job-{next(self._counter)}"
+        when = self._resolve_run_date(trigger, run_date)
+        grace = self.misfire_grace_time if misfire_grace_time is _UNDEFINED else misfire_grace_time
+        job = HeapJob(job_id, func, args, kwargs, when, grace, name)
+        with self._lock:
+            if job_id in self._jobs and not replace_existing:
+                raise ConflictingIdError(job_id)
+            self._jobs[job_id] = job
+            self._push(job)
+        return job
+
+    def get_jobs(self) -> List[HeapJob]:
+        with self._lock:
+            return sorted(self._jobs.values(), key=lambda j: (j._fire_at, j._seq))
+
+    def get_job(self, job_id: str) -> Optional[HeapJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def reschedule_job(self, job_id: str, trigger: Any = None,
+                       run_date: Optional[datetime] = None, **_ignored) -> HeapJob:
+        when = self._resolve_run_date(trigger, run_date)
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                raise JobLookupError(job_id)
+            job.next_run_time = when
+            job._fire_at = when.timestamp()
+            # 이전 힙 항목은 _seq가 달라져 꺼낼 때 무시됨
+            self._push(job)
+        return job
+
+    def remove_job(self, job_id: str) -> None:
+        with self._lock:
+            if self._jobs.pop(job_id, None) is None:
+                raise JobLookupError(job_id)
+            self._wakeup.set()
+
+    def remove_all_jobs(self) -> None:
+        with self._lock:
+            self._jobs.clear()
+            self._heap.clear()
+            self._wakeup.set()
+
+    # ----- 실행 -----
+
+    def start(self, paused: bool = False) -> None:
+        if self._running:
+            logging.debug("HeapScheduler가 이미 실행 중입니다")
+            return
+        self._paused = paused
+        self._running = True
+        self._stopped.clear()
+        if self.blocking:
+            try:
+                self._run()
+            finally:
+                self._running = False
+        else:
+            self._thread = threading.Thread(target=self._run, name="heap-scheduler", daemon=True)
+            self._thread.start()
+
+    def pause(self) -> None:
+        self._paused = True
+
+    def resume(self) -> None:
+        self._paused = False
+        self._wakeup.set()
+
+    def shutdown(self, wait: bool = True) -> None:
+        if not self._running:
+            return
+        self._running = False
+        self._stopped.set()
+        self._wakeup.set()
+        thread = self._thread
+        if wait and thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5.0)
+        self._thread = None
+
+    def _pop_due(self, now: float) -> Tuple[List[HeapJob], Optional[float]]:
+        """실행 시각이 된 작업을 꺼내고 다음 작업의 실행 시각을 반환합니다."""
+        due = []
+        with self._lock:
+            self._wakeup.clear()
+            while self._heap:
+                fire_at, seq, job = self._heap[0]
+                if self._jobs.get(job.id) is not job or job._seq != seq:
+                    heapq.heappop(self._heap)  # 취소되었거나 재조정된 항목
+                    continue
+                if self._paused or fire_at > now:
+                    return due, fire_at
+                heapq.heappop(self._heap)
+                del self._jobs[job.id]
+                due.append(job)
+        return due, None
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            now = time.time()
+            due, next_at = self._pop_due(now)
+            for job in due:
+                self._dispatch(job, now)
+            if due:
+                continue
+            timeout = MAX_WAIT_SECONDS if next_at is None or self._paused else min(MAX_WAIT_SECONDS, next_at - now)
+            self._wakeup.wait(max(0.0, timeout))
+
+    def _dispatch(self, job: HeapJob, now: float) -> None:
+        late = now - job._fire_at
+        if job.misfire_grace_time is not None and late > job.misfire_grace_time:
+            logging.warning(f"Run time of job {job.id!r} was missed by {late:.3f}s")
+            return
+        threading.Thread(target=self._execute, args=(job,), name=f"job-{job.id}", daemon=True).start()
+
+    @staticmethod
+    def _execute(job: HeapJob) -> None:
+        try:
+            job.func(*job.args, **job.kwargs)
+        except Exception as e:
+            logging.exception(f"Job {job.id!r} raised an exception: {e}")
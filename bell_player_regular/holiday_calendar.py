@@ -0,0 +1,191 @@
+"""
+공휴일/예외 일정 달력
+
+공휴일(종 없음), 일요일 시간표로 운영하는 날, 시험 시간표처럼 평소와 다른 날을
+파일로 정의합니다. 파일을 읽을 때 기간 항목을 날짜별로 펼쳐 (구역, 날짜) 키의 dict로
+컴파일하므로, 몇 년치 항목과 여러 구역이 있어도 날짜 하나의 판단은 dict 조회 두 번
+(해당 구역, 전체 구역)입니다.
+
+예 (holidays.yaml):
+    schedules:
+      exam:
+      - [1, "09:00", "1교시 시험"]
+      - [2, "10:30", "2교시 시험"]
+    days:
+    - date: 2025-12-25
+      schedule: off
+      description: 성탄절
+    - start: 2025-12-15
+      end: 2025-12-19
+      schedule: exam
+    - date: 2026-01-02
+      schedule: sunday
+      zone: annex_2f
+
+schedule에는 off(종 없음), weekday, sunday(해당 구역의 평일/일요일 스케줄),
+schedules에 정의한 이름을 쓰거나 bells에 종 목록을 직접 쓸 수 있습니다.
+zone을 생략한 항목은 모든 구역에 적용되고, 같은 날 구역 항목이 있으면 그쪽이 우선합니다.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from datetime import date, timedelta
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import yaml
+
+from timeline import ScheduleItem, parse_schedule_items
+
+# 구역마다 다른 스케줄로 해석되는 이름
+BUILTIN_SCHEDULES = ("off", "weekday", "sunday")
+
+# 기간 항목 하나가 펼칠 수 있는 최대 일수 (잘못된 end로 수십 년을 펼치지 않도록)
+MAX_RANGE_DAYS = 366
+
+
+def _to_date(value: Any) -> date:
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value).strip())
+
+
+class CalendarDay(NamedTuple):
+    """날짜 하나의 예외 일정"""
+    day: date
+    zone: str  # 빈 문자열이면 모든 구역
+    schedule: str  # off/weekday/sunday/사용자 정의 이름 ("" 이면 items 사용)
+    items: Optional[List[ScheduleItem]]
+    description: str
+
+    def resolve(self, weekday: Sequence[ScheduleItem], sunday: Sequence[ScheduleItem]) -> List[ScheduleItem]:
+        """이 날 사용할 종 목록 (weekday/sunday는 구역의 스케줄로 해석)"""
+        if self.items is not None:
+            return self.items
+        if self.schedule == "sunday":
+            return list(sunday)
+        if self.schedule == "weekday":
+            return list(weekday)
+        return []
+
+
+class HolidayCalendar:
+    """(구역, 날짜) → CalendarDay 로 컴파일된 예외 일정"""
+
+    def __init__(self, days: Sequence[CalendarDay] = ()):
+        self._index: Dict[Tuple[str, date], CalendarDay] = {}
+        for entry in days:
+            # 파일에서 뒤에 나온 항목이 앞의 항목을 덮어씀
+            self._index[(entry.zone, entry.day)] = entry
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def lookup(self, day: date, zone_name: str = "") -> Optional[CalendarDay]:
+        """해당 날짜의 예외 일정 (없으면 None)"""
+        if zone_name:
+            entry = self._index.get((zone_name, day))
+            if entry is not None:
+                return entry
+        return self._index.get(("", day))
+
+    def items_for(self, day: date, zone_name: str, weekday: Sequence[ScheduleItem],
+                  sunday: Sequence[ScheduleItem]) -> Optional[List[ScheduleItem]]:
+        """예외 일정이 있는 날의 종 목록 (없으면 None: 평소 스케줄 사용)"""
+        entry = self.lookup(day, zone_name)
+        return entry.resolve(weekday, sunday) if entry is not None else None
+
+
+def parse_calendar(raw: Any) -> HolidayCalendar:
+    """파일 내용(dict 또는 항목 목록)을 달력으로 컴파일합니다. 잘못된 항목은 경고 후 건너뜁니다."""
+    if isinstance(raw, list):
+        raw = {"days": raw}
+    if not isinstance(raw, dict):
+        raise ValueError("달력 파일은 dict 또는 목록이어야 합니다")
+
+    schedules: Dict[str, List[ScheduleItem]] = {}
+    for name, items in (raw.get("schedules") or {}).items():
+        try:
+            if str(name) in BUILTIN_SCHEDULES:
+                raise ValueError("내장 스케줄 이름은 다시 정의할 수 없습니다")
+            schedules[str(name)] = parse_schedule_items(items)
+        except (TypeError, ValueError) as e:
+            logging.warning(f"잘못된 달력 스케줄을 건너뜀 ({name}): {e}")
+
+    days: List[CalendarDay] = []
+    for entry in raw.get("days") or []:
+        try:
+            if not isinstance(entry, dict):
+                raise ValueError("항목은 dict여야 합니다")
+            if "date" in entry:
+                start = end = _to_date(entry["date"])
+            else:
+                start, end = _to_date(entry["start"]), _to_date(entry["end"])
+            span = (end - start).days
+            if not 0 <= span < MAX_RANGE_DAYS:
+                raise ValueError(f"기간이 잘못됨: {start} ~ {end}")
+            items = None
+            if "bells" in entry:
+                schedule = ""
+                items = parse_schedule_items(entry["bells"])
+            else:
+                # YAML에서 따옴표 없는 off는 False로 읽힘
+                value = entry.get("schedule", "off")
+                schedule = "off" if value is False else str(value).strip()
+                if schedule in schedules:
+                    items = schedules[schedule]
+                elif schedule not in BUILTIN_SCHEDULES:
+                    raise ValueError(f"알 수 없는 스케줄 이름: {schedule}")
+            zone = str(entry.get("zone") or "").strip()
+            description = str(entry.get("description") or "")
+        except (KeyError, TypeError, ValueError) as e:
+            logging.warning(f"잘못된 달력 항목을 건너뜀 ({entry!r}): {e}")
+            continue
+        for offset in range(span + 1):
+            days.append(CalendarDay(start + timedelta(days=offset), zone, schedule, items, description))
+    return HolidayCalendar(days)
+
+
+def load_calendar(path: str) -> HolidayCalendar:
+    """YAML 달력 파일을 읽어 컴파일합니다."""
+    with open(path, "r", encoding="utf-8") as f:
+        raw = yaml.safe_load(f) or {}
+    return parse_calendar(raw)
+
+
+class CalendarFile:
+    """파일이 바뀌었을 때만 다시 컴파일하는 달력 캐시 ((경로, 수정 시각, 크기) 기준)"""
+
+    def __init__(self):
+        self._key = None
+        self.calendar: Optional[HolidayCalendar] = None
+
+    @property
+    def signature(self) -> Optional[tuple]:
+        """현재 달력 파일의 (경로, 수정 시각, 크기)"""
+        return self._key
+
+    def get(self, path: str) -> Tuple[Optional[HolidayCalendar], bool]:
+        """(달력, 바뀌었는지)를 반환합니다. 경로가 비었거나 읽을 수 없으면 달력은 None."""
+        key = None
+        if path:
+            try:
+                st = os.stat(path)
+                key = (path, st.st_mtime_ns, st.st_size)
+            except OSError:
+                key = (path, None, None)
+        if key == self._key:
+            return self.calendar, False
+        calendar = None
+        if key is not None and key[1] is not None:
+            try:
+                calendar = load_calendar(path)
+                logging.info(f"공휴일/예외 달력 로드: {path} ({len(calendar)}일)")
+            except (OSError, yaml.YAMLError, ValueError) as e:
+                logging.error(f"공휴일/예외 달력을 읽을 수 없어 사용하지 않습니다 ({path}): {e}")
+        elif key is not None:
+            logging.warning(f"공휴일/예외 달력 파일이 없습니다: {path}")
+        changed = (self.calendar is not None) or (calendar is not None)
+        self._key, self.calendar = key, calendar
+        return calendar, changed
@@ -0,0 +1,107 @@
+"""
+종 작업 변경 계획(diff)
+
+새로 만든 계획과 스케줄러에 이미 등록된 작업을 작업 id로 비교해 추가, 삭제,
+시각 변경만 골라냅니다. 스케줄을 고칠 때 모든 작업을 지우고 다시 만들지 않으므로
+바뀐 종만 O(변경 수)로 반영되고, 반영 중에 울려야 할 다른 종을 놓치지 않습니다.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from typing import Callable, Iterable, List, NamedTuple, Sequence, Tuple
+
+
+class PlannedJob(NamedTuple):
+    """스케줄러에 있어야 할 작업 하나"""
+    job_id: str
+    run_at: datetime  # 스케줄러에 넘길 발사 시각
+    args: tuple
+
+
+class JobPlan(NamedTuple):
+    """현재 작업 → 새 계획으로 가기 위한 변경 목록"""
+    add: List[PlannedJob]
+    remove: List[str]
+    reschedule: List[PlannedJob]
+    unchanged: int
+
+    @property
+    def changed(self) -> int:
+        return len(self.add) + len(self.remove) + len(self.reschedule)
+
+    def summary(self) -> str:
+        return (f"추가 {len(self.add)}, 삭제 {len(self.remove)}, "
+                f"이동 {len(self.reschedule)}, 유지 {self.unchanged}")
+
+
+def diff_jobs(desired: Iterable[PlannedJob], scheduled: Iterable, prefixes: Tuple[str, ...] = ("bell-",),
+              tolerance_seconds: float = 0.001) -> JobPlan:
+    """desired 계획과 scheduled 작업(id, next_run_time, args 속성)을 비교합니다.
+
+    prefixes로 시작하는 작업만 관리 대상이며, 인자가 바뀐 작업은 새로 추가(교체)하고
+    시각만 바뀐 작업은 재조정합니다.
+    """
+    wanted = {job.job_id: job for job in desired}
+    add: List[PlannedJob] = []
+    remove: List[str] = []
+    reschedule: List[PlannedJob] = []
+    unchanged = 0
+    seen = set()
+
+    for job in scheduled:
+        if not job.id.startswith(prefixes):
+            continue
+        seen.add(job.id)
+        plan = wanted.get(job.id)
+        if plan is None:
+            remove.append(job.id)
+        elif tuple(job.args) != tuple(plan.args):
+            add.append(plan)
+        elif (getattr(job, "next_run_time", None) is None
+              or abs((job.next_run_time - plan.run_at).total_seconds()) > tolerance_seconds):
+            reschedule.append(plan)
+        else:
+            unchanged += 1
+
+    add.extend(job for job_id, job in wanted.items() if job_id not in seen)
+    add.sort(key=lambda job: job.run_at)
+    return JobPlan(add, remove, reschedule, unchanged)
+
+
+def apply_plan(sched, plan: JobPlan, func: Callable, misfire_grace_time: int) -> None:
+    """계획을 스케줄러에 반영합니다 (추가 → 이동 → 삭제 순서).
+
+    반영 도중에 작업이 실행되어 사라졌으면 해당 변경은 건너뜁니다. 스케줄러가
+    add_jobs()(일괄 등록)를 제공하면 추가할 작업을 한 번에 넘깁니다.
+    """
+    if callable(getattr(type(sched), "add_jobs", None)):  # 인스턴스 속성(목 객체 등)이 아닌 엔진 메서드만
+        sched.add_jobs(func, plan.add, misfire_grace_time=misfire_grace_time)
+    else:
+        for job in plan.add:
+            sched.add_job(
+                func,
+                trigger="date",
+                run_date=job.run_at,
+                args=list(job.args),
+                id=job.job_id,
+                misfire_grace_time=misfire_grace_time,
+                replace_existing=True,
+            )
+    for job in plan.reschedule:
+        try:
+            sched.reschedule_job(job.job_id, trigger="date", run_date=job.run_at)
+        except KeyError:  # APScheduler/heap 엔진의 JobLookupError 모두 KeyError 하위 클래스
+            logging.debug(f"재조정 전에 이미 실행된 작업: {job.job_id}")
+    for job_id in plan.remove:
+        try:
+            sched.remove_job(job_id)
+        except KeyError:
+            logging.debug(f"삭제 전에 이미 실행된 작업: {job_id}")
+
+
+def snapshot_jobs(sched, prefixes: Sequence[str] = ("bell-",)) -> list:
+    """관리 대상 작업의 현재 목록 (계획을 만들기 전에 먼저 찍어 둠)"""
+    prefixes = tuple(prefixes)
+    return [job for job in sched.get_jobs() if job.id.startswith(prefixes)]
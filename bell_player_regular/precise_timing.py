@@ -0,0 +1,62 @@
+"""
+정밀 발사 타이밍
+
+스케줄러는 종 시각보다 pre-roll만큼 일찍 작업을 깨우고, 그 사이 사운드를 준비한 뒤
+sleep_until()로 남은 시간을 점점 짧게 잠들다가 마지막 몇 ms는 바쁜 대기(spin)로 정확한
+초에 맞춥니다. 실제 발사 오차는 JitterTracker에 모아 로그와 상태 표시에 사용합니다.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Optional
+
+# Windows의 sleep은 수 ms~15.6ms 단위로 늦게 깨어날 수 있으므로 spin 구간을 넓게 잡음
+DEFAULT_SPIN_SECONDS = 0.02 if os.name == "nt" else 0.002
+
+
+def sleep_until(target: float, clock: Callable[[], float] = time.time,
+                spin_seconds: float = DEFAULT_SPIN_SECONDS) -> float:
+    """clock 기준 target 시각까지 기다리고, 늦은 정도(초)를 반환합니다.
+
+    남은 시간의 절반씩 잠들며 다가가다가 spin_seconds 이내로 들어오면 바쁜 대기로
+    마무리합니다. 기다리는 동안 벽시계가 조정되어도 흔들리지 않도록 시작할 때 한 번만
+    perf_counter 기준으로 바꿔 계산합니다.
+    """
+    deadline = time.perf_counter() + (target - clock())
+    while True:
+        remaining = deadline - time.perf_counter()
+        if remaining <= spin_seconds:
+            break
+        time.sleep((remaining - spin_seconds) / 2 if remaining > 2 * spin_seconds else remaining - spin_seconds)
+    while time.perf_counter() < deadline:
+        pass
+    return time.perf_counter() - deadline
+
+
+class JitterTracker:
+    """최근 발사 오차(초)를 링 버퍼에 보관하고 요약합니다."""
+
+    def __init__(self, maxlen: int = 200):
+        self._samples: Deque[float] = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    def record(self, lateness: float) -> None:
+        with self._lock:
+            self._samples.append(lateness)
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        """오차 요약 (ms): 개수, 중앙값, p95, 최대 절대값"""
+        with self._lock:
+            samples = list(self._samples)
+        if not samples:
+            return {"count": 0, "p50_ms": None, "p95_ms": None, "max_ms": None}
+        ordered = sorted(abs(x) for x in samples)
+
+        def pct(p: float) -> float:
+            return round(ordered[min(len(ordered) - 1, int(round(p * (len(ordered) - 1))))] * 1000, 3)
+
+        return {"count": len(ordered), "p50_ms": pct(0.5), "p95_ms": pct(0.95), "max_ms": pct(1.0)}
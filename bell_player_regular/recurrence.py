@@ -0,0 +1,213 @@
+"""
+반복 규칙(RRULE) 기반 스케줄 정의
+
+요일만으로 평일/일요일 스케줄을 고르는 대신, 어떤 날에 어떤 종 목록을 쓸지를
+iCalendar 반복 규칙(dateutil rrule/rruleset)과 EXDATE 예외로 정의합니다.
+학기 기간(DTSTART/UNTIL), 시험 주간, 공휴일 제외를 코드 수정 없이 설정할 수 있습니다.
+
+규칙은 위에서부터 우선순위를 가지며, 날짜마다 처음 맞는 규칙의 종 목록을 사용합니다.
+반복은 필요한 날짜 구간만 생성기로 펼치므로 1년치 작업을 미리 만들지 않습니다.
+
+예 (config.yaml):
+    schedule_rules:
+    - name: 기말고사
+      rrule: FREQ=DAILY;COUNT=5
+      dtstart: 2025-12-15
+      bells: [[1, "09:00", "1교시 시험"], [2, "10:30", "2교시 시험"]]
+    - name: 평일
+      rrule: FREQ=WEEKLY;BYDAY=MO,TU,WE,TH,FR,SA
+      exdates: [2025-12-25]
+      bells: weekday
+    - name: 일요일
+      rrule: FREQ=WEEKLY;BYDAY=SU
+      bells: sunday
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from dateutil.rrule import rruleset, rrulestr
+
+from timeline import ScheduleItem, parse_schedule_items
+
+
+def _to_date(value: Any) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value).strip())
+
+
+def _midnight(day: date) -> datetime:
+    return datetime(day.year, day.month, day.day)
+
+
+# 기준일(DTSTART)이 없으면 뜻이 정해지지 않는 규칙: 기준일이 곧 발생일인 FREQ와 필요한 BY 부분
+_ANCHORED_PARTS = {
+    "WEEKLY": ("BYDAY",),
+    "MONTHLY": ("BYMONTHDAY", "BYDAY", "BYYEARDAY", "BYWEEKNO"),
+    "YEARLY": ("BYMONTHDAY", "BYDAY", "BYYEARDAY", "BYWEEKNO"),
+}
+
+
+def needs_dtstart(rule: str) -> Optional[str]:
+    """dtstart 없이 쓰면 조회하는 날마다 해당되어 버리는 규칙이면 그 이유를 반환합니다.
+
+    INTERVAL>1, COUNT, BYSETPOS나 BY 부분 없는 WEEKLY/MONTHLY/YEARLY는 기준일에 따라
+    발생일이 달라지므로 조회일을 기준으로 펼치면 (격주 규칙이 매주 울리는 식으로) 틀립니다.
+    """
+    for line in rule.upper().split():
+        if "FREQ=" not in line:
+            continue
+        parts = dict(part.split("=", 1) for part in line.split(":")[-1].split(";") if "=" in part)
+        if int(parts.get("INTERVAL", "1")) > 1:
+            return "INTERVAL"
+        for key in ("COUNT", "BYSETPOS"):
+            if key in parts:
+                return key
+        required = _ANCHORED_PARTS.get(parts.get("FREQ", ""), ())
+        if required and not any(key in parts for key in required):
+            return f"{'/'.join(required)} 없는 FREQ={parts['FREQ']}"
+    return None
+
+
+class ScheduleRule:
+    """반복 규칙 하나: 규칙이 해당하는 날에는 items 종 목록을 사용합니다.
+
+    dtstart가 없으면 조회하는 구간의 시작일을 기준으로 규칙을 펼치므로 기준일과 무관한
+    규칙(매일, 매주 특정 요일 등)만 허용하고, 격주처럼 기준일이 필요한 규칙은 dtstart가
+    없으면 ValueError입니다.
+    """
+
+    def __init__(self, name: str, rule: str, items: Sequence[ScheduleItem],
+                 dtstart: Optional[date] = None, exdates: Sequence[date] = ()):
+        self.name = name
+        self.rule = rule.strip()
+        self.items = list(items)
+        self.dtstart = dtstart
+        self.exdates = sorted(set(exdates))
+        self.source: Any = None  # 설정의 원본 항목 (parse_schedule_rules가 채움)
+        if dtstart is None:
+            reason = needs_dtstart(self.rule)
+            if reason:
+                raise ValueError(f"기준일이 필요한 규칙({reason})에는 dtstart를 지정해야 합니다")
+        self._fixed = self._build(_midnight(dtstart)) if dtstart else None
+        if self._fixed is None:
+            self._build(datetime(2000, 1, 1))  # 규칙 문법만 미리 확인
+
+    def _build(self, anchor: datetime) -> rruleset:
+        rules = rrulestr(self.rule, dtstart=anchor, forceset=True, ignoretz=True)
+        for day in self.exdates:
+            rules.exdate(_midnight(day))
+        return rules
+
+    def _ruleset(self, start: date) -> rruleset:
+        return self._fixed if self._fixed is not None else self._build(_midnight(start))
+
+    def occurrences(self, start: date, end: date) -> Iterator[date]:
+        """start <= 날짜 < end 구간에서 규칙이 해당하는 날을 차례로 돌려줍니다 (지연 생성)."""
+        last = None
+        for at in self._ruleset(start).xafter(_midnight(start), inc=True):
+            day = at.date()
+            if day >= end:
+                return
+            if day != last:  # BYHOUR 등으로 하루에 여러 번 나와도 날짜는 한 번만
+                last = day
+                yield day
+
+    def occurs_on(self, day: date) -> bool:
+        return next(self.occurrences(day, day + timedelta(days=1)), None) is not None
+
+    def __repr__(self) -> str:
+        return f"<ScheduleRule {self.name!r} {self.rule!r}>"
+
+
+class ScheduleRuleSet:
+    """우선순위 순서의 규칙 목록 (날짜마다 처음 맞는 규칙 사용)
+
+    날짜별 조회는 iter_days로 window_days일 구간을 한 번에 펼쳐 두고 그 안에서 찾으므로,
+    타임라인이나 주간 인덱스가 며칠을 연달아 물어도 규칙을 날마다 다시 만들지 않습니다.
+    """
+
+    def __init__(self, rules: Sequence[ScheduleRule], window_days: int = 7):
+        self.rules = list(rules)
+        self.window_days = max(1, int(window_days))
+        self._window: Tuple[date, date, Dict[date, Optional[ScheduleRule]]] = (date.min, date.min, {})
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def rule_for_date(self, day: date) -> Optional[ScheduleRule]:
+        start, end, rules = self._window
+        if not start <= day < end:
+            start, end = day, day + timedelta(days=self.window_days)
+            rules = dict(self.iter_days(start, end))
+            self._window = (start, end, rules)  # 튜플 하나로 교체하므로 여러 스레드에서 읽어도 됨
+        return rules[day]
+
+    def items_for_date(self, day: date) -> List[ScheduleItem]:
+        """해당 날짜의 종 목록 (맞는 규칙이 없으면 종 없음)"""
+        rule = self.rule_for_date(day)
+        return rule.items if rule is not None else []
+
+    def iter_days(self, start: date, end: date) -> Iterator[Tuple[date, Optional[ScheduleRule]]]:
+        """start <= 날짜 < end 의 (날짜, 적용 규칙)을 차례로 돌려줍니다.
+
+        규칙마다 생성기를 하나씩 열어 두고 날짜를 함께 진행하므로 구간 길이만큼만 펼칩니다.
+        """
+        streams = [rule.occurrences(start, end) for rule in self.rules]
+        heads = [next(stream, None) for stream in streams]
+        day = start
+        while day < end:
+            chosen = None
+            for i, rule in enumerate(self.rules):
+                while heads[i] is not None and heads[i] < day:
+                    heads[i] = next(streams[i], None)
+                if chosen is None and heads[i] == day:
+                    chosen = rule
+            yield day, chosen
+            day += timedelta(days=1)
+
+
+def parse_schedule_rules(raw: Any, named_schedules: Mapping[str, Sequence[ScheduleItem]]) -> List[ScheduleRule]:
+    """설정의 schedule_rules 목록을 규칙으로 변환합니다.
+
+    bells에는 종 목록이나 named_schedules의 이름("weekday", "sunday" 등)을 쓸 수 있습니다.
+    잘못된 규칙은 경고를 남기고 건너뜁니다.
+    """
+    if not raw:
+        return []
+    if not isinstance(raw, list):
+        logging.warning(f"schedule_rules 설정은 목록이어야 합니다: {raw!r}")
+        return []
+    rules: List[ScheduleRule] = []
+    for n, entry in enumerate(raw, 1):
+        try:
+            if not isinstance(entry, dict):
+                raise ValueError("규칙은 dict여야 합니다")
+            bells = entry.get("bells", [])
+            if isinstance(bells, str):
+                if bells not in named_schedules:
+                    raise ValueError(f"알 수 없는 스케줄 이름: {bells}")
+                items = list(named_schedules[bells])
+            else:
+                items = parse_schedule_items(bells)
+            dtstart = _to_date(entry["dtstart"]) if entry.get("dtstart") else None
+            exdates = [_to_date(d) for d in entry.get("exdates") or []]
+            rule = ScheduleRule(str(entry.get("name") or f"규칙{n}"), str(entry["rrule"]), items,
+                                dtstart, exdates)
+        except (KeyError, TypeError, ValueError) as e:
+            logging.warning(f"잘못된 반복 규칙을 건너뜀 ({entry!r}): {e}")
+            continue
+        rule.source = entry
+        rules.append(rule)
+    return rules
+
+
+def named_schedules(weekday: Sequence[ScheduleItem], sunday: Sequence[ScheduleItem]) -> Dict[str, List[ScheduleItem]]:
+    """규칙의 bells에서 이름으로 참조할 수 있는 내장 스케줄"""
+    return {"weekday": list(weekday), "sunday": list(sunday), "off": []}
@@ -0,0 +1,88 @@
+"""
+절전 복귀 후 놓친 종 처리
+
+교실 PC가 점심시간에 절전되면 그동안의 종 작업은 복귀 직후 스케줄러가 한꺼번에
+실행하거나(misfire 유예 안) 버립니다(유예 초과). 복귀가 감지되면(ClockWatch) 잠시
+(settle_seconds) 몰려 실행되는 지난 종 작업을 흡수하고, 그 뒤 절전 구간에 있던 종을
+한 번에 모아 정책대로 처리합니다. 그래서 복귀 한 번이 겹쳐 재생되는 ffplay 여러 개를
+만들지 않습니다.
+
+정책 (resume_catchup_policy):
+- latest: 놓친 종 중 가장 최근 것 하나만 재생 (기본값)
+- skip: 모두 건너뜀
+- replay: 복귀 시각 기준 resume_replay_window_seconds 안의 종을 순서대로 하나씩 재생
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from timeline import TimelineEntry
+
+CATCHUP_POLICIES = ("latest", "skip", "replay")
+
+
+def coalesce_missed(missed: Sequence[TimelineEntry], policy: str, replay_window_seconds: float,
+                    resumed_at: float) -> List[TimelineEntry]:
+    """놓친 종(시각 순서) 중 정책에 따라 재생할 종을 고릅니다. O(놓친 종 수)"""
+    if policy == "skip" or not missed:
+        return []
+    if policy == "replay":
+        cutoff = resumed_at - replay_window_seconds
+        return [e for e in missed if e.run_at.timestamp() >= cutoff]
+    return [max(missed, key=lambda e: e.run_at)]
+
+
+class ResumeCatchUp:
+    """복귀 직후의 지난 종 작업을 흡수했다가 한 번에 정책을 적용합니다.
+
+    on_finish(시작, 끝)은 settle_seconds 뒤 한 번 호출되며, 절전이 시작된 시각부터
+    흡수가 끝나는 시각까지(벽시계 초)의 구간을 받아 그 안의 종을 처리합니다.
+    """
+
+    def __init__(self, on_finish: Callable[[float, float], None], settle_seconds: float = 2.0,
+                 clock: Callable[[], float] = time.time):
+        self.on_finish = on_finish
+        self.settle_seconds = float(settle_seconds)
+        self.policy = "latest"
+        self.replay_window_seconds = 300.0
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._window: Optional[Tuple[float, float]] = None
+        self._timer: Optional[threading.Timer] = None
+
+    def begin(self, gap_seconds: float) -> None:
+        """복귀를 알립니다. 이미 흡수 중이면 구간을 넓히기만 합니다."""
+        now = self._clock()
+        with self._lock:
+            start, end = now - gap_seconds, now + self.settle_seconds
+            if self._window is not None:
+                start = min(start, self._window[0])
+            self._window = (start, end)
+            if self._timer is None:
+                self._timer = threading.Timer(self.settle_seconds, self.finish)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def absorbing(self) -> bool:
+        """복귀 직후라 종 작업을 재생하지 않고 흡수해야 하는지"""
+        with self._lock:
+            return self._window is not None and self._clock() < self._window[1]
+
+    def finish(self) -> Optional[Tuple[float, float]]:
+        """흡수를 끝내고 구간의 종을 처리합니다 (처리할 구간이 없으면 None)."""
+        with self._lock:
+            window, self._window = self._window, None
+            timer, self._timer = self._timer, None
+        if timer is not None and timer is not threading.current_thread():
+            timer.cancel()
+        if window is None:
+            return None
+        try:
+            self.on_finish(*window)
+        except Exception as e:
+            logging.exception(f"절전 복귀 후 놓친 종 처리 중 오류: {e}")
+        return window
@@ -0,0 +1,138 @@
+"""
+외부 스케줄 파일 (CSV/YAML)
+
+평일/일요일 시간표를 app.py에 고정하지 않고 파일에서 읽습니다. 파일은 한 번만 파싱·검증해
+작은 컴파일 형태(자정부터의 분 단위 시각 배열 + 인덱스/설명 표, 시각 순 정렬)로 보관하고
+(경로, 수정 시각, 크기)로 캐시하므로, 파일이 바뀌지 않은 동안의 재로드는 stat 한 번입니다.
+
+CSV (bell_player의 schedule.csv와 같은 형식, description 열은 선택):
+    index,time,description
+    1,0600,기상종소리
+    2,07:20,시작종
+
+YAML (목록 또는 bells 키):
+    bells:
+    - [1, "06:00", "기상종소리"]
+    - {index: 2, time: "07:20", description: 시작종}
+"""
+
+from __future__ import annotations
+
+import csv
+import logging
+import os
+import threading
+from array import array
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import yaml
+
+from timeline import ScheduleItem, parse_schedule_items
+
+CSV_EXTENSIONS = (".csv",)
+YAML_EXTENSIONS = (".yaml", ".yml")
+
+
+class CompiledSchedule:
+    """시각 순으로 정렬된 하루치 종 (minutes[i]에 indexes[i]번 종, 설명은 descriptions[i])"""
+
+    __slots__ = ("minutes", "indexes", "descriptions")
+
+    def __init__(self, items: Sequence[ScheduleItem]):
+        rows = sorted((int(hhmm[:2]) * 60 + int(hhmm[3:]), idx, desc) for idx, hhmm, desc in items)
+        self.minutes = array("H", (m for m, _, _ in rows))
+        self.indexes = array("i", (idx for _, idx, _ in rows))
+        self.descriptions: Tuple[str, ...] = tuple(desc for _, _, desc in rows)
+
+    def __len__(self) -> int:
+        return len(self.minutes)
+
+    def items(self) -> List[ScheduleItem]:
+        """[(인덱스, "HH:MM", 설명), ...] (시각 순)"""
+        return [(idx, f"{m // 60:02d}:{m % 60:02d}", desc)
+                for m, idx, desc in zip(self.minutes, self.indexes, self.descriptions)]
+
+
+def compile_schedule(items: Sequence[ScheduleItem]) -> CompiledSchedule:
+    """검증된 종 목록을 컴파일합니다. 같은 인덱스가 두 번 나오면 ValueError (작업 id가 겹침)."""
+    seen = set()
+    for idx, hhmm, _ in items:
+        if idx in seen:
+            raise ValueError(f"종 인덱스가 중복됨: {idx} ({hhmm})")
+        seen.add(idx)
+    return CompiledSchedule(items)
+
+
+def read_schedule_items(path: str) -> List[ScheduleItem]:
+    """CSV 또는 YAML 스케줄 파일을 읽어 검증된 종 목록을 반환합니다."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext in CSV_EXTENSIONS:
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            reader = csv.DictReader(f)
+            if not reader.fieldnames or not {"index", "time"} <= set(reader.fieldnames):
+                raise ValueError("CSV에는 index, time 열이 있어야 합니다")
+            rows = [(row["index"], str(row["time"]).strip(), row.get("description") or "") for row in reader]
+        return parse_schedule_items(rows)
+    if ext in YAML_EXTENSIONS:
+        with open(path, "r", encoding="utf-8") as f:
+            raw: Any = yaml.safe_load(f) or []
+        if isinstance(raw, dict):
+            raw = raw.get("bells") or []
+        return parse_schedule_items(raw)
+    raise ValueError(f"지원하지 않는 스케줄 파일 형식: {ext or path}")
+
+
+class ScheduleFileCache:
+    """(경로, 수정 시각, 크기)가 같으면 다시 파싱하지 않는 스케줄 파일 캐시"""
+
+    def __init__(self):
+        self._cache: Dict[str, Tuple[Tuple[int, int], CompiledSchedule]] = {}
+        self._lock = threading.Lock()
+
+    def load(self, path: str) -> CompiledSchedule:
+        """컴파일된 스케줄 (파일이 없거나 잘못되었으면 OSError/ValueError/yaml.YAMLError)"""
+        st = os.stat(path)
+        key = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            cached = self._cache.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        compiled = compile_schedule(read_schedule_items(path))
+        with self._lock:
+            self._cache[path] = (key, compiled)
+        return compiled
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+# 프로세스 전체에서 공유하는 캐시
+schedule_files = ScheduleFileCache()
+
+
+class ScheduleFile:
+    """설정에 지정된 스케줄 파일 하나 (파일이 바뀌었을 때만 changed=True)"""
+
+    def __init__(self, cache: ScheduleFileCache = schedule_files):
+        self._cache = cache
+        self._path = ""
+        self.schedule: Optional[CompiledSchedule] = None
+
+    def get(self, path: str) -> Tuple[Optional[CompiledSchedule], bool]:
+        """(컴파일된 스케줄, 바뀌었는지)를 반환합니다. 경로가 비었거나 읽을 수 없으면 스케줄은 None."""
+        compiled = None
+        if path:
+            try:
+                compiled = self._cache.load(path)
+            except FileNotFoundError:
+                if path != self._path:
+                    logging.warning(f"스케줄 파일이 없어 내장 스케줄을 사용합니다: {path}")
+            except (OSError, yaml.YAMLError, ValueError) as e:
+                if path != self._path or self.schedule is not None:
+                    logging.error(f"스케줄 파일을 읽을 수 없어 내장 스케줄을 사용합니다 ({path}): {e}")
+        changed = compiled is not self.schedule
+        if changed and compiled is not None:
+            logging.info(f"스케줄 파일 로드: {path} (종 {len(compiled)}개)")
+        self._path, self.schedule = path, compiled
+        return compiled, changed
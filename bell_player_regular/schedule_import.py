@@ -0,0 +1,238 @@
+"""
+여러 사이트의 스케줄 일괄 가져오기 (스트리밍)
+
+교육청/본사에서 내려받은 큰 CSV(사이트마다 수십~수백 줄, 사이트 수십 개)를 한 줄씩
+생성기 파이프라인으로 처리합니다:
+
+    읽기(read_rows) → 파싱/검증(parse_rows) → 중복 제거(dedupe_bells) → 구역별 파일 쓰기
+
+입력 전체를 메모리에 올리지 않으므로 입력이 아무리 커도 메모리는 (만들어지는 종 수만큼의
+중복 검사 표를 빼면) 일정합니다. 잘못된 줄은 줄 번호와 이유를 기록하고 건너뛸 뿐 전체
+가져오기를 멈추지 않습니다.
+
+입력 열 (이름은 대소문자 무시):
+    site 또는 zone   구역 이름 (글자/숫자/밑줄, 없으면 --zone 기본값)
+    schedule 또는 day  weekday/sunday (평일/일요일도 가능, 없으면 weekday)
+    index, time      종 인덱스와 "HH:MM" 또는 "HHMM" 시각
+    description      설명 (선택)
+
+출력은 구역·요일별 schedule_files 형식 CSV(<구역>.<weekday|sunday>.csv)이며, config.yaml의
+zones에 weekday_schedule_file/sunday_schedule_file로 지정해 씁니다:
+
+    python schedule_import.py district_export.csv --out schedules
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import logging
+import os
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, TextIO, Tuple, Union
+
+import yaml
+
+from timeline import parse_hhmm
+from zones import valid_zone_name
+
+SCHEDULE_KINDS = {"weekday": "weekday", "평일": "weekday", "sunday": "sunday", "일요일": "sunday"}
+
+
+class ImportedBell(NamedTuple):
+    """가져온 종 하나"""
+    line: int
+    zone: str
+    kind: str  # "weekday" 또는 "sunday"
+    index: int
+    hhmm: str  # "HH:MM"
+    description: str
+
+
+class RowError(NamedTuple):
+    """건너뛴 줄"""
+    line: int
+    message: str
+
+
+class ImportReport:
+    """가져오기 결과 (오류는 앞의 max_errors개만 보관하고 나머지는 개수만 셈)"""
+
+    def __init__(self, max_errors: int = 100):
+        self.max_errors = max_errors
+        self.rows = 0
+        self.bells = 0
+        self.duplicates = 0
+        self.error_count = 0
+        self.errors: List[RowError] = []
+        self.files: Dict[Tuple[str, str], str] = {}  # (구역, 요일) → 출력 파일
+
+    def add_error(self, error: RowError) -> None:
+        self.error_count += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append(error)
+
+    def zones_config(self) -> List[dict]:
+        """config.yaml의 zones에 넣을 구역 목록"""
+        zones: Dict[str, dict] = {}
+        for (zone, kind), path in sorted(self.files.items()):
+            zones.setdefault(zone, {"name": zone})[f"{kind}_schedule_file"] = path
+        return list(zones.values())
+
+
+def normalize_hhmm(value: str) -> str:
+    """"HH:MM"/"HHMM"/"HMM" 시각을 "HH:MM"으로 바꿉니다 (범위를 벗어나면 ValueError)."""
+    text = str(value).strip()
+    if not text or not text.replace(":", "").isdigit():
+        raise ValueError(f"잘못된 시각: {value!r}")
+    hour, minute = parse_hhmm(text)
+    if not (0 <= hour < 24 and 0 <= minute < 60):
+        raise ValueError(f"잘못된 시각: {value!r}")
+    return f"{hour:02d}:{minute:02d}"
+
+
+def read_rows(stream: TextIO) -> Iterator[Tuple[int, Dict[str, str]]]:
+    """CSV를 한 줄씩 (줄 번호, 열 이름을 소문자로 바꾼 dict)로 내보냅니다."""
+    reader = csv.reader(stream)
+    header = next(reader, None)
+    if header is None:
+        return
+    columns = [name.strip().lower() for name in header]
+    for row in reader:
+        if not any(cell.strip() for cell in row):
+            continue  # 빈 줄
+        yield reader.line_num, dict(zip(columns, row))
+
+
+def parse_rows(rows: Iterable[Tuple[int, Dict[str, str]]],
+               default_zone: str = "") -> Iterator[Union[ImportedBell, RowError]]:
+    """줄마다 검증해 ImportedBell 또는 (잘못된 줄이면) RowError를 내보냅니다."""
+    for line, row in rows:
+        try:
+            zone = (row.get("site") or row.get("zone") or default_zone).strip()
+            if not valid_zone_name(zone):
+                raise ValueError(f"구역 이름은 글자/숫자/밑줄만 사용할 수 있습니다: {zone!r}")
+            kind_text = (row.get("schedule") or row.get("day") or "weekday").strip().lower()
+            kind = SCHEDULE_KINDS.get(kind_text)
+            if kind is None:
+                raise ValueError(f"알 수 없는 요일 구분: {kind_text!r}")
+            index_text = (row.get("index") or "").strip()
+            if not index_text.isdigit():
+                raise ValueError(f"잘못된 종 인덱스: {index_text!r}")
+            hhmm = normalize_hhmm(row.get("time") or "")
+            description = (row.get("description") or "").strip()
+        except ValueError as e:
+            yield RowError(line, str(e))
+            continue
+        yield ImportedBell(line, zone, kind, int(index_text), hhmm, description)
+
+
+def dedupe_bells(records: Iterable[Union[ImportedBell, RowError]],
+                 report: ImportReport) -> Iterator[Union[ImportedBell, RowError]]:
+    """같은 (구역, 요일, 인덱스)의 종을 하나만 남깁니다.
+
+    내용까지 같은 줄은 조용히 버리고(report.duplicates), 같은 인덱스에 다른 시각이 오면
+    충돌로 RowError를 냅니다. 표에는 (구역, 요일, 인덱스)별 시각만 보관합니다.
+    """
+    seen: Dict[Tuple[str, str, int], Tuple[int, str]] = {}
+    for record in records:
+        if isinstance(record, RowError):
+            yield record
+            continue
+        key = (record.zone, record.kind, record.index)
+        first = seen.get(key)
+        if first is None:
+            seen[key] = (record.line, record.hhmm)
+            yield record
+        elif first[1] == record.hhmm:
+            report.duplicates += 1
+        else:
+            yield RowError(record.line, f"{record.zone} {record.kind} 종 {record.index}번이 "
+                                        f"{first[0]}번째 줄({first[1]})과 다른 시각({record.hhmm})으로 중복됨")
+
+
+class _ZoneWriters:
+    """구역·요일별 출력 파일 (임시 파일에 쓰고 끝나면 교체)"""
+
+    def __init__(self, out_dir: str):
+        self.out_dir = out_dir
+        self._open: Dict[Tuple[str, str], Tuple[TextIO, Any, str]] = {}
+
+    def write(self, bell: ImportedBell) -> None:
+        key = (bell.zone, bell.kind)
+        entry = self._open.get(key)
+        if entry is None:
+            path = os.path.join(self.out_dir, f"{bell.zone}.{bell.kind}.csv")
+            f = open(path + ".tmp", "w", newline="", encoding="utf-8")
+            writer = csv.writer(f)
+            writer.writerow(["index", "time", "description"])
+            entry = self._open[key] = (f, writer, path)
+        entry[1].writerow([bell.index, bell.hhmm, bell.description])
+
+    def close(self, commit: bool) -> Dict[Tuple[str, str], str]:
+        files = {}
+        for key, (f, _, path) in self._open.items():
+            f.close()
+            if commit:
+                os.replace(path + ".tmp", path)
+                files[key] = path
+            else:
+                os.remove(path + ".tmp")
+        self._open.clear()
+        return files
+
+
+def import_schedules(stream: TextIO, out_dir: str, default_zone: str = "",
+                     max_errors: int = 100) -> ImportReport:
+    """CSV 스트림을 구역·요일별 스케줄 파일로 가져옵니다. 잘못된 줄은 report.errors에 기록됩니다."""
+    os.makedirs(out_dir, exist_ok=True)
+    report = ImportReport(max_errors)
+    writers = _ZoneWriters(out_dir)
+    committed = False
+
+    def counted(rows):
+        for row in rows:
+            report.rows += 1
+            yield row
+
+    try:
+        for record in dedupe_bells(parse_rows(counted(read_rows(stream)), default_zone), report):
+            if isinstance(record, RowError):
+                report.add_error(record)
+            else:
+                writers.write(record)
+                report.bells += 1
+        committed = True
+    finally:
+        report.files = writers.close(committed)
+    return report
+
+
+def import_file(path: str, out_dir: str, default_zone: str = "", max_errors: int = 100) -> ImportReport:
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        return import_schedules(f, out_dir, default_zone, max_errors)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="여러 사이트의 스케줄 CSV를 구역별 스케줄 파일로 가져옵니다")
+    parser.add_argument("csv", help="가져올 CSV (site/zone, schedule, index, time, description 열)")
+    parser.add_argument("--out", default="schedules", help="출력 폴더 (기본 schedules)")
+    parser.add_argument("--zone", default="", help="site/zone 열이 없을 때 쓸 구역 이름")
+    parser.add_argument("--max-errors", type=int, default=100, help="출력할 최대 오류 수 (기본 100)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    report = import_file(args.csv, args.out, args.zone, args.max_errors)
+    for error in report.errors:
+        print(f"{error.line}번째 줄: {error.message}")
+    if report.error_count > len(report.errors):
+        print(f"그 외 오류 {report.error_count - len(report.errors)}건")
+    print(f"{report.rows}줄 중 종 {report.bells}개, 구역 파일 {len(report.files)}개 "
+          f"(중복 {report.duplicates}줄, 오류 {report.error_count}줄)")
+    if report.files:
+        print("config.yaml에 추가할 구역:")
+        print(yaml.safe_dump({"zones": report.zones_config()}, allow_unicode=True, sort_keys=False))
+    return 1 if report.error_count else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,179 @@
+"""
+스케줄 충돌 검사 (재생 길이 고려)
+
+종마다 (시작 시각, 사운드 길이)를 구간으로 만들어 시작 시각으로 정렬한 뒤 한 번 훑어
+(sort-and-sweep, O(n log n)) 다음 종이 울릴 때 아직 앞 종의 소리가 재생 중인 경우와
+사운드 파일이 없는 종을 찾습니다. 재생은 구역마다 따로 이루어지므로 겹침은 같은 구역
+안에서만 봅니다. 여러 구역 × 여러 주의 계획도 바로 검사할 수 있습니다.
+
+시작할 때와 스케줄을 바꿀 때 실행해, 실제로 소리가 겹치기 전에 문제를 알려 줍니다.
+bell_player의 schedule.csv도 명령줄로 검사할 수 있습니다:
+
+    python schedule_validator.py --csv ../bell_player/schedule.csv --sounds-dir D:\\bell\\sounds
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import logging
+import os
+import threading
+from datetime import date, datetime
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from timeline import ScheduleItem, compile_day, parse_schedule_items
+
+
+class PlannedSound(NamedTuple):
+    """검사할 종 하나 (재생 구간)"""
+    zone: str
+    job_id: str
+    start: datetime
+    index: int
+    path: Optional[str]  # 사운드 파일이 없으면 None
+    duration: Optional[float]  # 길이를 알 수 없으면 None
+
+
+class ScheduleIssue(NamedTuple):
+    """검사에서 찾은 문제"""
+    kind: str  # "overlap" 또는 "missing"
+    zone: str
+    job_id: str
+    at: datetime
+    index: int
+    message: str
+    other_index: Optional[int] = None
+    overlap_seconds: float = 0.0
+
+
+def find_overlaps(sounds: Iterable[PlannedSound]) -> List[ScheduleIssue]:
+    """다음 종이 시작할 때 같은 구역의 앞 종이 아직 재생 중인 경우를 찾습니다.
+
+    시작 시각으로 정렬한 뒤 구역마다 '가장 늦게 끝나는 재생 중인 종' 하나만 들고 훑으므로
+    정렬 O(n log n) + 훑기 O(n)입니다.
+    """
+    ordered = sorted((s for s in sounds if s.path is not None),
+                     key=lambda s: (s.start, s.index))
+    active: Dict[str, Tuple[float, PlannedSound]] = {}  # 구역 → (끝나는 시각, 종)
+    issues: List[ScheduleIssue] = []
+    for sound in ordered:
+        start = sound.start.timestamp()
+        current = active.get(sound.zone)
+        if current is not None and start < current[0]:
+            end, playing = current
+            overlap = end - start
+            issues.append(ScheduleIssue(
+                "overlap", sound.zone, sound.job_id, sound.start, sound.index,
+                f"{playing.start:%m-%d %H:%M} 종 {playing.index}번({playing.duration:.1f}초)이 "
+                f"{sound.start:%H:%M} 종 {sound.index}번 시작 후에도 {overlap:.1f}초 더 재생됩니다",
+                playing.index, overlap))
+        if sound.duration is not None:
+            end = start + sound.duration
+            if current is None or end > current[0]:
+                active[sound.zone] = (end, sound)
+    return issues
+
+
+def find_missing(sounds: Iterable[PlannedSound]) -> List[ScheduleIssue]:
+    """사운드 파일이 없는 종"""
+    return [
+        ScheduleIssue("missing", s.zone, s.job_id, s.start, s.index,
+                      f"{s.start:%m-%d %H:%M} 종 {s.index}번의 사운드 파일이 없습니다")
+        for s in sounds if s.path is None
+    ]
+
+
+def validate_plan(sounds: Sequence[PlannedSound]) -> List[ScheduleIssue]:
+    """누락 파일과 재생 겹침을 시각 순서로 반환합니다."""
+    issues = find_missing(sounds) + find_overlaps(sounds)
+    issues.sort(key=lambda i: (i.at, i.zone, i.index))
+    return issues
+
+
+def plan_day(day: date, items: Sequence[ScheduleItem], zone, path_for: Callable[[int], Optional[str]],
+             duration_for: Callable[[str], Optional[float]], zone_name: str = "") -> List[PlannedSound]:
+    """하루치 스케줄을 검사용 재생 구간으로 변환합니다 (같은 인덱스의 파일은 한 번만 찾음)."""
+    paths: Dict[int, Optional[str]] = {}
+    sounds = []
+    for entry in compile_day(day, items, zone, zone_name):
+        if entry.index not in paths:
+            paths[entry.index] = path_for(entry.index)
+        path = paths[entry.index]
+        duration = duration_for(path) if path is not None else None
+        sounds.append(PlannedSound(zone_name, entry.job_id, entry.run_at, entry.index, path, duration))
+    return sounds
+
+
+class DurationCache:
+    """파일별 재생 길이 캐시 ((경로, 수정 시각, 크기)가 같으면 다시 측정하지 않음)"""
+
+    def __init__(self, probe: Callable[[str], Optional[float]]):
+        self._probe = probe
+        self._cache: Dict[str, Tuple[Tuple[int, int], Optional[float]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, path: str) -> Optional[float]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        key = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            cached = self._cache.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        duration = self._probe(path)
+        with self._lock:
+            self._cache[path] = (key, duration)
+        return duration
+
+
+def read_schedule_csv(path: str) -> List[ScheduleItem]:
+    """bell_player 형식의 schedule.csv (index,time[,description])를 읽습니다."""
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        rows = [(row["index"], str(row["time"]).strip().zfill(4), row.get("description") or "")
+                for row in csv.DictReader(f)]
+    return parse_schedule_items(rows)
+
+
+def log_issues(issues: Sequence[ScheduleIssue], limit: int = 20) -> None:
+    """문제를 경고 로그로 남깁니다 (많으면 앞의 limit개만)."""
+    for issue in issues[:limit]:
+        zone = f"[{issue.zone}] " if issue.zone else ""
+        logging.warning(f"스케줄 검사: {zone}{issue.message}")
+    if len(issues) > limit:
+        logging.warning(f"스케줄 검사: 그 외 {len(issues) - limit}건")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="종 스케줄의 재생 겹침과 누락 파일을 검사합니다")
+    parser.add_argument("--csv", help="bell_player 형식의 schedule.csv (index,time)")
+    parser.add_argument("--sounds-dir", help="사운드 폴더 (기본: config.yaml의 sounds_dir)")
+    parser.add_argument("--days", type=int, default=7, help="검사할 일수 (기본 7)")
+    args = parser.parse_args(argv)
+
+    import app  # 명령줄에서만 필요 (app이 이 모듈을 import함)
+
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    config = app.load_config()
+    if args.sounds_dir:
+        config["sounds_dir"] = config["sounds_dir_sunday"] = args.sounds_dir
+    if args.csv:
+        items = read_schedule_csv(args.csv)
+        zone = app.get_tz(config.get("timezone", "Asia/Seoul"))
+        sounds_dir = app.get_sounds_dir(config)
+        sounds = plan_day(datetime.now(tz=zone).date(), items, zone,
+                          lambda idx: app._find_sound_in_dir(idx, sounds_dir, config), app.sound_durations.get)
+        issues = validate_plan(sounds)
+    else:
+        issues = app.validate_schedule(config, days=args.days)
+    for issue in issues:
+        zone = f"[{issue.zone}] " if issue.zone else ""
+        print(f"{issue.kind:8} {zone}{issue.message}")
+    print(f"문제 {len(issues)}건")
+    return 1 if issues else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,167 @@
+"""
+가상 시계 스케줄 시뮬레이터
+
+실제 앱과 같은 스케줄 경로(schedule_timeline, schedule_next_day_refresh, is_sunday,
+get_sounds_dir_for_day, fire_bell)를 가상 시계와 무음 오디오 출력으로 실행합니다.
+다음 작업 시각으로 바로 건너뛰므로 몇 달치 운영을 몇 초 만에 재현하고, 어떤 종이
+언제 어느 폴더의 어떤 파일로 울렸는지 정확한 발사 로그를 남깁니다.
+
+사용 예:
+    python simulator.py --start 2025-10-27 --days 90
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+from datetime import datetime, timedelta
+from typing import List, NamedTuple, Optional
+
+import app
+from heap_scheduler import HeapJob, HeapScheduler
+
+
+class VirtualClock:
+    """직접 앞으로 돌리는 시계 (시간대 포함 datetime)"""
+
+    def __init__(self, start: datetime):
+        if start.tzinfo is None:
+            raise ValueError("가상 시계 시작 시각에는 시간대가 필요합니다")
+        self._now = start
+
+    def now(self) -> datetime:
+        return self._now
+
+    def set(self, when: datetime) -> None:
+        if when < self._now:
+            raise ValueError(f"가상 시계는 뒤로 갈 수 없습니다: {when} < {self._now}")
+        self._now = when
+
+    def advance(self, seconds: float) -> None:
+        self.set(self._now + timedelta(seconds=seconds))
+
+
+class FireRecord(NamedTuple):
+    """발사 로그 한 줄"""
+    at: datetime
+    job_id: Optional[str]
+    index: int
+    sounds_dir: str
+    path: Optional[str]  # 사운드 파일이 없으면 None
+
+    def to_line(self) -> str:
+        return (f"{self.at:%Y-%m-%d %a %H:%M:%S} {self.job_id or '-'} index={self.index:02d} "
+                f"dir={self.sounds_dir} file={self.path or '(없음)'}")
+
+
+class SimulatedScheduler(HeapScheduler):
+    """타이머 스레드 없이 가상 시계로 작업을 순서대로 실행하는 HeapScheduler"""
+
+    def __init__(self, clock: VirtualClock, timezone=None):
+        super().__init__(timezone=timezone or clock.now().tzinfo)
+        self.clock = clock
+        self.current_job_id: Optional[str] = None
+
+    def _resolve_run_date(self, trigger, run_date):
+        if run_date is None and (trigger is None or isinstance(trigger, str)):
+            run_date = self.clock.now()
+        return super()._resolve_run_date(trigger, run_date)
+
+    def start(self, paused: bool = False) -> None:
+        self._paused = paused
+        self._running = True
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._running = False
+
+    def run_until(self, end: datetime) -> int:
+        """end까지 작업을 실행 시각 순서대로 실행하고 실행한 작업 수를 반환합니다."""
+        executed = 0
+        end_ts = end.timestamp()
+        while self._running:
+            due, next_at = self._pop_due(self.clock.now().timestamp())
+            for job in due:
+                self._run_inline(job)
+                executed += 1
+            if due:
+                continue
+            if next_at is None or next_at > end_ts:
+                break
+            self.clock.set(datetime.fromtimestamp(next_at, tz=self.timezone))
+        if end > self.clock.now():
+            self.clock.set(end.astimezone(self.timezone))
+        return executed
+
+    def _run_inline(self, job: HeapJob) -> None:
+        self.current_job_id = job.id
+        try:
+            self._execute(job)
+        finally:
+            self.current_job_id = None
+
+
+class InlineZoneDispatcher:
+    """구역별 재생을 작업자 스레드 대신 가상 시계 위에서 바로 실행"""
+
+    def submit(self, zone_name: str, func, *args) -> None:
+        func(*args)
+
+    def clear(self) -> int:
+        return 0
+
+
+def simulate(config: dict, start: datetime, end: datetime) -> List[FireRecord]:
+    """start부터 end까지 config로 운영했을 때의 발사 로그를 반환합니다.
+
+    오프셋 보정과 정밀 발사는 실제 시계에 관한 기능이므로 끄고 실행하며,
+    실제 운영 기록이 섞이지 않도록 상태 저장소도 쓰지 않습니다.
+    """
+    zone = app.get_tz(config.get("timezone", "Asia/Seoul"))
+    config = dict(config, test_mode=False, offset_corrected_firing=False, precision_firing=False)
+    start = start.replace(tzinfo=zone) if start.tzinfo is None else start.astimezone(zone)
+    end = end.replace(tzinfo=zone) if end.tzinfo is None else end.astimezone(zone)
+
+    clock = VirtualClock(start)
+    sched = SimulatedScheduler(clock, zone)
+    fired: List[FireRecord] = []
+
+    def null_sink(index: int, sounds_dir: str, path: Optional[str]) -> None:
+        fired.append(FireRecord(clock.now(), sched.current_job_id, index, sounds_dir, path))
+
+    app.set_virtual_clock(clock.now)
+    app.set_audio_sink(null_sink)
+    real_dispatcher, app.zone_dispatcher = app.zone_dispatcher, InlineZoneDispatcher()
+    real_store, app._state_store = app._state_store, None
+    try:
+        app.schedule_timeline(sched, config, zone)
+        if bool(config.get("autoplay_next_day", True)):
+            app.schedule_next_day_refresh(sched, config, zone)
+        sched.start()
+        sched.run_until(end)
+    finally:
+        app.set_virtual_clock(None)
+        app.set_audio_sink(None)
+        app.zone_dispatcher = real_dispatcher
+        app._state_store = real_store
+        sched.shutdown()
+    return fired
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="가상 시계로 종 스케줄을 빠르게 재현합니다")
+    parser.add_argument("--start", required=True, help="시작 시각 (예: 2025-10-27 또는 2025-10-27T23:00)")
+    parser.add_argument("--days", type=float, default=7, help="시뮬레이션 일수 (기본 7)")
+    parser.add_argument("--config", default=app.CONFIG_YAML, help="설정 파일 경로")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    config = app.load_config(args.config)
+    start = datetime.fromisoformat(args.start)
+    records = simulate(config, start, start + timedelta(days=args.days))
+    for record in records:
+        print(record.to_line())
+    print(f"총 {len(records)}회 발사")
+
+
+if __name__ == "__main__":
+    main()
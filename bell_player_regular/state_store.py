@@ -0,0 +1,173 @@
+"""
+SQLite 상태 저장소 (재시작 시 빠른 복원)
+
+app.py나 GUI를 다시 시작해도 이전 상태를 이어가도록 로컬 SQLite 파일에 다음을 저장합니다.
+
+- 날짜별로 컴파일한 종 계획 (구역, 날짜, 스케줄 지문) — 지문이 같으면 다시 컴파일하지 않음
+- 종별 상태 (fired: 재생함, missed: 놓침) — 유예 시간 안에 재시작해도 같은 종을 두 번 울리지 않음
+- 마지막 시간 동기화 상태 (오프셋, 드리프트)
+
+모든 조회는 인덱스가 있는 키(job_id, (구역, 날짜), 날짜)로 하며, 한 연결을 잠금으로
+공유합니다. WAL 모드라 쓰는 중에도 읽기가 막히지 않습니다.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from timeline import TimelineEntry
+
+SCHEMA_VERSION = 1
+
+FIRED = "fired"
+MISSED = "missed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS plan_days (
+    zone TEXT NOT NULL,
+    day TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    compiled_at REAL NOT NULL,
+    PRIMARY KEY (zone, day)
+);
+CREATE TABLE IF NOT EXISTS plan_entries (
+    job_id TEXT PRIMARY KEY,
+    zone TEXT NOT NULL,
+    day TEXT NOT NULL,
+    run_at REAL NOT NULL,
+    idx INTEGER NOT NULL,
+    hhmm TEXT NOT NULL,
+    description TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS plan_entries_zone_day ON plan_entries (zone, day, run_at);
+CREATE TABLE IF NOT EXISTS bell_state (
+    job_id TEXT PRIMARY KEY,
+    day TEXT NOT NULL,
+    state TEXT NOT NULL,
+    run_at REAL,
+    at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS bell_state_day ON bell_state (day, state);
+CREATE TABLE IF NOT EXISTS kv (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+
+class StateStore:
+    """종 계획/상태/동기화 상태를 저장하는 SQLite 파일"""
+
+    def __init__(self, path: str):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version not in (0, SCHEMA_VERSION):
+                raise sqlite3.DatabaseError(f"지원하지 않는 상태 저장소 버전: {version}")
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ----- 컴파일된 계획 -----
+
+    def load_day(self, zone_name: str, day: date, fingerprint: str, tz) -> Optional[List[TimelineEntry]]:
+        """저장된 하루치 계획 (없거나 스케줄 지문이 다르면 None)"""
+        key = day.isoformat()
+        with self._lock:
+            row = self._conn.execute("SELECT fingerprint FROM plan_days WHERE zone = ? AND day = ?",
+                                     (zone_name, key)).fetchone()
+            if row is None or row[0] != fingerprint:
+                return None
+            rows = self._conn.execute(
+                "SELECT job_id, run_at, idx, hhmm, description FROM plan_entries "
+                "WHERE zone = ? AND day = ? ORDER BY run_at", (zone_name, key)).fetchall()
+        return [TimelineEntry(job_id, datetime.fromtimestamp(run_at, tz=tz), idx, hhmm, description)
+                for job_id, run_at, idx, hhmm, description in rows]
+
+    def save_day(self, zone_name: str, day: date, fingerprint: str, entries: Iterable[TimelineEntry]) -> None:
+        """하루치 계획을 (기존 것을 교체해) 저장합니다."""
+        key = day.isoformat()
+        rows = [(e.job_id, zone_name, key, e.run_at.timestamp(), e.index, e.hhmm, e.description)
+                for e in entries]
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN")
+            self._conn.execute("DELETE FROM plan_entries WHERE zone = ? AND day = ?", (zone_name, key))
+            self._conn.executemany("INSERT OR REPLACE INTO plan_entries VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            self._conn.execute("INSERT OR REPLACE INTO plan_days VALUES (?, ?, ?, ?)",
+                               (zone_name, key, fingerprint, time.time()))
+
+    # ----- 종 상태 -----
+
+    def mark(self, job_id: str, day: date, state: str, run_at: Optional[float] = None) -> bool:
+        """종 상태를 기록합니다. fired는 처음 기록할 때만 True (이미 재생한 종이면 False)."""
+        with self._lock:
+            if state == FIRED:
+                cur = self._conn.execute(
+                    "INSERT INTO bell_state VALUES (?, ?, ?, ?, ?) ON CONFLICT(job_id) DO UPDATE SET "
+                    "state = excluded.state, at = excluded.at WHERE bell_state.state != 'fired'",
+                    (job_id, day.isoformat(), state, run_at, time.time()))
+            else:
+                cur = self._conn.execute("INSERT OR IGNORE INTO bell_state VALUES (?, ?, ?, ?, ?)",
+                                         (job_id, day.isoformat(), state, run_at, time.time()))
+            return cur.rowcount > 0
+
+    def state_of(self, job_id: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT state FROM bell_state WHERE job_id = ?", (job_id,)).fetchone()
+        return row[0] if row else None
+
+    def states_for_day(self, day: date) -> Dict[str, str]:
+        """해당 날짜의 {job_id: 상태}"""
+        with self._lock:
+            rows = self._conn.execute("SELECT job_id, state FROM bell_state WHERE day = ?",
+                                      (day.isoformat(),)).fetchall()
+        return dict(rows)
+
+    def fired_for_day(self, day: date) -> Set[str]:
+        return {job_id for job_id, state in self.states_for_day(day).items() if state == FIRED}
+
+    # ----- 기타 상태 -----
+
+    def put(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO kv VALUES (?, ?, ?)",
+                               (key, json.dumps(value, ensure_ascii=False), time.time()))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM kv WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return default
+        try:
+            return json.loads(row[0])
+        except ValueError:
+            logging.warning(f"상태 저장소 값이 손상되어 무시합니다: {key}")
+            return default
+
+    def prune(self, before: date, keep_state_days: int = 0) -> int:
+        """before 이전 날짜의 계획과 (keep_state_days일 더 지난) 종 상태를 지우고 지운 행 수를 반환합니다."""
+        plan_key = before.isoformat()
+        state_key = date.fromordinal(before.toordinal() - keep_state_days).isoformat()
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN")
+            removed = self._conn.execute("DELETE FROM plan_entries WHERE day < ?", (plan_key,)).rowcount
+            removed += self._conn.execute("DELETE FROM plan_days WHERE day < ?", (plan_key,)).rowcount
+            removed += self._conn.execute("DELETE FROM bell_state WHERE day < ?", (state_key,)).rowcount
+        return removed
@@ -0,0 +1,44 @@
+"""
+테스트용 가짜 시계
+
+ClockWatch가 읽는 세 시계를 직접 조작합니다:
+    wall    벽시계 (time.time, 사용자가 바꾸거나 동기화로 점프할 수 있음)
+    steady  절전 중에도 흐르는 단조 시계
+    awake   깨어 있는 동안만 흐르는 단조 시계
+
+사용 예:
+    clocks = FakeClocks()
+    watch = clocks.clock_watch(resume_threshold_seconds=10.0)
+    clocks.sleep(1800)
+"""
+
+from clock_watch import ClockWatch
+
+
+class FakeClocks:
+    """벽시계, 절전 포함 시계(steady), 깨어 있는 동안만 흐르는 시계(awake)"""
+
+    def __init__(self):
+        self.wall = 1_000_000.0
+        self.steady = 100.0
+        self.awake = 50.0
+
+    def run(self, seconds):
+        """깨어 있는 채로 시간이 흐름 (세 시계 모두 진행)"""
+        self.wall += seconds
+        self.steady += seconds
+        self.awake += seconds
+
+    def sleep(self, seconds):
+        """절전 중 시간이 흐름 (awake는 멈춤)"""
+        self.wall += seconds
+        self.steady += seconds
+
+    def step(self, seconds):
+        """벽시계만 점프 (시계 변경/동기화)"""
+        self.wall += seconds
+
+    def clock_watch(self, **kwargs) -> ClockWatch:
+        """이 시계들을 읽는 ClockWatch"""
+        return ClockWatch(wall_clock=lambda: self.wall, steady=lambda: self.steady,
+                          awake_clock=lambda: self.awake, **kwargs)
@@ -0,0 +1,211 @@
+"""
+테스트/벤치마크용 로컬 가짜 시간 서버
+
+실제 인터넷 없이 시간 동기화 동작을 검증할 수 있도록 127.0.0.1에서 동작하는
+NTP(UDP) 서버와 WorldTimeAPI 형식의 HTTP 서버를 제공합니다. 응답 지연(delay),
+지터(jitter), 시계 오프셋(offset), 응답 누락 비율(drop_rate)을 설정할 수 있습니다.
+
+사용 예:
+    with FakeNTPServer(offset=1.5, delay=0.02) as ntp:
+        sample = get_ntp_sample([ntp.address], deadline=1.0)
+"""
+
+import json
+import random
+import socket
+import struct
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 1900-01-01 (NTP 기준)과 1970-01-01 (Unix 기준) 사이의 초
+NTP_EPOCH_DELTA = 2208988800
+NTP_PACKET_FORMAT = "!B B B b 11I"
+
+
+def _to_ntp_parts(unix_time: float):
+    ntp_time = unix_time + NTP_EPOCH_DELTA
+    seconds = int(ntp_time)
+    fraction = int((ntp_time - seconds) * 2 ** 32) & 0xFFFFFFFF
+    return seconds, fraction
+
+
+class _FakeServerBase:
+    """지연/지터/오프셋/누락 설정을 공유하는 가짜 서버의 공통 부분"""
+
+    def __init__(self, offset: float = 0.0, delay: float = 0.0, jitter: float = 0.0,
+                 drop_rate: float = 0.0, seed=None):
+        self.offset = float(offset)
+        self.delay = float(delay)
+        self.jitter = float(jitter)
+        self.drop_rate = float(drop_rate)
+        self.requests = 0
+        self.dropped = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _next_delay(self) -> float:
+        with self._lock:
+            return max(0.0, self.delay + self._random.uniform(-self.jitter, self.jitter))
+
+    def _should_drop(self) -> bool:
+        with self._lock:
+            self.requests += 1
+            if self.drop_rate > 0 and self._random.random() < self.drop_rate:
+                self.dropped += 1
+                return True
+            return False
+
+    def server_time(self) -> float:
+        """가짜 서버가 알려주는 '정확한' 시간 (로컬 시간 + offset)"""
+        return time.time() + self.offset
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+class FakeNTPServer(_FakeServerBase):
+    """127.0.0.1에서 동작하는 최소한의 NTP(v3/v4) 서버"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._sock = None
+        self._thread = None
+        self._stop_event = threading.Event()
+        self.port = 0
+
+    @property
+    def address(self) -> str:
+        """get_ntp_sample/ntp_servers에 넣을 수 있는 'host:port' 문자열"""
+        return f"127.0.0.1:{self.port}"
+
+    def start(self) -> None:
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._sock.bind(("127.0.0.1", 0))
+        self._sock.settimeout(0.1)
+        self.port = self._sock.getsockname()[1]
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._serve, name="fake-ntp", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+        if self._sock is not None:
+            self._sock.close()
+
+    def _serve(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                data, addr = self._sock.recvfrom(512)
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+            if len(data) < 48 or self._should_drop():
+                continue
+            # 요청마다 스레드를 분리해 지연이 다른 요청을 막지 않도록 함
+            threading.Thread(target=self._reply, args=(data, addr), daemon=True).start()
+
+    def _reply(self, data: bytes, addr) -> None:
+        one_way = self._next_delay() / 2.0
+        time.sleep(one_way)  # 요청이 서버에 도착하기까지
+        version = (data[0] >> 3) & 0x7 or 3
+        orig_hi, orig_lo = struct.unpack("!II", data[40:48])
+        now_hi, now_lo = _to_ntp_parts(self.server_time())
+        packet = struct.pack(
+            NTP_PACKET_FORMAT,
+            (0 << 6) | (version << 3) | 4,  # leap=0, mode=4(server)
+            1,  # stratum
+            4,  # poll
+            -20,  # precision
+            0,  # root delay
+            int(0.001 * 2 ** 16),  # root dispersion (1ms)
+            0x4C4F434C,  # ref id "LOCL"
+            now_hi, now_lo,  # reference
+            orig_hi, orig_lo,  # originate = 클라이언트 전송 시각
+            now_hi, now_lo,  # receive
+            now_hi, now_lo,  # transmit
+        )
+        time.sleep(one_way)  # 응답이 클라이언트에 도착하기까지
+        try:
+            self._sock.sendto(packet, addr)
+        except OSError:
+            pass
+
+
+class FakeWorldTimeServer(_FakeServerBase):
+    """WorldTimeAPI(/api/timezone/...) 형식의 JSON을 돌려주는 HTTP 서버
+
+    drop_rate에 걸린 요청은 응답 없이 연결을 끊습니다. chunked=True면 본문을
+    Transfer-Encoding: chunked로 나눠 보냅니다.
+    """
+
+    def __init__(self, utc_offset_hours: int = 9, chunked: bool = False, **kwargs):
+        super().__init__(**kwargs)
+        self.utc_offset_hours = utc_offset_hours
+        self.chunked = chunked
+        self._httpd = None
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/api/timezone/Asia/Seoul"
+
+    def start(self) -> None:
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                if fake._should_drop():
+                    self.close_connection = True
+                    return
+                one_way = fake._next_delay() / 2.0
+                time.sleep(one_way)
+                zone = timezone(timedelta(hours=fake.utc_offset_hours))
+                now = datetime.fromtimestamp(fake.server_time(), tz=zone)
+                body = json.dumps({
+                    "datetime": now.isoformat(),
+                    "unixtime": int(now.timestamp()),
+                    "utc_offset": now.strftime("%z"),
+                }).encode("utf-8")
+                time.sleep(one_way)
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                if fake.chunked:
+                    self.send_header("Transfer-Encoding", "chunked")
+                    self.end_headers()
+                    half = len(body) // 2
+                    for chunk in (body[:half], body[half:]):
+                        self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+                    self.wfile.write(b"0\r\n\r\n")
+                    return
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever,
+                                        kwargs={"poll_interval": 0.05},
+                                        name="fake-worldtime", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
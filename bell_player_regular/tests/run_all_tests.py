@@ -23,7 +23,26 @@ def run_all_tests():
     test_modules = [
         'test_config',
         'test_time_handling', 
-        'test_resource_management'
+        'test_resource_management',
+        'test_time_sync',
+        'test_clock_watch',
+        'test_time_sync_integration',
+        'test_time_sync_async',
+        'test_heap_scheduler',
+        'test_timeline',
+        'test_job_planner',
+        'test_precise_timing',
+        'test_week_index',
+        'test_simulator',
+        'test_zones',
+        'test_timer_wheel',
+        'test_recurrence',
+        'test_holiday_calendar',
+        'test_resume_catchup',
+        'test_state_store',
+        'test_schedule_validator',
+        'test_schedule_files',
+        'test_schedule_import',
     ]
     
     print("=" * 60)
@@ -0,0 +1,140 @@
+"""
+시계 점프 감지 및 작업 재조정 테스트
+"""
+
+import unittest
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# 부모 디렉토리를 경로에 추가하여 app 모듈을 import 가능하게 함
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from apscheduler.schedulers.background import BackgroundScheduler
+
+import app
+from app import get_tz, shift_pending_jobs, schedule_timeline, retime_for_offset
+from fake_clocks import FakeClocks
+from time_sync import TimeSample, TimeSyncService
+
+
+class TestClockWatch(unittest.TestCase):
+    """ClockWatch 테스트"""
+
+    def setUp(self):
+        self.clocks = FakeClocks()
+        self.jumps = []
+        self.watch = self.clocks.clock_watch(threshold_seconds=2.0)
+        self.watch.add_listener(self.jumps.append)
+
+    def test_no_jump_when_clocks_advance_together(self):
+        """두 시계가 함께 흐르면 점프 없음"""
+        self.clocks.run(10)
+        self.assertEqual(self.watch.check(), 0.0)
+        self.assertEqual(self.jumps, [])
+
+    def test_forward_and_backward_jump(self):
+        """벽시계만 움직이면 점프 크기를 알림"""
+        self.clocks.step(3600)
+        self.assertAlmostEqual(self.watch.check(), 3600)
+        self.clocks.step(-5)
+        self.assertAlmostEqual(self.watch.check(), -5)
+        self.assertEqual(len(self.jumps), 2)
+
+    def test_small_slew_is_absorbed(self):
+        """임계값 미만의 변화는 누적되지 않음"""
+        for _ in range(10):
+            self.clocks.step(0.5)
+            self.assertEqual(self.watch.check(), 0.0)
+        self.assertEqual(self.jumps, [])
+
+
+class TestJumpHandling(unittest.TestCase):
+    """점프 발생 시 오프셋/작업 보정 테스트"""
+
+    def test_time_sync_absorbs_clock_step(self):
+        """로컬 시계가 점프해도 보정된 시간은 연속"""
+        service = TimeSyncService([])
+        service.record_sample(TimeSample(offset=5.0, delay=0.01, source="a"))
+        service.apply_clock_step(5.0)  # 로컬 시계가 5초 앞으로 보정됨
+        self.assertAlmostEqual(service.predict_offset(), 0.0, places=3)
+
+    def test_shift_only_pending_bell_jobs(self):
+        """종 작업만 이동하고 다른 작업은 유지"""
+        zone = get_tz("Asia/Seoul")
+        sched = BackgroundScheduler(timezone=zone)
+        sched.start(paused=True)
+        try:
+            run_at = datetime.now(tz=zone) + timedelta(hours=1)
+            sched.add_job(print, "date", run_date=run_at, id="bell-1")
+            sched.add_job(print, "date", run_date=run_at, id="daily-refresh")
+
+            moved = shift_pending_jobs(sched, 3600)
+
+            self.assertEqual(moved, 1)
+            self.assertEqual(sched.get_job("bell-1").next_run_time, run_at + timedelta(hours=1))
+            self.assertEqual(sched.get_job("daily-refresh").next_run_time, run_at)
+        finally:
+            sched.shutdown(wait=False)
+
+
+class TestOffsetCorrectedFiring(unittest.TestCase):
+    """오프셋 보정 발사 테스트"""
+
+    def setUp(self):
+        self.zone = get_tz("Asia/Seoul")
+        self.service = TimeSyncService([])
+        self.service.record_sample(TimeSample(offset=2.0, delay=0.01, source="a"))
+        self.patches = [
+            patch('app.time_sync', self.service),
+            # 오늘 종이 모두 미래가 되도록 오늘 자정으로 고정
+            patch('app.get_current_time', return_value=datetime.combine(date.today(), datetime.min.time())),
+            patch('app.schedule_for_date', return_value=[(1, "12:00", "시작종")]),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+
+    def test_fire_time_is_offset_corrected(self):
+        """로컬 시계가 2초 느리면 로컬 기준 2초 일찍 발사"""
+        sched = MagicMock()
+        config = {"offset_corrected_firing": True, "timeline_days": 1}
+        schedule_timeline(sched, config, self.zone)
+
+        run_date = sched.add_job.call_args.kwargs["run_date"]
+        nominal = app.hhmm_to_today("12:00", self.zone)
+        self.assertEqual(nominal - run_date, timedelta(seconds=2))
+
+    def test_correction_can_be_disabled(self):
+        """offset_corrected_firing=false면 로컬 시각 그대로 사용"""
+        sched = MagicMock()
+        schedule_timeline(sched, {"offset_corrected_firing": False, "timeline_days": 1}, self.zone)
+
+        run_date = sched.add_job.call_args.kwargs["run_date"]
+        self.assertEqual(run_date, app.hhmm_to_today("12:00", self.zone))
+
+    def test_retime_only_beyond_tolerance(self):
+        """오프셋 변화가 허용 오차를 넘을 때만 대기 작업 재조정"""
+        sched = BackgroundScheduler(timezone=self.zone)
+        sched.start(paused=True)
+        try:
+            schedule_timeline(sched, {"offset_corrected_firing": True, "timeline_days": 1,
+                                      "offset_retime_tolerance_seconds": 0.5}, self.zone)
+            job_id = f"bell-{date.today():%Y%m%d}-1"
+            before = sched.get_job(job_id).next_run_time
+
+            self.assertEqual(retime_for_offset(sched, 2.2), 0)
+            self.assertEqual(retime_for_offset(sched, 3.0), 1)
+            self.assertEqual(sched.get_job(job_id).next_run_time, before - timedelta(seconds=1))
+        finally:
+            sched.shutdown(wait=False)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -113,6 +113,24 @@ class TestConfigValidation(unittest.TestCase):
         result = validate_config(config)
         self.assertEqual(result["sound_ext"], "mp3")  # 기본값으로 수정됨
 
+    def test_validate_ntp_servers(self):
+        """NTP 서버 목록 검증 테스트"""
+        config = {"ntp_servers": ["a.example", " b.example ", ""]}
+        result = validate_config(config)
+        self.assertEqual(result["ntp_servers"], ["a.example", "b.example"])
+
+        config = {"ntp_servers": []}
+        result = validate_config(config)
+        self.assertEqual(result["ntp_servers"], DEFAULT_CONFIG["ntp_servers"])
+
+    def test_validate_ntp_deadline(self):
+        """NTP 전체 마감 시간 검증 테스트"""
+        result = validate_config({"ntp_deadline_seconds": 1.5})
+        self.assertEqual(result["ntp_deadline_seconds"], 1.5)
+
+        result = validate_config({"ntp_deadline_seconds": 100})
+        self.assertEqual(result["ntp_deadline_seconds"], 3.0)
+
 
 class TestConfigLoading(unittest.TestCase):
     """설정 로드 함수 테스트"""
@@ -0,0 +1,156 @@
+"""
+힙 기반 스케줄러 엔진 테스트
+"""
+
+import unittest
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 부모 디렉토리를 경로에 추가하여 app 모듈을 import 가능하게 함
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+from app import create_scheduler, get_tz, shift_pending_jobs, validate_config
+from heap_scheduler import ConflictingIdError, HeapScheduler, JobLookupError
+
+
+class TestHeapSchedulerJobs(unittest.TestCase):
+    """작업 관리 API 테스트 (APScheduler 호환)"""
+
+    def setUp(self):
+        self.zone = get_tz("Asia/Seoul")
+        self.sched = HeapScheduler(timezone=self.zone)
+        self.base = datetime.now(tz=self.zone) + timedelta(hours=1)
+
+    def test_get_jobs_sorted_by_run_time(self):
+        """get_jobs는 실행 시각 순서로 반환"""
+        self.sched.add_job(print, "date", run_date=self.base + timedelta(minutes=5), id="b")
+        self.sched.add_job(print, "date", run_date=self.base, id="a")
+        self.assertEqual([j.id for j in self.sched.get_jobs()], ["a", "b"])
+        self.assertEqual(self.sched.get_job("a").next_run_time, self.base)
+
+    def test_conflicting_id(self):
+        """replace_existing=False면 같은 id 추가 시 오류, True면 교체"""
+        self.sched.add_job(print, "date", run_date=self.base, id="bell-1")
+        with self.assertRaises(ConflictingIdError):
+            self.sched.add_job(print, "date", run_date=self.base, id="bell-1")
+        later = self.base + timedelta(minutes=1)
+        self.sched.add_job(print, "date", run_date=later, id="bell-1", replace_existing=True)
+        self.assertEqual(len(self.sched.get_jobs()), 1)
+        self.assertEqual(self.sched.get_job("bell-1").next_run_time, later)
+
+    def test_reschedule_and_remove(self):
+        """재조정과 삭제"""
+        self.sched.add_job(print, "date", run_date=self.base, id="bell-1")
+        self.sched.reschedule_job("bell-1", trigger="date", run_date=self.base + timedelta(seconds=30))
+        self.assertEqual(self.sched.get_job("bell-1").next_run_time, self.base + timedelta(seconds=30))
+        self.sched.remove_job("bell-1")
+        self.assertIsNone(self.sched.get_job("bell-1"))
+        with self.assertRaises(JobLookupError):
+            self.sched.remove_job("bell-1")
+
+    def test_naive_run_date_uses_scheduler_timezone(self):
+        """naive datetime은 스케줄러 시간대로 해석"""
+        naive = datetime(2030, 1, 1, 12, 0)
+        job = self.sched.add_job(print, "date", run_date=naive, id="x")
+        self.assertEqual(job.next_run_time, naive.replace(tzinfo=self.zone))
+
+    def test_shift_pending_jobs_works_with_heap_engine(self):
+        """시계 점프 보정이 heap 엔진에서도 동작"""
+        self.sched.add_job(print, "date", run_date=self.base, id="bell-1")
+        self.sched.add_job(print, "date", run_date=self.base, id="daily-refresh")
+        self.assertEqual(shift_pending_jobs(self.sched, 60), 1)
+        self.assertEqual(self.sched.get_job("bell-1").next_run_time, self.base + timedelta(seconds=60))
+        self.assertEqual(self.sched.get_job("daily-refresh").next_run_time, self.base)
+
+
+class TestHeapSchedulerFiring(unittest.TestCase):
+    """작업 실행 테스트"""
+
+    def setUp(self):
+        self.zone = get_tz("Asia/Seoul")
+        self.sched = HeapScheduler(timezone=self.zone)
+
+    def tearDown(self):
+        self.sched.shutdown()
+
+    def test_fires_in_order_on_time(self):
+        """작업이 순서대로 예정 시각에 실행"""
+        fired = []
+        done = threading.Event()
+
+        def record(name):
+            fired.append((name, time.time()))
+            if len(fired) == 2:
+                done.set()
+
+        now = datetime.now(tz=self.zone)
+        second = now + timedelta(milliseconds=200)
+        first = now + timedelta(milliseconds=100)
+        self.sched.start()
+        self.sched.add_job(record, "date", run_date=second, args=["second"], id="2")
+        self.sched.add_job(record, "date", run_date=first, args=["first"], id="1")
+
+        self.assertTrue(done.wait(2.0))
+        self.assertEqual([name for name, _ in fired], ["first", "second"])
+        self.assertLess(abs(fired[0][1] - first.timestamp()), 0.05)
+        self.assertEqual(self.sched.get_jobs(), [])
+
+    def test_removed_job_does_not_fire(self):
+        """삭제된 작업은 실행되지 않음"""
+        fired = threading.Event()
+        self.sched.start()
+        self.sched.add_job(fired.set, "date", run_date=datetime.now(tz=self.zone) + timedelta(milliseconds=100),
+                           id="bell-1")
+        self.sched.remove_job("bell-1")
+        self.assertFalse(fired.wait(0.3))
+
+    def test_misfired_job_is_skipped(self):
+        """유예 시간을 넘겨 늦은 작업은 건너뜀"""
+        fired = threading.Event()
+        self.sched.add_job(fired.set, "date", run_date=datetime.now(tz=self.zone) - timedelta(seconds=10),
+                           id="late", misfire_grace_time=1)
+        self.sched.start()
+        self.assertFalse(fired.wait(0.3))
+        self.assertIsNone(self.sched.get_job("late"))
+
+    def test_paused_start_holds_jobs(self):
+        """paused=True로 시작하면 작업을 실행하지 않음"""
+        fired = threading.Event()
+        self.sched.add_job(fired.set, "date", run_date=datetime.now(tz=self.zone), id="now")
+        self.sched.start(paused=True)
+        self.assertFalse(fired.wait(0.2))
+        self.sched.resume()
+        self.assertTrue(fired.wait(1.0))
+
+
+class TestEngineSelection(unittest.TestCase):
+    """scheduler_engine 설정 테스트"""
+
+    def test_create_heap_engine(self):
+        """scheduler_engine=heap이면 HeapScheduler 생성"""
+        zone = get_tz("Asia/Seoul")
+        sched = create_scheduler({"scheduler_engine": "heap"}, zone, background=True)
+        self.assertIsInstance(sched, HeapScheduler)
+        self.assertFalse(sched.blocking)
+        self.assertTrue(create_scheduler({"scheduler_engine": "heap"}, zone).blocking)
+
+    def test_invalid_engine_falls_back(self):
+        """지원하지 않는 엔진 이름은 기본값으로"""
+        self.assertEqual(validate_config({"scheduler_engine": "cron"})["scheduler_engine"], "apscheduler")
+        self.assertEqual(validate_config({"scheduler_engine": "HEAP"})["scheduler_engine"], "heap")
+
+    def test_app_import_does_not_load_apscheduler(self):
+        """app 모듈 import만으로는 APScheduler를 불러오지 않음"""
+        code = "import sys, app; print(any(m.startswith('apscheduler') for m in sys.modules))"
+        result = subprocess.run([sys.executable, "-c", code], cwd=str(parent_dir),
+                                capture_output=True, text=True, timeout=60)
+        self.assertEqual(result.stdout.strip(), "False")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+"""
+공휴일/예외 일정 달력 테스트
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import yaml
+
+# 부모 디렉토리를 경로에 추가하여 app 모듈을 import 가능하게 함
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+import app
+from app import SUNDAY_SCHEDULE, WEEKDAY_SCHEDULE, configure_holiday_calendar, get_tz, schedule_for_date
+from holiday_calendar import CalendarFile, parse_calendar
+from zones import BellZone
+
+CALENDAR_YAML = """
+schedules:
+  exam:
+  - [1, "09:00", "1교시 시험"]
+  - [2, "10:30", "2교시 시험"]
+days:
+- date: 2025-12-25
+  schedule: off
+  description: 성탄절
+- start: 2025-12-15
+  end: 2025-12-19
+  schedule: exam
+- date: 2025-12-17
+  zone: annex
+  schedule: sunday
+- date: 2025-12-18
+  bells: [[1, "13:00", "단축 수업"]]
+- date: 2025-12-20
+  schedule: nope
+"""
+
+
+class TestHolidayCalendar(unittest.TestCase):
+    """달력 컴파일과 조회"""
+
+    def setUp(self):
+        self.calendar = parse_calendar(yaml.safe_load(CALENDAR_YAML))
+
+    def test_off_day(self):
+        """따옴표 없는 off도 종 없는 날로 해석"""
+        entry = self.calendar.lookup(date(2025, 12, 25))
+        self.assertEqual(entry.description, "성탄절")
+        self.assertEqual(entry.resolve(WEEKDAY_SCHEDULE, SUNDAY_SCHEDULE), [])
+
+    def test_range_expands_to_each_day(self):
+        """기간 항목은 날짜마다 펼쳐지고, 뒤의 항목이 앞의 항목을 덮어씀"""
+        items = self.calendar.items_for(date(2025, 12, 16), "", WEEKDAY_SCHEDULE, SUNDAY_SCHEDULE)
+        self.assertEqual([i[2] for i in items], ["1교시 시험", "2교시 시험"])
+        items = self.calendar.items_for(date(2025, 12, 18), "", WEEKDAY_SCHEDULE, SUNDAY_SCHEDULE)
+        self.assertEqual(items, [(1, "13:00", "단축 수업")])
+        self.assertIsNone(self.calendar.lookup(date(2025, 12, 14)))
+
+    def test_zone_entry_takes_priority(self):
+        """구역 항목이 전체 항목보다 우선하고 sunday는 구역의 일요일 스케줄로 해석"""
+        annex_sunday = [(1, "11:00", "별관 일요")]
+        items = self.calendar.items_for(date(2025, 12, 17), "annex", WEEKDAY_SCHEDULE, annex_sunday)
+        self.assertEqual(items, annex_sunday)
+        items = self.calendar.items_for(date(2025, 12, 17), "main", WEEKDAY_SCHEDULE, annex_sunday)
+        self.assertEqual(len(items), 2)
+
+    def test_invalid_entries_are_skipped(self):
+        """알 수 없는 스케줄 이름은 건너뜀"""
+        self.assertIsNone(self.calendar.lookup(date(2025, 12, 20)))
+
+    def test_multi_year_multi_zone_index(self):
+        """몇 년치 × 여러 구역 항목을 (구역, 날짜) 키 하나씩으로 컴파일"""
+        days = [{"start": f"{year}-03-01", "end": f"{year}-12-31", "schedule": "sunday", "zone": zone}
+                for year in range(2025, 2030) for zone in ("a", "b", "c", "d")]
+        calendar = parse_calendar({"days": days})
+        self.assertEqual(len(calendar), 5 * 4 * 306)
+        self.assertEqual(calendar.lookup(date(2028, 7, 1), "c").zone, "c")
+        self.assertIsNone(calendar.lookup(date(2028, 2, 1), "c"))
+
+
+class TestCalendarFile(unittest.TestCase):
+    """파일 캐시"""
+
+    def test_reload_only_when_file_changes(self):
+        """파일이 그대로면 다시 읽지 않고, 바뀌면 다시 컴파일"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "holidays.yaml")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(CALENDAR_YAML)
+            cache = CalendarFile()
+            calendar, changed = cache.get(path)
+            self.assertTrue(changed)
+            self.assertEqual(cache.get(path), (calendar, False))
+            with open(path, "a", encoding="utf-8") as f:
+                f.write("- date: 2026-01-01\n  schedule: off\n")
+            calendar2, changed = cache.get(path)
+            self.assertTrue(changed)
+            self.assertIsNotNone(calendar2.lookup(date(2026, 1, 1)))
+            self.assertEqual(cache.get(""), (None, True))
+            self.assertEqual(cache.get(""), (None, False))
+
+
+class TestAppHolidayCalendar(unittest.TestCase):
+    """app 타임라인에서 예외 달력 사용"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "holidays.yaml")
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(CALENDAR_YAML)
+
+    def tearDown(self):
+        configure_holiday_calendar({})
+        self.tmp.cleanup()
+
+    def test_schedule_for_date_uses_calendar(self):
+        """달력에 있는 날은 달력 일정, 없는 날은 요일별 스케줄"""
+        self.assertTrue(configure_holiday_calendar({"holiday_calendar_file": self.path}))
+        self.assertEqual(schedule_for_date(date(2025, 12, 25)), [])
+        self.assertEqual(schedule_for_date(date(2025, 12, 22)), WEEKDAY_SCHEDULE)
+
+    def test_holiday_has_no_jobs(self):
+        """공휴일에는 작업을 등록하지 않음"""
+        zone = get_tz("Asia/Seoul")
+        sched = MagicMock()
+        sched.get_jobs.return_value = []
+        config = {"offset_corrected_firing": False, "timeline_days": 2, "holiday_calendar_file": self.path}
+        with patch('app.get_current_time', return_value=datetime(2025, 12, 25, 0, 0)):
+            count = app.schedule_timeline(sched, config, zone)
+        ids = {call.kwargs["id"] for call in sched.add_job.call_args_list}
+        self.assertEqual(count, len(WEEKDAY_SCHEDULE))
+        self.assertTrue(all(job_id.startswith("bell-20251226-") for job_id in ids))
+
+    def test_named_zone_uses_calendar(self):
+        """이름 있는 구역도 해당 구역 항목을 자기 스케줄로 해석"""
+        configure_holiday_calendar({"holiday_calendar_file": self.path})
+        annex = BellZone("annex", WEEKDAY_SCHEDULE, [(1, "11:00", "별관 일요")], {})
+        schedule = app.zone_schedule_for_date(annex)
+        self.assertEqual(schedule(date(2025, 12, 17)), [(1, "11:00", "별관 일요")])
+        self.assertEqual(schedule(date(2025, 12, 25)), [])
+        self.assertEqual(schedule(date(2025, 12, 22)), WEEKDAY_SCHEDULE)
+
+
+if __name__ == '__main__':
+    unittest.main()
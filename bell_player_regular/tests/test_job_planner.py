@@ -0,0 +1,136 @@
+"""
+종 작업 변경 계획(diff) 테스트
+"""
+
+import unittest
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# 부모 디렉토리를 경로에 추가하여 app 모듈을 import 가능하게 함
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+from app import get_tz, reconcile_schedule, schedule_timeline
+from heap_scheduler import HeapScheduler
+from job_planner import JobPlan, PlannedJob, apply_plan, diff_jobs
+
+MONDAY = date(2025, 10, 27)
+
+
+class TestDiffJobs(unittest.TestCase):
+    """diff_jobs 단위 테스트"""
+
+    def setUp(self):
+        self.t = datetime(2025, 10, 27, 12, 0, tzinfo=get_tz("Asia/Seoul"))
+
+    def _job(self, job_id, run_at, args=(1,)):
+        return SimpleNamespace(id=job_id, next_run_time=run_at, args=args)
+
+    def test_add_remove_reschedule_unchanged(self):
+        """추가, 삭제, 이동, 유지를 구분"""
+        scheduled = [
+            self._job("bell-a", self.t),
+            self._job("bell-b", self.t),
+            self._job("bell-c", self.t),
+        ]
+        desired = [
+            PlannedJob("bell-a", self.t, (1,)),
+            PlannedJob("bell-b", self.t + timedelta(minutes=5), (1,)),
+            PlannedJob("bell-d", self.t, (1,)),
+        ]
+        plan = diff_jobs(desired, scheduled)
+        self.assertEqual([j.job_id for j in plan.add], ["bell-d"])
+        self.assertEqual(plan.remove, ["bell-c"])
+        self.assertEqual([j.job_id for j in plan.reschedule], ["bell-b"])
+        self.assertEqual(plan.unchanged, 1)
+        self.assertEqual(plan.changed, 3)
+
+    def test_changed_args_replaces_job(self):
+        """인자가 바뀐 작업은 교체 대상"""
+        plan = diff_jobs([PlannedJob("bell-a", self.t, (2,))], [self._job("bell-a", self.t, (1,))])
+        self.assertEqual([j.job_id for j in plan.add], ["bell-a"])
+        self.assertEqual(plan.remove, [])
+
+    def test_other_jobs_are_ignored(self):
+        """관리 대상이 아닌 작업(daily-refresh 등)은 삭제하지 않음"""
+        plan = diff_jobs([], [self._job("daily-refresh-20251028", self.t)])
+        self.assertEqual(plan.changed, 0)
+
+    def test_sub_tolerance_difference_is_unchanged(self):
+        """허용 오차 이하의 시각 차이는 유지"""
+        plan = diff_jobs([PlannedJob("bell-a", self.t + timedelta(microseconds=500), (1,))],
+                         [self._job("bell-a", self.t)])
+        self.assertEqual(plan.unchanged, 1)
+
+
+class TestApplyPlan(unittest.TestCase):
+    """apply_plan 테스트"""
+
+    def test_missing_jobs_are_skipped(self):
+        """반영 전에 이미 실행된 작업은 건너뜀"""
+        zone = get_tz("Asia/Seoul")
+        sched = HeapScheduler(timezone=zone)
+        t = datetime.now(tz=zone) + timedelta(hours=1)
+        plan = JobPlan(add=[PlannedJob("bell-new", t, (1,))], remove=["bell-gone"],
+                       reschedule=[PlannedJob("bell-fired", t, (1,))], unchanged=0)
+        apply_plan(sched, plan, print, 60)
+        self.assertEqual([j.id for j in sched.get_jobs()], ["bell-new"])
+
+
+class TestReconcileSchedule(unittest.TestCase):
+    """실행 중 스케줄 변경 반영 테스트"""
+
+    def setUp(self):
+        self.zone = get_tz("Asia/Seoul")
+        self.sched = HeapScheduler(timezone=self.zone)
+        self.config = {"offset_corrected_firing": False, "timeline_days": 1, "volume": 1.0}
+        self.patches = [
+            patch('app.get_current_time', return_value=datetime(2025, 10, 27, 9, 0)),
+            patch('app.schedule_for_date', return_value=[(1, "10:00", "a"), (2, "11:00", "b"),
+                                                          (3, "12:00", "c")]),
+        ]
+        for p in self.patches:
+            p.start()
+        schedule_timeline(self.sched, self.config, self.zone)
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+
+    def test_mid_day_edit_touches_only_changed_bells(self):
+        """이동/삭제/추가된 종만 반영하고 나머지 작업은 그대로"""
+        untouched = self.sched.get_job("bell-20251027-1")
+        edited = [(1, "10:00", "a"), (2, "11:30", "b"), (4, "13:00", "d")]
+        with patch('app.schedule_for_date', return_value=edited), \
+                patch.object(self.sched, "remove_all_jobs", side_effect=AssertionError("전체 삭제 금지")):
+            plan = reconcile_schedule(self.sched, self.config, self.zone)
+
+        self.assertEqual(plan.summary(), "추가 1, 삭제 1, 이동 1, 유지 1")
+        self.assertIs(self.sched.get_job("bell-20251027-1"), untouched)
+        self.assertEqual(self.sched.get_job("bell-20251027-2").next_run_time,
+                         datetime(2025, 10, 27, 11, 30, tzinfo=self.zone))
+        self.assertIsNone(self.sched.get_job("bell-20251027-3"))
+        self.assertIsNotNone(self.sched.get_job("bell-20251027-4"))
+
+    def test_config_change_updates_jobs_in_place(self):
+        """시각과 무관한 설정 변경은 작업을 다시 만들지 않고 공유 설정만 갱신"""
+        job = self.sched.get_job("bell-20251027-1")
+        plan = reconcile_schedule(self.sched, dict(self.config, volume=0.3), self.zone)
+        self.assertEqual(plan.changed, 0)
+        self.assertIs(self.sched.get_job("bell-20251027-1"), job)
+        self.assertEqual(job.args[1]["volume"], 0.3)
+
+    def test_already_fired_bells_are_not_re_added(self):
+        """이미 지난 종은 다시 추가하지 않음"""
+        with patch('app.get_current_time', return_value=datetime(2025, 10, 27, 10, 30)):
+            self.sched.remove_job("bell-20251027-1")  # 10:00 종은 실행되어 사라짐
+            plan = reconcile_schedule(self.sched, self.config, self.zone)
+        self.assertEqual(plan.changed, 0)
+        self.assertIsNone(self.sched.get_job("bell-20251027-1"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+"""
+정밀 발사 타이밍 테스트
+"""
+
+import unittest
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+# 부모 디렉토리를 경로에 추가하여 app 모듈을 import 가능하게 함
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+import app
+from app import get_tz, schedule_timeline
+from heap_scheduler import HeapScheduler
+from precise_timing import JitterTracker, sleep_until
+
+
+class TestSleepUntil(unittest.TestCase):
+    """sleep_until 테스트"""
+
+    def test_wakes_close_to_target(self):
+        """목표 시각에 수 ms 이내로 깨어남"""
+        target = time.time() + 0.05
+        lateness = sleep_until(target)
+        self.assertGreaterEqual(lateness, 0)
+        self.assertLess(lateness, 0.005)
+        self.assertLess(abs(time.time() - target), 0.005)
+
+    def test_past_target_returns_immediately(self):
+        """이미 지난 시각이면 기다리지 않음"""
+        start = time.perf_counter()
+        lateness = sleep_until(time.time() - 1.0)
+        self.assertLess(time.perf_counter() - start, 0.01)
+        self.assertGreater(lateness, 0.9)
+
+
+class TestJitterTracker(unittest.TestCase):
+    """JitterTracker 요약 테스트"""
+
+    def test_empty_summary(self):
+        """기록이 없으면 None"""
+        self.assertEqual(JitterTracker().summary()["count"], 0)
+        self.assertIsNone(JitterTracker().summary()["p95_ms"])
+
+    def test_percentiles_use_absolute_error(self):
+        """이른 발사도 절대값으로 집계"""
+        tracker = JitterTracker(maxlen=100)
+        for ms in range(1, 101):
+            tracker.record((-ms if ms % 2 else ms) / 1000)
+        stats = tracker.summary()
+        self.assertEqual(stats["count"], 100)
+        self.assertAlmostEqual(stats["max_ms"], 100.0)
+        self.assertAlmostEqual(stats["p95_ms"], 95.0)
+
+
+class TestFireBell(unittest.TestCase):
+    """fire_bell 테스트"""
+
+    def test_waits_for_target_before_playback(self):
+        """사운드 준비 후 재생 직전까지 목표 시각을 기다림"""
+        started = []
+        target = time.time() + 0.1
+
+        def fake_play(index, config, zone, before_start=None):
+            before_start()
+            before_start()  # 백엔드를 바꿔 다시 시도해도 대기는 한 번
+            started.append(time.time())
+
+        config = {"precision_firing": True, "offset_corrected_firing": False}
+        with patch('app.play_sound_for_index', side_effect=fake_play):
+            app.fire_bell(1, config, None, target)
+        self.assertEqual(len(started), 1)
+        self.assertLess(abs(started[0] - target), 0.005)
+        self.assertGreaterEqual(app.firing_jitter.summary()["count"], 1)
+
+    def test_disabled_plays_immediately(self):
+        """정밀 발사가 꺼져 있으면 바로 재생"""
+        with patch('app.play_sound_for_index') as play:
+            app.fire_bell(1, {"precision_firing": False}, None, time.time() + 60)
+        play.assert_called_once_with(1, {"precision_firing": False}, None)
+
+    def test_jobs_wake_preroll_early(self):
+        """정밀 발사 모드에서 작업은 pre-roll만큼 일찍 등록"""
+        zone = get_tz("Asia/Seoul")
+        sched = HeapScheduler(timezone=zone)
+        config = {"offset_corrected_firing": False, "timeline_days": 1,
+                  "precision_firing": True, "preroll_seconds": 2.0}
+        with patch('app.get_current_time', return_value=datetime(2025, 10, 27, 9, 0)), \
+                patch('app.schedule_for_date', return_value=[(1, "10:00", "a")]):
+            schedule_timeline(sched, config, zone)
+        job = sched.get_job("bell-20251027-1")
+        bell_at = datetime(2025, 10, 27, 10, 0, tzinfo=zone)
+        self.assertEqual(job.next_run_time, datetime(2025, 10, 27, 9, 59, 58, tzinfo=zone))
+        self.assertEqual(job.args[3], bell_at.timestamp())
+        self.assertIs(job.func, app.fire_bell)
+
+
+    def test_reconcile_in_preroll_window_does_not_readd(self):
+        """pre-roll 구간에 다시 계획해도 이미 실행된 종을 다시 추가하지 않음 (상태 저장소 없음)"""
+        zone = get_tz("Asia/Seoul")
+        sched = HeapScheduler(timezone=zone)
+        config = {"offset_corrected_firing": False, "timeline_days": 1,
+                  "precision_firing": True, "preroll_seconds": 2.0}
+        with patch('app.schedule_for_date', return_value=[(1, "10:00", "a")]):
+            with patch('app.get_current_time', return_value=datetime(2025, 10, 27, 9, 0)):
+                schedule_timeline(sched, config, zone)
+            # 작업이 09:59:58에 실행되어 스케줄러에서 빠진 뒤, 종 시각 전에 다시 계획
+            sched.remove_job("bell-20251027-1")
+            with patch('app.get_current_time', return_value=datetime(2025, 10, 27, 9, 59, 59)):
+                schedule_timeline(sched, config, zone)
+        self.assertIsNone(sched.get_job("bell-20251027-1"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,184 @@
+"""
+반복 규칙(RRULE) 스케줄 테스트
+"""
+
+import unittest
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# 부모 디렉토리를 경로에 추가하여 app 모듈을 import 가능하게 함
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+import app
+from app import SUNDAY_SCHEDULE, WEEKDAY_SCHEDULE, configure_schedule_rules, get_tz, schedule_for_date
+from recurrence import ScheduleRule, ScheduleRuleSet, named_schedules, needs_dtstart, parse_schedule_rules
+
+EXAM = [(1, "09:00", "1교시 시험"), (2, "10:30", "2교시 시험")]
+MONDAY = date(2025, 10, 27)
+
+RULES = [
+    {"name": "기말고사", "rrule": "FREQ=DAILY;COUNT=5", "dtstart": "2025-12-15", "bells": EXAM},
+    {"name": "평일", "rrule": "FREQ=WEEKLY;BYDAY=MO,TU,WE,TH,FR,SA", "exdates": ["2025-12-25"],
+     "bells": "weekday"},
+    {"name": "일요일", "rrule": "FREQ=WEEKLY;BYDAY=SU", "bells": "sunday"},
+]
+
+
+def _parse(raw):
+    return parse_schedule_rules(raw, named_schedules(WEEKDAY_SCHEDULE, SUNDAY_SCHEDULE))
+
+
+class TestScheduleRule(unittest.TestCase):
+    """규칙 하나의 펼치기"""
+
+    def test_weekday_rules_match_weekday_schedule(self):
+        """평일/일요일 규칙은 요일별 스케줄과 같은 결과"""
+        rules = ScheduleRuleSet(_parse(RULES[1:]))
+        for offset in range(14):
+            day = MONDAY + timedelta(days=offset)
+            self.assertEqual(rules.items_for_date(day), app.schedule_for_weekday(day.weekday()))
+
+    def test_exdate_excludes_day(self):
+        """EXDATE로 지정한 날은 규칙에서 빠짐"""
+        rule = ScheduleRule("평일", "FREQ=WEEKLY;BYDAY=MO,TU,WE,TH,FR", WEEKDAY_SCHEDULE,
+                            exdates=[date(2025, 10, 29)])
+        days = list(rule.occurrences(MONDAY, MONDAY + timedelta(days=7)))
+        self.assertEqual([d.day for d in days], [27, 28, 30, 31])
+
+    def test_dtstart_and_count_bound_the_rule(self):
+        """DTSTART/COUNT 밖의 날에는 규칙이 해당하지 않음"""
+        rule, = _parse(RULES[:1])
+        self.assertFalse(rule.occurs_on(date(2025, 12, 14)))
+        self.assertTrue(rule.occurs_on(date(2025, 12, 19)))
+        self.assertFalse(rule.occurs_on(date(2025, 12, 20)))
+
+    def test_occurrences_are_lazy(self):
+        """먼 구간도 필요한 만큼만 펼침"""
+        rule = ScheduleRule("매일", "FREQ=DAILY", WEEKDAY_SCHEDULE)
+        stream = rule.occurrences(MONDAY, MONDAY + timedelta(days=365 * 100))
+        self.assertEqual([next(stream) for _ in range(3)],
+                         [MONDAY, MONDAY + timedelta(days=1), MONDAY + timedelta(days=2)])
+
+    def test_anchored_rules_require_dtstart(self):
+        """격주/COUNT/BYSETPOS처럼 기준일이 필요한 규칙은 dtstart가 없으면 거부"""
+        for rrule in ("FREQ=WEEKLY;INTERVAL=2;BYDAY=MO", "FREQ=DAILY;COUNT=5", "FREQ=WEEKLY",
+                      "FREQ=MONTHLY;BYDAY=MO,TU,WE,TH,FR;BYSETPOS=-1"):
+            self.assertTrue(needs_dtstart(rrule), rrule)
+            with self.assertRaises(ValueError, msg=rrule):
+                ScheduleRule("규칙", rrule, WEEKDAY_SCHEDULE)
+        for rrule in ("FREQ=DAILY", "FREQ=WEEKLY;BYDAY=SU", "FREQ=MONTHLY;BYDAY=1MO", "FREQ=YEARLY;BYMONTH=3;BYMONTHDAY=1"):
+            self.assertIsNone(needs_dtstart(rrule), rrule)
+
+        biweekly = ScheduleRule("격주", "FREQ=WEEKLY;INTERVAL=2;BYDAY=MO", WEEKDAY_SCHEDULE, dtstart=MONDAY)
+        self.assertTrue(biweekly.occurs_on(MONDAY))
+        self.assertFalse(biweekly.occurs_on(MONDAY + timedelta(days=7)))
+        self.assertEqual(_parse([{"rrule": "FREQ=WEEKLY;INTERVAL=2;BYDAY=MO", "bells": "weekday"}]), [])
+
+    def test_invalid_rules_are_skipped(self):
+        """잘못된 규칙은 건너뛰고 나머지는 사용"""
+        rules = _parse([{"rrule": "FREQ=NOPE", "bells": []},
+                        {"rrule": "FREQ=DAILY", "bells": "unknown"},
+                        {"name": "시각 오류", "rrule": "FREQ=DAILY", "bells": [[1, "25:00", "x"]]},
+                        "not a rule",
+                        RULES[2]])
+        self.assertEqual([r.name for r in rules], ["일요일"])
+
+
+class TestScheduleRuleSet(unittest.TestCase):
+    """우선순위와 날짜별 선택"""
+
+    def setUp(self):
+        self.rules = ScheduleRuleSet(_parse(RULES))
+
+    def test_first_matching_rule_wins(self):
+        """시험 주간에는 시험 규칙, 평소에는 평일/일요일 규칙"""
+        self.assertEqual(self.rules.rule_for_date(date(2025, 12, 16)).name, "기말고사")
+        self.assertEqual(self.rules.rule_for_date(date(2025, 12, 22)).name, "평일")
+        self.assertEqual(self.rules.rule_for_date(date(2025, 12, 21)).name, "일요일")
+
+    def test_excluded_day_has_no_bells(self):
+        """어느 규칙에도 해당하지 않는 날(EXDATE)은 종 없음"""
+        self.assertIsNone(self.rules.rule_for_date(date(2025, 12, 25)))
+        self.assertEqual(self.rules.items_for_date(date(2025, 12, 25)), [])
+
+    def test_iter_days_matches_rule_for_date(self):
+        """함께 진행하는 iter_days 결과와 구간 단위 날짜별 조회가 규칙별 occurs_on과 같음"""
+        start, end = date(2025, 12, 1), date(2026, 1, 10)
+        for day, rule in self.rules.iter_days(start, end):
+            expected = next((r for r in self.rules.rules if r.occurs_on(day)), None)
+            self.assertIs(rule, expected, day)
+            self.assertIs(self.rules.rule_for_date(day), expected, day)
+
+    def test_rule_for_date_expands_window_once(self):
+        """같은 구간 안의 날짜 조회는 규칙을 다시 펼치지 않음"""
+        with patch.object(self.rules, "iter_days", wraps=self.rules.iter_days) as iter_days:
+            for offset in range(7):
+                self.rules.rule_for_date(MONDAY + timedelta(days=offset))
+        self.assertEqual(iter_days.call_count, 1)
+
+
+class TestAppScheduleRules(unittest.TestCase):
+    """app 타임라인에서 반복 규칙 사용"""
+
+    def tearDown(self):
+        configure_schedule_rules({})
+
+    def test_schedule_for_date_uses_rules(self):
+        """규칙이 있으면 schedule_for_date가 규칙의 종 목록을 반환"""
+        self.assertTrue(configure_schedule_rules({"schedule_rules": RULES}))
+        self.assertFalse(configure_schedule_rules({"schedule_rules": RULES}))
+        self.assertEqual([tuple(i) for i in schedule_for_date(date(2025, 12, 15))], EXAM)
+        self.assertEqual(schedule_for_date(date(2025, 12, 25)), [])
+        configure_schedule_rules({})
+        self.assertEqual(schedule_for_date(date(2025, 12, 25)), WEEKDAY_SCHEDULE)
+
+    def test_invalid_rules_warned_once(self):
+        """validate_config가 걸러 낸 규칙은 configure_schedule_rules가 다시 파싱하지 않음 (경고 한 번)"""
+        raw = RULES + [{"name": "깨진 규칙", "rrule": "FREQ=SOMETIMES", "bells": "weekday"}]
+        with self.assertLogs(level="WARNING") as logs:
+            validated = app.validate_config({"schedule_rules": raw})
+            with patch("app.parse_schedule_rules") as parse:
+                self.assertTrue(configure_schedule_rules(validated))
+                parse.assert_not_called()
+        self.assertEqual(validated["schedule_rules"], RULES)
+        self.assertEqual(sum("깨진 규칙" in line for line in logs.output), 1)
+
+    def test_timeline_expands_only_horizon(self):
+        """타임라인은 등록 기간의 날만 규칙으로 펼쳐 시험 시간표로 등록"""
+        zone = get_tz("Asia/Seoul")
+        sched = MagicMock()
+        sched.get_jobs.return_value = []
+        config = {"offset_corrected_firing": False, "timeline_days": 2, "schedule_rules": RULES}
+        with patch('app.get_current_time', return_value=datetime(2025, 12, 15, 0, 0)):
+            count = app.schedule_timeline(sched, config, zone)
+        self.assertEqual(count, 2 * len(EXAM))
+        ids = sorted(call.kwargs["id"] for call in sched.add_job.call_args_list)
+        self.assertEqual(ids, ["bell-20251215-1", "bell-20251215-2", "bell-20251216-1", "bell-20251216-2"])
+
+    def test_week_index_follows_rules(self):
+        """반복 규칙이 있으면 주간 인덱스가 해당 주의 규칙을 반영"""
+        configure_schedule_rules({"schedule_rules": RULES})
+        zone = get_tz("Asia/Seoul")
+        now = datetime(2025, 12, 15, 8, 0, tzinfo=zone)
+        at, bell = app.get_week_index(now.date()).next_bell(now)
+        self.assertEqual((at.hour, at.minute, bell.description), (9, 0, "1교시 시험"))
+
+    def test_week_index_uses_configured_zone(self):
+        """오늘 날짜는 호스트 시간대가 아니라 설정 시간대 기준 (UTC 일요일 16:30 = 서울 월요일 01:30)"""
+        configure_schedule_rules({"schedule_rules": RULES})
+        zone = get_tz("Asia/Seoul")
+        utc_now = datetime(2025, 12, 14, 16, 30, tzinfo=get_tz("UTC"))
+        app.set_virtual_clock(lambda: utc_now)
+        try:
+            index = app.get_week_index(zone=zone)
+        finally:
+            app.set_virtual_clock(None)
+        at, bell = index.next_bell(utc_now.astimezone(zone))
+        self.assertEqual((at.day, at.hour, bell.description), (15, 9, "1교시 시험"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+"""
+절전 복귀 감지와 놓친 종 처리 테스트
+"""
+
+import unittest
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# 부모 디렉토리를 경로에 추가하여 app 모듈을 import 가능하게 함
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+sys.path.insert(0, str(Path(__file__).parent))
+
+import app
+from app import catch_up_missed_bells, fire_bell, get_tz, schedule_timeline
+from fake_clocks import FakeClocks
+from resume_catchup import ResumeCatchUp, coalesce_missed
+from timeline import compile_day
+
+ZONE = get_tz("Asia/Seoul")
+DAY = datetime(2025, 10, 27, tzinfo=ZONE).date()  # 월요일
+ITEMS = [(1, "09:00", "1교시"), (2, "10:00", "2교시"), (3, "11:00", "3교시"), (4, "12:00", "점심")]
+
+
+class TestResumeDetection(unittest.TestCase):
+    """ClockWatch.check_resume 테스트"""
+
+    def setUp(self):
+        self.clocks = FakeClocks()
+        self.gaps = []
+        self.jumps = []
+        self.watch = self.clocks.clock_watch(resume_threshold_seconds=10.0)
+        self.watch.add_resume_listener(self.gaps.append)
+        self.watch.add_listener(self.jumps.append)
+
+    def test_suspend_detected_from_clock_gap(self):
+        """절전 포함 시계만 흐른 시간만큼 복귀를 한 번 알림 (시계 점프로는 보지 않음)"""
+        self.clocks.run(1)
+        self.clocks.sleep(1800)
+        self.assertEqual(self.watch.check(), 0.0)
+        self.assertAlmostEqual(self.watch.check_resume(), 1800)
+        self.assertEqual(self.watch.check_resume(), 0.0)
+        self.assertEqual(len(self.gaps), 1)
+        self.assertEqual(self.jumps, [])
+
+    def test_late_wakeup_detected(self):
+        """두 시계가 함께 흘러도(Windows) 예정보다 늦게 깨어나면 복귀로 판단"""
+        self.clocks.run(1)
+        self.assertEqual(self.watch.check_resume(interval=1.0), 0.0)
+        self.clocks.run(601)
+        self.assertAlmostEqual(self.watch.check_resume(interval=1.0), 600)
+
+    def test_late_wakeup_ignored_without_interval(self):
+        """감시 스레드가 없으면 확인 간격만으로는 복귀로 보지 않음"""
+        self.clocks.run(600)
+        self.assertEqual(self.watch.check_resume(), 0.0)
+
+    def test_disabled_without_threshold(self):
+        """임계값이 없으면 복귀 감지 안 함"""
+        self.watch.resume_threshold_seconds = None
+        self.clocks.sleep(1800)
+        self.assertEqual(self.watch.check_resume(), 0.0)
+        self.assertEqual(self.gaps, [])
+
+
+class TestCoalesce(unittest.TestCase):
+    """놓친 종 정책"""
+
+    def setUp(self):
+        self.missed = compile_day(DAY, ITEMS, ZONE)
+        self.resumed = datetime(2025, 10, 27, 12, 5, tzinfo=ZONE).timestamp()
+
+    def test_latest(self):
+        """latest: 가장 최근 종 하나"""
+        self.assertEqual([e.index for e in coalesce_missed(self.missed, "latest", 0, self.resumed)], [4])
+
+    def test_skip(self):
+        """skip: 모두 건너뜀"""
+        self.assertEqual(coalesce_missed(self.missed, "skip", 3600, self.resumed), [])
+
+    def test_replay_window(self):
+        """replay: 구간 안의 종을 순서대로"""
+        chosen = coalesce_missed(self.missed, "replay", 3600 + 10 * 60, self.resumed)
+        self.assertEqual([e.index for e in chosen], [3, 4])
+
+    def test_nothing_missed(self):
+        """놓친 종이 없으면 재생 없음"""
+        self.assertEqual(coalesce_missed([], "latest", 0, self.resumed), [])
+
+
+class TestResumeCatchUp(unittest.TestCase):
+    """복귀 직후 흡수와 한 번의 처리"""
+
+    def test_absorb_then_finish_once(self):
+        """settle 동안 흡수하고, 끝나면 절전 시작부터의 구간으로 한 번 처리"""
+        now = [1000.0]
+        windows = []
+        catchup = ResumeCatchUp(lambda start, end: windows.append((start, end)), settle_seconds=60,
+                                clock=lambda: now[0])
+        self.assertFalse(catchup.absorbing())
+        catchup.begin(300)
+        catchup.begin(30)  # 같은 복귀를 다른 경로에서 다시 알려도 구간은 하나
+        self.assertTrue(catchup.absorbing())
+        self.assertEqual(catchup.finish(), (700.0, 1060.0))
+        self.assertIsNone(catchup.finish())
+        self.assertEqual(windows, [(700.0, 1060.0)])
+        self.assertFalse(catchup.absorbing())
+
+
+class TestAppCatchUp(unittest.TestCase):
+    """app에서 놓친 종 처리"""
+
+    def setUp(self):
+        self.sched = MagicMock()
+        self.sched.get_jobs.return_value = []
+        config = {"offset_corrected_firing": False, "timeline_days": 1}
+        with patch('app.get_current_time', return_value=datetime(2025, 10, 27, 0, 0)):
+            schedule_timeline(self.sched, config, ZONE)
+        app._watched_schedulers.add(self.sched)
+        self.timeline = app._timelines[self.sched][""]
+
+    def tearDown(self):
+        app._watched_schedulers.discard(self.sched)
+        app.resume_catchup.policy = "latest"
+
+    def _catch_up(self, policy, start, end, window=300):
+        app.resume_catchup.policy = policy
+        app.resume_catchup.replay_window_seconds = window
+        with patch('app.play_bell') as play, patch('app.threading.Thread') as thread:
+            thread.side_effect = lambda target, args, **kw: MagicMock(start=lambda: target(*args))
+            played = catch_up_missed_bells(start.timestamp(), end.timestamp())
+        return played, [c.args[0] for c in play.call_args_list]
+
+    def test_latest_plays_one_bell(self):
+        """점심시간 절전 후 복귀하면 가장 최근 종 하나만 재생"""
+        start = datetime(2025, 10, 27, 9, 0, tzinfo=ZONE)
+        end = datetime(2025, 10, 27, 15, 0, tzinfo=ZONE)
+        missed = self.timeline.between(start, end)
+        self.assertGreater(len(missed), 1)
+        played, indexes = self._catch_up("latest", start, end)
+        self.assertEqual((played, indexes), (1, [missed[-1].index]))
+
+    def test_replay_plays_in_order(self):
+        """replay는 구간 안의 종만 순서대로 한 스레드에서 재생"""
+        start = datetime(2025, 10, 27, 9, 0, tzinfo=ZONE)
+        end = datetime(2025, 10, 27, 15, 0, tzinfo=ZONE)
+        expected = [e.index for e in self.timeline.between(start, end) if e.run_at >= end - timedelta(hours=2)]
+        self.assertLess(len(expected), len(self.timeline.between(start, end)))
+        played, indexes = self._catch_up("replay", start, end, window=7200)
+        self.assertEqual(indexes, expected)
+
+    def test_skip_plays_nothing(self):
+        """skip은 아무것도 재생하지 않음"""
+        start = datetime(2025, 10, 27, 9, 0, tzinfo=ZONE)
+        end = datetime(2025, 10, 27, 15, 0, tzinfo=ZONE)
+        self.assertEqual(self._catch_up("skip", start, end), (0, []))
+
+    def test_fire_bell_absorbed_after_resume(self):
+        """복귀 직후 몰려 실행되는 종 작업은 바로 재생하지 않음"""
+        app.resume_catchup.begin(600)
+        try:
+            with patch('app.play_bell') as play, patch('app.catch_up_missed_bells'):
+                fire_bell(1, {}, ZONE)
+                play.assert_not_called()
+        finally:
+            with patch.object(app.resume_catchup, "on_finish"):
+                app.resume_catchup.finish()
+        with patch('app.play_bell') as play:
+            fire_bell(1, {}, ZONE)
+            play.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
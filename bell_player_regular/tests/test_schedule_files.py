@@ -0,0 +1,109 @@
+"""
+외부 스케줄 파일 테스트
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+# 부모 디렉토리를 경로에 추가하여 app 모듈을 import 가능하게 함
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+import app
+from app import (BUILTIN_SUNDAY_SCHEDULE, BUILTIN_WEEKDAY_SCHEDULE, SUNDAY_SCHEDULE, WEEKDAY_SCHEDULE,
+                 configure_schedule_files, schedule_for_weekday)
+from schedule_files import ScheduleFile, ScheduleFileCache, compile_schedule, read_schedule_items
+
+
+class TestScheduleFiles(unittest.TestCase):
+    """CSV/YAML 스케줄 파일 파싱과 캐시"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write(self, name, text):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    def test_csv_and_yaml_formats(self):
+        """CSV(HHMM/HH:MM)와 YAML(목록/dict) 형식을 같은 종 목록으로 읽음"""
+        csv_path = self._write("s.csv", "index,time,description\n2,0930,둘째\n1,08:05,첫째\n")
+        yaml_path = self._write("s.yaml", 'bells:\n- [2, "09:30", 둘째]\n- {index: 1, time: "0805", description: 첫째}\n')
+        expected = [(1, "08:05", "첫째"), (2, "09:30", "둘째")]
+        self.assertEqual(compile_schedule(read_schedule_items(csv_path)).items(), expected)
+        self.assertEqual(compile_schedule(read_schedule_items(yaml_path)).items(), expected)
+
+    def test_invalid_files_rejected(self):
+        """잘못된 시각, 중복 인덱스, 열 누락, 모르는 형식은 ValueError"""
+        cache = ScheduleFileCache()
+        for name, text in (("bad_time.csv", "index,time\n1,2560\n"),
+                           ("dup.csv", "index,time\n1,0800\n1,0900\n"),
+                           ("columns.csv", "idx,at\n1,0800\n"),
+                           ("s.txt", "1,0800\n")):
+            with self.assertRaises(ValueError, msg=name):
+                cache.load(self._write(name, text))
+
+    def test_unchanged_file_is_cache_hit(self):
+        """파일이 바뀌지 않으면 다시 파싱하지 않고, 바뀌면 다시 컴파일"""
+        path = self._write("s.csv", "index,time\n1,0800\n")
+        cache = ScheduleFileCache()
+        first = cache.load(path)
+        with patch("schedule_files.read_schedule_items") as read:
+            self.assertIs(cache.load(path), first)
+            read.assert_not_called()
+        self._write("s.csv", "index,time\n1,0800\n2,0900\n")
+        self.assertEqual(len(cache.load(path)), 2)
+
+    def test_schedule_file_reports_changes(self):
+        """ScheduleFile은 내용이 바뀌었을 때만 changed=True, 읽을 수 없으면 None"""
+        path = self._write("s.csv", "index,time\n1,0800\n")
+        schedule_file = ScheduleFile(ScheduleFileCache())
+        self.assertTrue(schedule_file.get(path)[1])
+        self.assertFalse(schedule_file.get(path)[1])
+        self._write("s.csv", "index,time\n1,2500\n2,0900\n")
+        self.assertEqual(schedule_file.get(path), (None, True))
+        self.assertEqual(schedule_file.get(""), (None, False))
+
+
+class TestConfiguredScheduleFiles(unittest.TestCase):
+    """app의 평일/일요일 스케줄 파일 적용"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "sunday.csv")
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write("index,time,description\n1,0900,기상종\n2,1000,시작종\n")
+
+    def tearDown(self):
+        configure_schedule_files({})
+        self.tmp.cleanup()
+
+    def test_file_replaces_builtin_schedule_in_place(self):
+        """파일의 스케줄이 SUNDAY_SCHEDULE을 제자리에서 교체하고, 설정을 지우면 내장 스케줄로 복귀"""
+        self.assertTrue(configure_schedule_files({"sunday_schedule_file": self.path}))
+        self.assertEqual(SUNDAY_SCHEDULE, [(1, "09:00", "기상종"), (2, "10:00", "시작종")])
+        self.assertIs(schedule_for_weekday(6), app.SUNDAY_SCHEDULE)
+        self.assertEqual(WEEKDAY_SCHEDULE, BUILTIN_WEEKDAY_SCHEDULE)
+        self.assertFalse(configure_schedule_files({"sunday_schedule_file": self.path}))
+
+        self.assertTrue(configure_schedule_files({}))
+        self.assertEqual(SUNDAY_SCHEDULE, BUILTIN_SUNDAY_SCHEDULE)
+
+    def test_validate_config_keeps_paths(self):
+        """스케줄 파일 경로 검증"""
+        validated = app.validate_config({"weekday_schedule_file": ' "a.csv" ', "sunday_schedule_file": 3})
+        self.assertEqual(validated["weekday_schedule_file"], "a.csv")
+        self.assertEqual(validated["sunday_schedule_file"], "")
+
+
+if __name__ == '__main__':
+    unittest.main()
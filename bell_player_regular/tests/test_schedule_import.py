@@ -0,0 +1,109 @@
+"""
+스케줄 일괄 가져오기 테스트
+"""
+
+import unittest
+import io
+import os
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+# 부모 디렉토리를 경로에 추가하여 app 모듈을 import 가능하게 함
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+from schedule_files import ScheduleFileCache
+from schedule_import import import_schedules, normalize_hhmm
+from zones import parse_zones
+
+EXPORT = """site,schedule,index,time,description
+main,weekday,2,0720,시작종
+main,weekday,1,06:00,기상종
+main,weekday,1,0600,기상종
+main,평일,3,930,쉬는시간
+annex,sunday,1,0700,
+annex,sunday,1,0800,
+bad site,weekday,1,0600,
+main,weekday,x,0600,
+main,holiday,4,0600,
+main,weekday,5,2500,
+"""
+
+
+class TestScheduleImport(unittest.TestCase):
+    """여러 사이트 CSV 가져오기"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_normalize_hhmm(self):
+        """HH:MM/HHMM/HMM 형식을 HH:MM으로 바꾸고 잘못된 시각은 거부"""
+        self.assertEqual(normalize_hhmm("0805"), "08:05")
+        self.assertEqual(normalize_hhmm("8:05"), "08:05")
+        self.assertEqual(normalize_hhmm(" 805 "), "08:05")
+        for bad in ("", "2400", "12:60", "ab:cd"):
+            with self.assertRaises(ValueError, msg=bad):
+                normalize_hhmm(bad)
+
+    def test_bad_rows_reported_without_aborting(self):
+        """잘못된 줄은 줄 번호와 함께 기록하고 나머지는 가져옴"""
+        report = import_schedules(io.StringIO(EXPORT), self.tmp.name)
+        self.assertEqual(report.rows, 10)
+        self.assertEqual(report.bells, 4)
+        self.assertEqual(report.duplicates, 1)
+        self.assertEqual([e.line for e in report.errors], [7, 8, 9, 10, 11])
+        self.assertIn("중복", report.errors[0].message)
+
+    def test_outputs_load_as_zone_schedules(self):
+        """출력 파일을 zones 설정의 스케줄 파일로 그대로 사용"""
+        report = import_schedules(io.StringIO(EXPORT), self.tmp.name)
+        main_path = report.files[("main", "weekday")]
+        self.assertEqual(ScheduleFileCache().load(main_path).items(),
+                         [(1, "06:00", "기상종"), (2, "07:20", "시작종"), (3, "09:30", "쉬는시간")])
+        zones = parse_zones(report.zones_config(), [], [])
+        self.assertEqual([z.name for z in zones], ["annex", "main"])
+        self.assertEqual(zones[0].sunday_schedule, [(1, "07:00", "")])
+        self.assertEqual(zones[1].weekday_schedule[0], (1, "06:00", "기상종"))
+        self.assertFalse(any(name.endswith(".tmp") for name in os.listdir(self.tmp.name)))
+
+    def test_error_list_is_bounded(self):
+        """오류가 많아도 앞의 max_errors개만 보관하고 개수는 모두 셈"""
+        rows = "index,time\n" + "x,0600\n" * 500
+        report = import_schedules(io.StringIO(rows), self.tmp.name, default_zone="main", max_errors=10)
+        self.assertEqual(report.error_count, 500)
+        self.assertEqual(len(report.errors), 10)
+
+    def test_memory_stays_flat_for_large_input(self):
+        """입력 크기가 커져도 최대 메모리 사용량이 거의 늘지 않음"""
+        def generate(copies):
+            # 같은 종을 반복하는 큰 입력 (중복 검사 표는 고유한 종 수만큼만 커짐)
+            yield "site,schedule,index,time\n"
+            for _ in range(copies):
+                for site in range(20):
+                    for idx in range(1, 21):
+                        yield f"site{site},weekday,{idx},{6 + idx % 16:02d}00\n"
+
+        class Stream(io.TextIOBase):
+            def __init__(self, lines):
+                self._lines = lines
+
+            def __iter__(self):
+                return self._lines
+
+        peaks = []
+        for copies in (5, 50):
+            tracemalloc.start()
+            report = import_schedules(Stream(generate(copies)), self.tmp.name)
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+            self.assertEqual(report.bells, 400)
+        self.assertLess(peaks[1], peaks[0] * 1.5 + 64 * 1024)
+
+
+if __name__ == '__main__':
+    unittest.main()
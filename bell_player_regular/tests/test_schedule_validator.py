@@ -0,0 +1,132 @@
+"""
+스케줄 충돌 검사 테스트
+"""
+
+import unittest
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# 부모 디렉토리를 경로에 추가하여 app 모듈을 import 가능하게 함
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+import app
+from app import get_tz, validate_schedule
+from schedule_validator import (DurationCache, PlannedSound, find_overlaps, plan_day,
+                                read_schedule_csv, validate_plan)
+
+ZONE = get_tz("Asia/Seoul")
+DAY = date(2025, 10, 27)  # 월요일
+
+
+def _sound(hhmm, index, duration, zone="", path="x.mp3"):
+    hour, minute = map(int, hhmm.split(":"))
+    start = datetime(DAY.year, DAY.month, DAY.day, hour, minute, tzinfo=ZONE)
+    return PlannedSound(zone, f"bell-{index}", start, index, path, duration)
+
+
+class TestFindOverlaps(unittest.TestCase):
+    """재생 겹침 검사"""
+
+    def test_long_sound_overlaps_next_bell(self):
+        """앞 종이 다음 종 시작 후에도 재생되면 겹침으로 보고"""
+        issues = find_overlaps([_sound("09:00", 1, 90), _sound("09:01", 2, 10), _sound("09:05", 3, 10)])
+        self.assertEqual(len(issues), 1)
+        self.assertEqual((issues[0].index, issues[0].other_index), (2, 1))
+        self.assertAlmostEqual(issues[0].overlap_seconds, 30.0)
+
+    def test_back_to_back_is_not_overlap(self):
+        """앞 종이 끝나는 순간 시작하는 종은 겹치지 않음"""
+        self.assertEqual(find_overlaps([_sound("09:00", 1, 60), _sound("09:01", 2, 60)]), [])
+
+    def test_longest_active_sound_is_kept(self):
+        """짧은 종이 사이에 있어도 더 길게 재생 중인 종과의 겹침을 찾음"""
+        issues = find_overlaps([_sound("09:00", 1, 300), _sound("09:01", 2, 5), _sound("09:03", 3, 5)])
+        self.assertEqual([(i.index, i.other_index) for i in issues], [(2, 1), (3, 1)])
+
+    def test_zones_are_independent(self):
+        """다른 구역의 종은 동시에 울려도 겹침이 아님"""
+        sounds = [_sound("09:00", 1, 90, zone="a"), _sound("09:00", 1, 90, zone="b")]
+        self.assertEqual(find_overlaps(sounds), [])
+
+    def test_missing_and_unknown_duration(self):
+        """파일 없는 종은 누락으로 보고, 길이를 모르는 종은 겹침 검사에서 제외"""
+        issues = validate_plan([_sound("09:00", 1, None), _sound("09:01", 2, 10, path=None)])
+        self.assertEqual([(i.kind, i.index) for i in issues], [("missing", 2)])
+
+    def test_large_plan_is_fast(self):
+        """구역 여러 개 × 몇 주치 계획도 빠르게 검사"""
+        rng = random.Random(1)
+        base = datetime(DAY.year, DAY.month, DAY.day, tzinfo=ZONE)
+        sounds = [PlannedSound(f"z{i % 8}", f"bell-{i}", base + timedelta(seconds=rng.randrange(86400 * 28)),
+                               i, "x.mp3", rng.uniform(5, 60)) for i in range(50000)]
+        started = time.perf_counter()
+        issues = find_overlaps(sounds)
+        self.assertLess(time.perf_counter() - started, 2.0)
+        self.assertTrue(all(i.overlap_seconds > 0 for i in issues))
+
+
+class TestPlanning(unittest.TestCase):
+    """스케줄 → 검사용 계획 변환"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _touch(self, name, content=b"x"):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "wb") as f:
+            f.write(content)
+        return path
+
+    def test_duration_cache_probes_once(self):
+        """바뀌지 않은 파일은 길이를 다시 측정하지 않음"""
+        path = self._touch("01.mp3")
+        probe = MagicMock(return_value=12.5)
+        cache = DurationCache(probe)
+        self.assertEqual(cache.get(path), 12.5)
+        self.assertEqual(cache.get(path), 12.5)
+        probe.assert_called_once_with(path)
+        self._touch("01.mp3", b"longer")
+        cache.get(path)
+        self.assertEqual(probe.call_count, 2)
+        self.assertIsNone(cache.get(os.path.join(self.tmp.name, "none.mp3")))
+
+    def test_plan_day_looks_up_each_index_once(self):
+        """같은 인덱스의 파일은 하루에 한 번만 찾음"""
+        path_for = MagicMock(return_value="x.mp3")
+        sounds = plan_day(DAY, [(1, "09:00", ""), (1, "10:00", ""), (2, "11:00", "")], ZONE,
+                          path_for, lambda path: 3.0)
+        self.assertEqual(len(sounds), 3)
+        self.assertEqual(path_for.call_count, 2)
+
+    def test_read_schedule_csv(self):
+        """bell_player 형식의 schedule.csv를 읽음"""
+        path = self._touch("schedule.csv", "index,time\n1,850\n2,0930\n".encode("utf-8"))
+        self.assertEqual(read_schedule_csv(path), [(1, "08:50", ""), (2, "09:30", "")])
+
+    def test_validate_schedule_uses_configured_sounds(self):
+        """설정의 사운드 폴더와 스케줄로 누락/겹침을 찾음"""
+        self._touch("01.mp3")
+        self._touch("02.mp3")
+        config = {"sounds_dir": self.tmp.name, "timezone": "Asia/Seoul"}
+        schedule = [(1, "09:00", ""), (2, "09:01", ""), (3, "09:10", "")]
+        now = datetime(DAY.year, DAY.month, DAY.day, 8, 0, tzinfo=ZONE)
+        with patch("app.local_now", return_value=now), \
+                patch("app.schedule_for_date", return_value=schedule), \
+                patch("app.probe_duration_seconds", return_value=75.0), \
+                patch.object(app, "sound_durations", DurationCache(lambda path: app.probe_duration_seconds(path))):
+            issues = validate_schedule(config, ZONE, days=1)
+        self.assertEqual([(i.kind, i.index) for i in issues], [("overlap", 2), ("missing", 3)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+가상 시계 시뮬레이터 테스트
+"""
+
+import unittest
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 부모 디렉토리를 경로에 추가하여 app 모듈을 import 가능하게 함
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+import app
+from app import SUNDAY_SCHEDULE, WEEKDAY_SCHEDULE, get_tz, get_week_index
+from simulator import VirtualClock, simulate
+
+
+class TestSimulator(unittest.TestCase):
+    """simulate() 테스트"""
+
+    def setUp(self):
+        self.zone = get_tz("Asia/Seoul")
+        self.tmp = tempfile.TemporaryDirectory()
+        self.weekday_dir = Path(self.tmp.name, "weekday")
+        self.sunday_dir = Path(self.tmp.name, "sunday")
+        self.weekday_dir.mkdir()
+        self.sunday_dir.mkdir()
+        (self.weekday_dir / "01.mp3").write_bytes(b"")
+        (self.sunday_dir / "01.mp3").write_bytes(b"")
+        self.config = dict(app.DEFAULT_CONFIG, sounds_dir=str(self.weekday_dir),
+                           sounds_dir_sunday=str(self.sunday_dir))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_sunday_rollover(self):
+        """토요일 밤 → 일요일 → 월요일로 넘어가며 스케줄과 사운드 폴더가 바뀜"""
+        start = datetime(2025, 11, 1, 23, 0, tzinfo=self.zone)  # 토요일
+        records = simulate(self.config, start, start + timedelta(days=1, hours=2))
+
+        sunday = [r for r in records if r.at.weekday() == 6]
+        self.assertEqual([r.index for r in sunday], [idx for idx, _, _ in SUNDAY_SCHEDULE])
+        self.assertTrue(all(r.sounds_dir == str(self.sunday_dir) for r in sunday))
+        self.assertEqual(sunday[0].path, str(self.sunday_dir / "01.mp3"))
+        self.assertEqual(sunday[0].job_id, "bell-20251102-1")
+
+        monday = [r for r in records if r.at.weekday() == 0]
+        self.assertTrue(all(r.sounds_dir == str(self.weekday_dir) for r in monday))
+
+    def test_months_replay_matches_week_index(self):
+        """몇 달치를 빠르게 재현하고 모든 종이 정확히 한 번, 정시에 울림"""
+        start = datetime(2025, 10, 27, 0, 0, tzinfo=self.zone)
+        end = start + timedelta(days=91)
+        began = time.perf_counter()
+        records = simulate(self.config, start, end)
+        self.assertLess(time.perf_counter() - began, 30)
+
+        expected = [at for at, _ in get_week_index().bells_between(start, end)]
+        self.assertEqual([r.at for r in records], expected)
+        self.assertEqual(len(records), 13 * (6 * len(WEEKDAY_SCHEDULE) + len(SUNDAY_SCHEDULE)))
+        self.assertEqual(len({r.job_id for r in records}), len(records))
+
+    def test_without_autoplay_only_first_day(self):
+        """autoplay_next_day=false면 첫날만 울림"""
+        start = datetime(2025, 10, 27, 0, 0, tzinfo=self.zone)
+        records = simulate(dict(self.config, autoplay_next_day=False), start, start + timedelta(days=3))
+        self.assertEqual(len(records), len(WEEKDAY_SCHEDULE))
+
+    def test_hooks_are_restored(self):
+        """시뮬레이션 후 실제 시계와 재생으로 돌아감"""
+        start = datetime(2025, 10, 27, 0, 0, tzinfo=self.zone)
+        simulate(self.config, start, start + timedelta(hours=1))
+        self.assertIsNone(app._virtual_clock)
+        self.assertIsNone(app._audio_sink)
+        self.assertLess(abs((app.local_now(self.zone) - datetime.now(tz=self.zone)).total_seconds()), 5)
+
+
+class TestVirtualClock(unittest.TestCase):
+    """VirtualClock 테스트"""
+
+    def test_cannot_go_backwards(self):
+        """가상 시계는 뒤로 가지 않음"""
+        clock = VirtualClock(datetime(2025, 10, 27, tzinfo=get_tz("Asia/Seoul")))
+        clock.advance(60)
+        with self.assertRaises(ValueError):
+            clock.set(datetime(2025, 10, 27, tzinfo=get_tz("Asia/Seoul")))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+"""
+SQLite 상태 저장소 테스트
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# 부모 디렉토리를 경로에 추가하여 app 모듈을 import 가능하게 함
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+import app
+from app import WEEKDAY_SCHEDULE, fire_bell, get_tz, open_state_store, schedule_timeline
+from state_store import FIRED, MISSED, StateStore
+from time_sync import TimeSample, TimeSyncService
+from timeline import BellTimeline, compile_day
+
+ZONE = get_tz("Asia/Seoul")
+DAY = date(2025, 10, 27)  # 월요일
+
+
+class TestStateStore(unittest.TestCase):
+    """StateStore 테스트"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = StateStore(os.path.join(self.tmp.name, "state.sqlite3"))
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_day_plan_round_trip(self):
+        """저장한 계획을 그대로 복원하고, 지문이 다르면 복원하지 않음"""
+        entries = compile_day(DAY, WEEKDAY_SCHEDULE, ZONE)
+        self.store.save_day("", DAY, "abc", entries)
+        self.assertEqual(self.store.load_day("", DAY, "abc", ZONE), entries)
+        self.assertIsNone(self.store.load_day("", DAY, "other", ZONE))
+        self.assertIsNone(self.store.load_day("annex", DAY, "abc", ZONE))
+
+    def test_fired_is_recorded_once(self):
+        """같은 종을 두 번 재생 기록하면 두 번째는 거부, 놓친 종은 나중에 재생 가능"""
+        self.assertTrue(self.store.mark("bell-20251027-1", DAY, FIRED))
+        self.assertFalse(self.store.mark("bell-20251027-1", DAY, FIRED))
+        self.assertTrue(self.store.mark("bell-20251027-2", DAY, MISSED))
+        self.assertFalse(self.store.mark("bell-20251027-2", DAY, MISSED))
+        self.assertTrue(self.store.mark("bell-20251027-2", DAY, FIRED))
+        self.assertEqual(self.store.fired_for_day(DAY), {"bell-20251027-1", "bell-20251027-2"})
+
+    def test_values_and_prune(self):
+        """기타 상태 저장과 지난 날짜 정리"""
+        self.store.put("time_sync", {"offset": 0.5})
+        self.assertEqual(self.store.get("time_sync"), {"offset": 0.5})
+        self.store.save_day("", DAY, "abc", compile_day(DAY, WEEKDAY_SCHEDULE, ZONE))
+        self.store.mark("bell-20251027-1", DAY, FIRED)
+        self.store.prune(DAY + timedelta(days=1), keep_state_days=30)
+        self.assertIsNone(self.store.load_day("", DAY, "abc", ZONE))
+        self.assertEqual(self.store.state_of("bell-20251027-1"), FIRED)
+        self.store.prune(DAY + timedelta(days=40), keep_state_days=30)
+        self.assertIsNone(self.store.state_of("bell-20251027-1"))
+
+    def test_lookups_use_indexes(self):
+        """날짜별 조회가 전체 스캔 없이 인덱스를 사용"""
+        conn = self.store._conn
+        for sql in ("SELECT * FROM plan_entries WHERE zone = 'a' AND day = '2025-10-27'",
+                    "SELECT * FROM bell_state WHERE day = '2025-10-27'"):
+            plan = " ".join(row[-1] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}"))
+            self.assertIn("INDEX", plan, plan)
+
+    def test_timeline_reuses_stored_plan(self):
+        """재시작한 타임라인은 저장된 계획을 써서 스케줄을 다시 계산하지 않음"""
+        BellTimeline(ZONE, lambda day: WEEKDAY_SCHEDULE, 3, store=self.store, fingerprint="f").extend(DAY)
+        schedule = MagicMock(return_value=WEEKDAY_SCHEDULE)
+        warm = BellTimeline(ZONE, schedule, 3, store=self.store, fingerprint="f")
+        self.assertEqual(len(warm.extend(DAY)), 3 * len(WEEKDAY_SCHEDULE))
+        schedule.assert_not_called()
+
+
+class TestWarmRestart(unittest.TestCase):
+    """app 재시작 시 상태 복원"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.config = {"offset_corrected_firing": False, "timeline_days": 1, "misfire_grace_seconds": 60,
+                       "state_store_file": os.path.join(self.tmp.name, "state.sqlite3")}
+        open_state_store(self.config)
+        idx, hhmm, _ = WEEKDAY_SCHEDULE[1]
+        self.index = idx
+        self.bell_at = datetime.combine(DAY, datetime.strptime(hhmm, "%H:%M").time())
+        self.job_id = f"bell-{DAY:%Y%m%d}-{idx}"
+
+    def tearDown(self):
+        app.set_virtual_clock(None)
+        open_state_store({})
+        self.tmp.cleanup()
+
+    def _restart(self, now):
+        sched = MagicMock()
+        sched.get_jobs.return_value = []
+        with patch('app.get_current_time', return_value=now):
+            schedule_timeline(sched, self.config, ZONE)
+        return {call.kwargs["id"] for call in sched.add_job.call_args_list}
+
+    def test_restart_within_grace_plays_unplayed_bell_once(self):
+        """유예 시간 안에 재시작하면 아직 안 울린 종은 울리고, 이미 울린 종은 다시 울리지 않음"""
+        now = self.bell_at + timedelta(seconds=30)
+        self.assertIn(self.job_id, self._restart(now))
+
+        app.set_virtual_clock(lambda: now.replace(tzinfo=ZONE))
+        with patch('app.play_bell') as play:
+            fire_bell(self.index, {}, ZONE)
+            fire_bell(self.index, {}, ZONE)
+        play.assert_called_once()
+        self.assertNotIn(self.job_id, self._restart(now))
+
+    def test_bells_past_grace_are_recorded_missed(self):
+        """유예 시간이 지난 종은 놓친 것으로 기록되고 다시 울리지 않음"""
+        ids = self._restart(self.bell_at + timedelta(minutes=5))
+        self.assertNotIn(self.job_id, ids)
+        self.assertEqual(app._state_store.state_of(self.job_id), MISSED)
+
+    def test_fired_state_uses_planned_job_id(self):
+        """자정 근처에 당겨/미뤄 울린 종도 현재 날짜가 아닌 계획한 작업 id로 기록"""
+        app.set_virtual_clock(lambda: datetime.combine(DAY + timedelta(days=1), datetime.min.time(),
+                                                       tzinfo=ZONE) + timedelta(seconds=1))
+        with patch('app.play_bell') as play:
+            fire_bell(self.index, {}, ZONE, None, None, self.job_id)
+            fire_bell(self.index, {}, ZONE, None, None, self.job_id)
+        play.assert_called_once()
+        self.assertEqual(app._state_store.state_of(self.job_id), FIRED)
+        self.assertEqual(app._state_store.fired_for_day(DAY), {self.job_id})
+
+    def test_time_sync_state_persisted(self):
+        """동기화 상태를 저장소에 저장하고 복원"""
+        service = TimeSyncService([])
+        service.record_sample(TimeSample(offset=0.25, delay=0.01, source="ntp"))
+        with patch.object(app, "_watched_schedulers", set()):
+            app._on_time_sync(service)
+        state = app._state_store.get("time_sync")
+        restored = TimeSyncService([])
+        self.assertTrue(restored.restore_state(state, 3600))
+        self.assertAlmostEqual(restored.predict_offset(), 0.25, places=2)
+
+
+if __name__ == '__main__':
+    unittest.main()
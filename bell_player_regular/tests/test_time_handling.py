@@ -4,7 +4,7 @@
 
 import unittest
 import sys
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
@@ -13,6 +13,7 @@ parent_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(parent_dir))
 
 from app import hhmm_to_today, get_tz, get_current_time, get_ntp_time, get_worldtime_api
+from time_sync import TimeSample, TimeSyncService
 
 
 class TestTimeHandling(unittest.TestCase):
@@ -63,8 +64,8 @@ class TestTimeHandling(unittest.TestCase):
         with self.assertRaises(ValueError):
             get_tz("Invalid/Timezone")
 
-    @patch('app.get_ntp_time')
-    @patch('app.get_worldtime_api')
+    @patch('app.get_ntp_sample')
+    @patch('app.get_worldtime_sample')
     def test_get_current_time_fallback(self, mock_worldtime, mock_ntp):
         """시간 동기화 실패 시 폴백 테스트"""
         mock_ntp.return_value = None
@@ -73,14 +74,27 @@ class TestTimeHandling(unittest.TestCase):
         result = get_current_time()
         self.assertIsInstance(result, datetime)
 
-    @patch('app.get_ntp_time')
+    @patch('app.get_ntp_sample')
     def test_get_current_time_ntp_success(self, mock_ntp):
-        """NTP 시간 동기화 성공 테스트"""
-        test_time = datetime(2025, 10, 28, 12, 0, 0)
-        mock_ntp.return_value = test_time
-        
-        result = get_current_time()
-        self.assertEqual(result, test_time)
+        """NTP 오프셋 측정 후 get_current_time에 반영되는지 테스트"""
+        import app
+        mock_ntp.return_value = TimeSample(offset=3600.0, delay=0.02, source="test")
+        service = TimeSyncService([lambda: app.get_ntp_sample()])
+
+        with patch('app.time_sync', service):
+            self.assertTrue(service.sync_once())
+            result = get_current_time()
+
+        expected = datetime.now() + timedelta(hours=1)
+        self.assertLess(abs((result - expected).total_seconds()), 1.0)
+
+    @patch('app.get_ntp_sample')
+    @patch('app.get_worldtime_sample')
+    def test_get_current_time_does_not_query_network(self, mock_worldtime, mock_ntp):
+        """get_current_time은 네트워크 시간 소스를 직접 호출하지 않음"""
+        get_current_time()
+        mock_ntp.assert_not_called()
+        mock_worldtime.assert_not_called()
 
     @patch('requests.get')
     def test_get_worldtime_api_success(self, mock_get):
@@ -107,5 +121,39 @@ class TestTimeHandling(unittest.TestCase):
         self.assertIsNone(result)
 
 
+class TestTimeSourceBackoff(unittest.TestCase):
+    """시간 소스 백오프 적용 테스트"""
+
+    def setUp(self):
+        import app
+        app.source_health.reset()
+
+    def tearDown(self):
+        import app
+        app.source_health.reset()
+
+    @patch('app.query_ntp_server')
+    def test_failed_ntp_servers_are_skipped(self, mock_query):
+        """실패한 NTP 서버는 백오프 동안 다시 조회하지 않음"""
+        from app import get_ntp_sample
+        mock_query.return_value = None
+
+        self.assertIsNone(get_ntp_sample(["a", "b"], deadline=0.5))
+        self.assertEqual(mock_query.call_count, 2)
+
+        self.assertIsNone(get_ntp_sample(["a", "b"], deadline=0.5))
+        self.assertEqual(mock_query.call_count, 2)
+
+    @patch('requests.get')
+    def test_failed_worldtime_api_is_skipped(self, mock_get):
+        """WorldTimeAPI 실패 후 백오프 동안 요청하지 않음"""
+        from app import get_worldtime_sample
+        mock_get.side_effect = Exception("Network error")
+
+        self.assertIsNone(get_worldtime_sample())
+        self.assertIsNone(get_worldtime_sample())
+        self.assertEqual(mock_get.call_count, 1)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,354 @@
+"""
+시간 동기화 서비스 단위 테스트
+"""
+
+import unittest
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+# 부모 디렉토리를 경로에 추가하여 time_sync 모듈을 import 가능하게 함
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+from time_sync import (
+    DriftModel,
+    SourceHealthRegistry,
+    TimeSample,
+    TimeSyncService,
+    query_concurrently,
+    select_best_sample,
+)
+
+
+class TestTimeSyncService(unittest.TestCase):
+    """TimeSyncService 테스트"""
+
+    def test_initial_offset_is_zero(self):
+        """동기화 전에는 로컬 시간을 그대로 사용"""
+        service = TimeSyncService([])
+        self.assertEqual(service.offset_us, 0)
+        self.assertFalse(service.synced)
+        self.assertLess(abs((service.now() - datetime.now()).total_seconds()), 0.5)
+
+    def test_sync_once_stores_offset_in_microseconds(self):
+        """측정된 오프셋이 마이크로초 단위로 저장되는지 테스트"""
+        service = TimeSyncService([lambda: TimeSample(offset=1.5, delay=0.01, source="a")])
+        self.assertTrue(service.sync_once())
+        self.assertEqual(service.offset_us, 1_500_000)
+        self.assertEqual(service.last_sample.source, "a")
+
+    def test_sync_once_falls_back_to_next_source(self):
+        """첫 번째 소스 실패 시 다음 소스 사용"""
+        def broken():
+            raise OSError("network down")
+
+        service = TimeSyncService([
+            broken,
+            lambda: None,
+            lambda: TimeSample(offset=-0.25, delay=0.1, source="api"),
+        ])
+        self.assertTrue(service.sync_once())
+        self.assertEqual(service.offset_us, -250_000)
+
+    def test_failed_sync_keeps_previous_offset(self):
+        """모든 소스 실패 시 기존 오프셋 유지"""
+        results = [TimeSample(offset=2.0, delay=0.01, source="a"), None]
+        service = TimeSyncService([lambda: results.pop(0)])
+        self.assertTrue(service.sync_once())
+        self.assertFalse(service.sync_once())
+        self.assertEqual(service.offset_us, 2_000_000)
+
+    def test_background_thread_syncs_and_stops(self):
+        """백그라운드 스레드가 동기화 후 정상 종료되는지 테스트"""
+        service = TimeSyncService([lambda: TimeSample(offset=0.1, delay=0.01, source="a")],
+                                  interval_seconds=60)
+        service.start()
+        try:
+            deadline = time.monotonic() + 2.0
+            while not service.synced and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertTrue(service.synced)
+        finally:
+            service.stop()
+        self.assertFalse(service.running)
+
+
+    def test_restart_while_old_thread_busy(self):
+        """stop()의 join이 시간 초과된 뒤 다시 시작해도 이전 스레드는 조회가 끝나면 종료"""
+        release = threading.Event()
+
+        def slow_source():
+            release.wait(5.0)
+            return TimeSample(offset=0.1, delay=0.01, source="a")
+
+        service = TimeSyncService([slow_source], interval_seconds=60)
+        service.start()
+        old = service._thread
+        service.stop()  # 조회 중이라 join 시간 초과
+        self.assertTrue(old.is_alive())
+        service.start()
+        try:
+            self.assertIsNot(service._thread, old)
+            release.set()
+            old.join(2.0)
+            self.assertFalse(old.is_alive())
+            self.assertTrue(service.running)
+        finally:
+            service.stop()
+
+class TestConcurrentQuery(unittest.TestCase):
+    """병렬 조회 및 측정값 선택 테스트"""
+
+    def test_query_respects_global_deadline(self):
+        """느린 소스가 있어도 전체 마감 시간 안에 반환"""
+        def slow():
+            time.sleep(1.0)
+            return TimeSample(offset=0.0, delay=0.001, source="slow")
+
+        def fast():
+            return TimeSample(offset=0.0, delay=0.05, source="fast")
+
+        start = time.monotonic()
+        samples = query_concurrently([slow, fast, fast], deadline=0.2)
+        elapsed = time.monotonic() - start
+
+        self.assertLess(elapsed, 0.8)
+        self.assertEqual(sorted(s.source for s in samples), ["fast", "fast"])
+
+    def test_query_ignores_failures(self):
+        """예외나 None을 반환한 소스는 제외"""
+        def broken():
+            raise OSError("unreachable")
+
+        samples = query_concurrently(
+            [broken, lambda: None, lambda: TimeSample(0.1, 0.02, "ok")], deadline=1.0)
+        self.assertEqual([s.source for s in samples], ["ok"])
+
+    def test_select_lowest_delay(self):
+        """RTT가 가장 작은 측정값 선택"""
+        samples = [
+            TimeSample(offset=0.10, delay=0.08, source="a"),
+            TimeSample(offset=0.11, delay=0.02, source="b"),
+            TimeSample(offset=0.12, delay=0.05, source="c"),
+        ]
+        self.assertEqual(select_best_sample(samples).source, "b")
+
+    def test_select_rejects_outlier(self):
+        """중앙값에서 크게 벗어난 서버는 RTT가 작아도 제외"""
+        samples = [
+            TimeSample(offset=0.10, delay=0.08, source="a"),
+            TimeSample(offset=0.12, delay=0.05, source="b"),
+            TimeSample(offset=30.0, delay=0.001, source="bad"),
+        ]
+        self.assertEqual(select_best_sample(samples).source, "b")
+
+    def test_select_empty(self):
+        """측정값이 없으면 None"""
+        self.assertIsNone(select_best_sample([]))
+
+
+class TestDriftModel(unittest.TestCase):
+    """드리프트 모델 테스트"""
+
+    def test_single_sample_is_constant(self):
+        """측정값이 하나면 그 값을 그대로 예측"""
+        model = DriftModel()
+        model.add(100.0, 0.25, 0.01)
+        self.assertAlmostEqual(model.predict(5000.0), 0.25)
+        self.assertEqual(model.drift_ppm, 0.0)
+
+    def test_linear_drift_is_estimated(self):
+        """일정한 드리프트(50ppm)를 추정하고 외삽"""
+        model = DriftModel(min_span_seconds=60)
+        for i in range(5):
+            t = 1000.0 + i * 3600.0
+            model.add(t, 0.1 + 50e-6 * (t - 1000.0), 0.02)
+        self.assertAlmostEqual(model.drift_ppm, 50.0, places=3)
+        t_future = 1000.0 + 6 * 3600.0
+        self.assertAlmostEqual(model.predict(t_future), 0.1 + 50e-6 * 6 * 3600.0, places=4)
+
+    def test_high_rtt_samples_weigh_less(self):
+        """RTT가 큰 측정값은 적합에 미치는 영향이 작음"""
+        model = DriftModel(min_span_seconds=60)
+        model.add(0.0, 0.0, 0.01)
+        model.add(600.0, 0.0, 0.01)
+        model.add(1200.0, 0.5, 1.0)  # 지연이 큰 이상치
+        self.assertLess(abs(model.predict(1200.0)), 0.05)
+
+    def test_drift_is_clamped(self):
+        """비현실적인 드리프트는 max_drift_ppm으로 제한"""
+        model = DriftModel(min_span_seconds=1, max_drift_ppm=100)
+        model.add(0.0, 0.0, 0.01)
+        model.add(10.0, 1.0, 0.01)
+        self.assertAlmostEqual(model.drift_ppm, 100.0)
+
+    def test_service_stretches_interval_when_prediction_holds(self):
+        """예측이 맞으면 동기화 주기를 최대값까지 늘리고, 틀리면 초기화"""
+        service = TimeSyncService([], interval_seconds=600, max_interval_seconds=3600)
+        for i in range(6):
+            service.record_sample(TimeSample(0.2, 0.01, "a"), mono=i * 600.0)
+        self.assertEqual(service.current_interval, 3600)
+
+        service.record_sample(TimeSample(1.2, 0.01, "a"), mono=4000.0)
+        self.assertEqual(service.current_interval, 600)
+
+
+class TestTimeSyncState(unittest.TestCase):
+    """오프셋 저장/복원 테스트"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "logs", "time_sync_state.json")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_save_and_load_roundtrip(self):
+        """저장한 오프셋을 새 서비스가 바로 사용"""
+        service = TimeSyncService([lambda: TimeSample(offset=2.5, delay=0.01, source="a")])
+        service.state_path = self.path
+        self.assertTrue(service.sync_once())
+        self.assertTrue(os.path.exists(self.path))
+
+        restored = TimeSyncService([])
+        self.assertTrue(restored.load_state(self.path, max_age_seconds=3600))
+        self.assertAlmostEqual(restored.offset_us / 1_000_000, 2.5, places=3)
+        self.assertFalse(restored.synced)
+
+    def test_load_extrapolates_drift(self):
+        """저장 이후 경과 시간만큼 드리프트를 반영"""
+        now = time.time()
+        path = os.path.join(self.tmpdir.name, "state.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"offset": 1.0, "drift_ppm": 100.0,
+                       "measured_at": now - 3600, "saved_at": now - 3600}, f)
+        service = TimeSyncService([])
+        self.assertTrue(service.load_state(path, 86400))
+        self.assertAlmostEqual(service.predict_offset(), 1.0 + 100e-6 * 3600, places=3)
+        self.assertAlmostEqual(service.drift_ppm, 100.0)
+
+    def test_status_reports_restored_offset(self):
+        """복원한 오프셋은 실제 동기화 전까지 restored 상태로 표시되고 GUI에서 실패와 구분됨"""
+        from gui import BellRegularGUI
+
+        now = time.time()
+        service = TimeSyncService([lambda: TimeSample(offset=0.1, delay=0.01, source="ntp")])
+        self.assertTrue(service.restore_state({"offset": 0.25, "measured_at": now - 1800,
+                                               "saved_at": now - 1800, "source": "ntp"}, 3600))
+        status = service.status()
+        self.assertFalse(status["synced"])
+        self.assertTrue(status["restored"])
+        self.assertAlmostEqual(status["restored_age_seconds"], 1800, delta=5)
+        text, color = BellRegularGUI.format_sync_status(status)
+        self.assertIn("저장된 오프셋 +250ms", text)
+        self.assertIn("30분 전", text)
+        self.assertNotEqual(color, BellRegularGUI.format_sync_status({"synced": False})[1])
+
+        self.assertTrue(service.sync_once())
+        self.assertFalse(service.status()["restored"])
+
+    def test_load_ignores_stale_state(self):
+        """유효 기간이 지난 상태는 무시"""
+        old = time.time() - 7200
+        path = os.path.join(self.tmpdir.name, "state.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"offset": 5.0, "drift_ppm": 0.0, "measured_at": old, "saved_at": old}, f)
+        service = TimeSyncService([])
+        self.assertFalse(service.load_state(path, max_age_seconds=3600))
+        self.assertEqual(service.offset_us, 0)
+
+    def test_load_missing_or_corrupt_file(self):
+        """파일이 없거나 손상되어도 예외 없이 무시"""
+        service = TimeSyncService([])
+        self.assertFalse(service.load_state(os.path.join(self.tmpdir.name, "none.json"), 3600))
+
+        path = os.path.join(self.tmpdir.name, "bad.json")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("{not json")
+        self.assertFalse(service.load_state(path, 3600))
+
+
+class TestSyncTelemetry(unittest.TestCase):
+    """동기화 품질 텔레메트리 테스트"""
+
+    def test_history_is_bounded_ring_buffer(self):
+        """링 버퍼는 최근 history_size개만 유지"""
+        service = TimeSyncService([], history_size=3)
+        for i in range(5):
+            service.record_sample(TimeSample(offset=i * 0.001, delay=0.01, source=f"s{i}"))
+        history = service.history()
+        self.assertEqual([r.source for r in history], ["s2", "s3", "s4"])
+        self.assertTrue(all(r.ok for r in history))
+
+    def test_failures_are_recorded(self):
+        """모든 소스 실패도 기록되고 성공하면 연속 실패가 초기화됨"""
+        results = [None, None, TimeSample(offset=0.2, delay=0.03, source="ntp", dispersion=0.004)]
+        service = TimeSyncService([lambda: results.pop(0)])
+        self.assertFalse(service.sync_once())
+        self.assertFalse(service.sync_once())
+        self.assertEqual(service.status()["consecutive_failures"], 2)
+
+        self.assertTrue(service.sync_once())
+        status = service.status()
+        self.assertEqual(status["consecutive_failures"], 0)
+        self.assertEqual(status["source"], "ntp")
+        self.assertAlmostEqual(status["rtt_ms"], 30.0)
+        self.assertAlmostEqual(status["dispersion_ms"], 4.0)
+        self.assertLess(status["last_success_age_seconds"], 5)
+        self.assertEqual([r["ok"] for r in status["recent"]], [False, False, True])
+
+    def test_status_dump_is_json(self):
+        """status_path가 있으면 동기화마다 JSON 상태 파일 기록"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "logs", "time_sync_status.json")
+            service = TimeSyncService([lambda: TimeSample(offset=-0.5, delay=0.02, source="a")])
+            service.status_path = path
+            service.sync_once()
+            with open(path, encoding="utf-8") as f:
+                dumped = json.load(f)
+        self.assertTrue(dumped["synced"])
+        self.assertAlmostEqual(dumped["last_offset_ms"], -500.0)
+        self.assertEqual(len(dumped["recent"]), 1)
+
+
+class TestSourceHealth(unittest.TestCase):
+    """시간 소스 상태 및 백오프 테스트"""
+
+    def setUp(self):
+        self.now = 1000.0
+        self.registry = SourceHealthRegistry(base_backoff_seconds=10, max_backoff_seconds=60,
+                                             clock=lambda: self.now)
+
+    def test_exponential_backoff(self):
+        """연속 실패마다 백오프가 두 배로 늘고 최대값에서 멈춤"""
+        backoffs = [self.registry.record_failure("a") for _ in range(5)]
+        self.assertEqual(backoffs, [10, 20, 40, 60, 60])
+        self.assertFalse(self.registry.allowed("a"))
+
+        self.now += 60
+        self.assertTrue(self.registry.allowed("a"))
+
+    def test_success_resets_backoff(self):
+        """성공하면 연속 실패와 백오프 초기화"""
+        self.registry.record_failure("a")
+        self.registry.record_success("a", 0.05)
+        self.assertTrue(self.registry.allowed("a"))
+        self.assertEqual(self.registry.record_failure("a"), 10)
+
+    def test_ordered_by_health(self):
+        """실패 적고 빠른 소스가 먼저, 백오프 중인 소스는 제외"""
+        self.registry.record_success("slow", 0.3)
+        self.registry.record_success("fast", 0.02)
+        self.registry.record_failure("down")
+        self.assertEqual(self.registry.ordered(["down", "slow", "fast"]), ["fast", "slow", "down"])
+        self.assertEqual(self.registry.available(["down", "slow", "fast"]), ["fast", "slow"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,166 @@
+"""
+asyncio 시간 동기화 클라이언트 테스트 (가짜 NTP/HTTP 서버 사용, 네트워크 불필요)
+"""
+
+import asyncio
+import unittest
+import sys
+import threading
+import time
+from pathlib import Path
+
+# 부모 디렉토리를 경로에 추가하여 app 모듈을 import 가능하게 함
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from fake_time_servers import FakeNTPServer, FakeWorldTimeServer
+from time_sync import SourceHealthRegistry, TimeSyncService
+from time_sync_async import AsyncHTTPClient, AsyncTimeSyncClient, async_query_ntp
+
+
+class TestAsyncNTP(unittest.TestCase):
+    """비동기 NTP 조회 테스트"""
+
+    def test_measures_configured_offset(self):
+        """서버 오프셋을 수 ms 이내로 측정"""
+        with FakeNTPServer(offset=1.5, delay=0.02) as ntp:
+            sample = asyncio.run(async_query_ntp(ntp.address, 1.0))
+        self.assertIsNotNone(sample)
+        self.assertAlmostEqual(sample.offset, 1.5, delta=0.01)
+        self.assertGreaterEqual(sample.delay, 0.015)
+        self.assertEqual(sample.source, ntp.address)
+
+    def test_timeout_returns_none(self):
+        """응답이 없으면 타임아웃 후 None"""
+        with FakeNTPServer(drop_rate=1.0) as ntp:
+            start = time.monotonic()
+            sample = asyncio.run(async_query_ntp(ntp.address, 0.3))
+            elapsed = time.monotonic() - start
+        self.assertIsNone(sample)
+        self.assertLess(elapsed, 1.0)
+
+    def test_concurrent_queries_share_one_thread(self):
+        """여러 서버 조회가 스레드 없이 동시에 진행됨"""
+        async def query_all(addresses):
+            return await asyncio.gather(*(async_query_ntp(a, 1.0) for a in addresses))
+
+        servers = [FakeNTPServer(offset=0.5, delay=0.2, seed=i) for i in range(4)]
+        for s in servers:
+            s.start()
+        try:
+            start = time.monotonic()
+            samples = asyncio.run(query_all([s.address for s in servers]))
+            elapsed = time.monotonic() - start
+        finally:
+            for s in servers:
+                s.stop()
+        self.assertTrue(all(samples))
+        self.assertLess(elapsed, 0.6)  # 순차 조회라면 0.8초 이상
+
+
+class TestAsyncHTTPClient(unittest.TestCase):
+    """keep-alive HTTP 클라이언트 테스트"""
+
+    def test_connection_is_reused(self):
+        """같은 호스트로의 연속 요청은 연결 하나를 재사용"""
+        async def fetch_twice(url):
+            client = AsyncHTTPClient()
+            try:
+                first = await client.get_json(url)
+                second = await client.get_json(url)
+                return first, second, client.connections_opened
+            finally:
+                await client.close()
+
+        with FakeWorldTimeServer() as api:
+            first, second, opened = asyncio.run(fetch_twice(api.url))
+        self.assertIn("datetime", first)
+        self.assertIn("datetime", second)
+        self.assertEqual(opened, 1)
+
+    def test_chunked_body_and_reuse(self):
+        """chunked 본문을 읽고 같은 연결을 계속 재사용"""
+        async def fetch_twice(url):
+            client = AsyncHTTPClient()
+            try:
+                return await client.get_json(url), await client.get_json(url), client.connections_opened
+            finally:
+                await client.close()
+
+        with FakeWorldTimeServer(chunked=True) as api:
+            first, second, opened = asyncio.run(fetch_twice(api.url))
+        self.assertIn("datetime", first)
+        self.assertIn("datetime", second)
+        self.assertEqual(opened, 1)
+
+    def test_unsupported_scheme_rejected(self):
+        """http/https 외의 스킴은 ValueError"""
+        with self.assertRaises(ValueError):
+            asyncio.run(AsyncHTTPClient().get_json("ftp://example.com/time"))
+
+    def test_dropped_connection_raises(self):
+        """응답 없이 연결이 끊기면 ConnectionError"""
+        async def fetch(url):
+            client = AsyncHTTPClient()
+            try:
+                return await client.get_json(url)
+            finally:
+                await client.close()
+
+        with FakeWorldTimeServer(drop_rate=1.0) as api:
+            with self.assertRaises(ConnectionError):
+                asyncio.run(fetch(api.url))
+
+
+class TestAsyncTimeSyncClient(unittest.TestCase):
+    """비동기 동기화 → TimeSyncService 갱신 테스트"""
+
+    def test_sync_updates_service(self):
+        """NTP 결과가 같은 서비스의 오프셋 예측에 반영됨"""
+        service = TimeSyncService([])
+        with FakeNTPServer(offset=-0.7, delay=0.01) as ntp:
+            client = AsyncTimeSyncClient(service, [ntp.address], None, deadline=1.0)
+            self.assertTrue(asyncio.run(client.sync_once()))
+        self.assertTrue(service.synced)
+        self.assertAlmostEqual(service.predict_offset(), -0.7, delta=0.01)
+
+    def test_finish_sync_runs_off_event_loop(self):
+        """상태 저장과 리스너는 이벤트 루프 스레드가 아닌 실행기 스레드에서 실행"""
+        service = TimeSyncService([])
+        threads = []
+        service.add_listener(lambda _: threads.append(threading.get_ident()))
+
+        async def sync(client):
+            ok = await client.sync_once()
+            return ok, threading.get_ident()
+
+        with FakeNTPServer(offset=0.2, delay=0.01) as ntp:
+            client = AsyncTimeSyncClient(service, [ntp.address], None, deadline=1.0)
+            ok, loop_thread = asyncio.run(sync(client))
+        self.assertTrue(ok)
+        self.assertEqual(len(threads), 1)
+        self.assertNotEqual(threads[0], loop_thread)
+
+    def test_falls_back_to_http_and_backs_off_dead_ntp(self):
+        """NTP가 모두 실패하면 WorldTimeAPI를 쓰고 실패한 서버는 백오프"""
+        service = TimeSyncService([])
+        health = SourceHealthRegistry()
+        with FakeNTPServer(drop_rate=1.0) as ntp, FakeWorldTimeServer(offset=3.0) as api:
+            client = AsyncTimeSyncClient(service, [ntp.address], api.url, deadline=0.3, health=health)
+            self.assertTrue(asyncio.run(client.sync_once()))
+        self.assertEqual(service.last_sample.source, "worldtimeapi")
+        self.assertAlmostEqual(service.predict_offset(), 3.0, delta=0.05)
+        self.assertFalse(health.allowed(ntp.address))
+
+    def test_app_factory_shares_service_and_health(self):
+        """app에서 만든 클라이언트는 전역 time_sync와 source_health를 공유"""
+        import app
+        client = app.create_async_time_sync_client()
+        self.assertIs(client.service, app.time_sync)
+        self.assertIs(client.health, app.source_health)
+        self.assertEqual(client.ntp_servers, app.NTP_SERVERS)
+
+
+if __name__ == '__main__':
+    unittest.main()
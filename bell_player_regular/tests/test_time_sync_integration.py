@@ -0,0 +1,117 @@
+"""
+가짜 NTP/HTTP 시간 서버를 이용한 시간 동기화 통합 테스트 (네트워크 불필요)
+"""
+
+import unittest
+import sys
+import time
+from pathlib import Path
+
+# 부모 디렉토리를 경로에 추가하여 app 모듈을 import 가능하게 함
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+sys.path.insert(0, str(Path(__file__).parent))
+
+import app
+from app import get_ntp_sample, get_worldtime_api, get_worldtime_sample, split_host_port
+from fake_time_servers import FakeNTPServer, FakeWorldTimeServer
+from time_sync import TimeSyncService
+
+
+class TestSplitHostPort(unittest.TestCase):
+    """서버 주소 파싱 테스트"""
+
+    def test_host_only(self):
+        """포트가 없으면 기본 NTP 포트"""
+        self.assertEqual(split_host_port("pool.ntp.org"), ("pool.ntp.org", "ntp"))
+
+    def test_host_and_port(self):
+        """'host:port' 형식 파싱"""
+        self.assertEqual(split_host_port("127.0.0.1:12345"), ("127.0.0.1", 12345))
+
+
+class TestFakeNTP(unittest.TestCase):
+    """가짜 NTP 서버 통합 테스트"""
+
+    def setUp(self):
+        app.source_health.reset()
+
+    def tearDown(self):
+        app.source_health.reset()
+
+    def test_measures_configured_offset(self):
+        """서버 오프셋을 수 ms 이내로 측정"""
+        with FakeNTPServer(offset=1.5, delay=0.02) as ntp:
+            sample = get_ntp_sample([ntp.address], deadline=1.0)
+        self.assertIsNotNone(sample)
+        self.assertAlmostEqual(sample.offset, 1.5, delta=0.01)
+        self.assertGreaterEqual(sample.delay, 0.015)
+
+    def test_picks_lowest_delay_server(self):
+        """여러 서버 중 RTT가 가장 작은 서버 선택"""
+        with FakeNTPServer(offset=0.2, delay=0.15) as slow, FakeNTPServer(offset=0.2, delay=0.01) as fast:
+            sample = get_ntp_sample([slow.address, fast.address], deadline=1.0)
+        self.assertEqual(sample.source, fast.address)
+
+    def test_deadline_with_dropping_server(self):
+        """응답하지 않는 서버가 있어도 마감 시간 안에 다른 서버 결과 반환"""
+        with FakeNTPServer(drop_rate=1.0) as dead, FakeNTPServer(offset=-0.3) as alive:
+            start = time.monotonic()
+            sample = get_ntp_sample([dead.address, alive.address], deadline=0.5)
+            elapsed = time.monotonic() - start
+        self.assertLess(elapsed, 1.0)
+        self.assertAlmostEqual(sample.offset, -0.3, delta=0.01)
+
+
+class TestFakeWorldTime(unittest.TestCase):
+    """가짜 WorldTimeAPI 서버 통합 테스트"""
+
+    def setUp(self):
+        app.source_health.reset()
+
+    def tearDown(self):
+        app.source_health.reset()
+
+    def test_worldtime_sample_offset(self):
+        """HTTP 응답 시간으로 오프셋 측정"""
+        with FakeWorldTimeServer(offset=-2.0, delay=0.01) as api:
+            sample = get_worldtime_sample(api.url)
+        self.assertIsNotNone(sample)
+        self.assertAlmostEqual(sample.offset, -2.0, delta=0.05)
+
+    def test_worldtime_api_datetime(self):
+        """get_worldtime_api가 naive datetime 반환"""
+        with FakeWorldTimeServer() as api:
+            result = get_worldtime_api(api.url)
+        self.assertIsNotNone(result)
+        self.assertIsNone(result.tzinfo)
+
+    def test_dropped_request_returns_none(self):
+        """연결이 끊기면 None"""
+        with FakeWorldTimeServer(drop_rate=1.0) as api:
+            self.assertIsNone(get_worldtime_sample(api.url))
+
+
+class TestServiceEndToEnd(unittest.TestCase):
+    """TimeSyncService + 가짜 서버 종단 테스트"""
+
+    def setUp(self):
+        app.source_health.reset()
+
+    def tearDown(self):
+        app.source_health.reset()
+
+    def test_service_falls_back_to_http(self):
+        """NTP가 모두 실패하면 WorldTimeAPI 결과 사용"""
+        with FakeNTPServer(drop_rate=1.0) as ntp, FakeWorldTimeServer(offset=3.0) as api:
+            service = TimeSyncService([
+                lambda: get_ntp_sample([ntp.address], deadline=0.3),
+                lambda: get_worldtime_sample(api.url),
+            ])
+            self.assertTrue(service.sync_once())
+        self.assertEqual(service.last_sample.source, app.WORLDTIME_SOURCE_NAME)
+        self.assertAlmostEqual(service.predict_offset(), 3.0, delta=0.05)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+"""
+롤링 종 타임라인 테스트
+"""
+
+import unittest
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+# 부모 디렉토리를 경로에 추가하여 app 모듈을 import 가능하게 함
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+import app
+from app import SUNDAY_SCHEDULE, WEEKDAY_SCHEDULE, get_tz, schedule_for_date, schedule_timeline
+from heap_scheduler import HeapScheduler
+from timeline import BellTimeline, compile_day, parse_hhmm
+
+MONDAY = date(2025, 10, 27)
+
+
+class TestCompile(unittest.TestCase):
+    """스케줄 컴파일 테스트"""
+
+    def setUp(self):
+        self.zone = get_tz("Asia/Seoul")
+
+    def test_parse_hhmm(self):
+        """콜론 유무와 관계없이 파싱"""
+        self.assertEqual(parse_hhmm("06:05"), (6, 5))
+        self.assertEqual(parse_hhmm("0605"), (6, 5))
+        self.assertEqual(parse_hhmm("605"), (6, 5))
+
+    def test_compile_day_ids_and_order(self):
+        """날짜가 포함된 id와 발사 시각 순서"""
+        entries = compile_day(MONDAY, [(2, "12:00", "b"), (1, "06:00", "a")], self.zone)
+        self.assertEqual([e.job_id for e in entries], ["bell-20251027-1", "bell-20251027-2"])
+        self.assertEqual(entries[0].run_at, datetime(2025, 10, 27, 6, 0, tzinfo=self.zone))
+
+    def test_schedule_for_date_by_weekday(self):
+        """일요일은 일요일 스케줄, 나머지는 평일 스케줄"""
+        self.assertIs(schedule_for_date(MONDAY), WEEKDAY_SCHEDULE)
+        self.assertIs(schedule_for_date(MONDAY + timedelta(days=5)), WEEKDAY_SCHEDULE)
+        self.assertIs(schedule_for_date(MONDAY + timedelta(days=6)), SUNDAY_SCHEDULE)
+
+
+class TestBellTimeline(unittest.TestCase):
+    """타임라인 연장/정리 테스트"""
+
+    def setUp(self):
+        self.timeline = BellTimeline(get_tz("Asia/Seoul"), schedule_for_date, horizon_days=7)
+
+    def test_initial_extend_covers_horizon(self):
+        """처음에는 horizon 일수만큼 컴파일"""
+        added = self.timeline.extend(MONDAY)
+        self.assertEqual(len(self.timeline.days), 7)
+        self.assertEqual(len(added), 6 * len(WEEKDAY_SCHEDULE) + len(SUNDAY_SCHEDULE))
+
+    def test_next_day_adds_only_one_day(self):
+        """다음 날에는 새로 들어온 하루치만 추가"""
+        self.timeline.extend(MONDAY)
+        tuesday = MONDAY + timedelta(days=1)
+        removed = self.timeline.prune(tuesday)
+        added = self.timeline.extend(tuesday)
+
+        self.assertEqual(len(removed), len(WEEKDAY_SCHEDULE))
+        self.assertEqual({e.run_at.date() for e in added}, {MONDAY + timedelta(days=7)})
+        self.assertEqual(self.timeline.days[0], tuesday)
+        self.assertEqual(len(self.timeline.days), 7)
+
+    def test_extend_is_idempotent(self):
+        """같은 날 다시 호출해도 추가 없음"""
+        self.timeline.extend(MONDAY)
+        self.assertEqual(self.timeline.extend(MONDAY), [])
+
+
+class TestScheduleTimeline(unittest.TestCase):
+    """app.schedule_timeline 통합 테스트 (heap 엔진 사용)"""
+
+    def setUp(self):
+        self.zone = get_tz("Asia/Seoul")
+        self.sched = HeapScheduler(timezone=self.zone)
+        self.config = {"offset_corrected_firing": False, "timeline_days": 7}
+
+    def _at(self, day, hh=0, mm=0):
+        return patch('app.get_current_time', return_value=datetime(day.year, day.month, day.day, hh, mm))
+
+    def test_registers_seven_days_of_remaining_bells(self):
+        """오늘 남은 종 + 이후 6일치 종 등록"""
+        with self._at(MONDAY, 12, 30):
+            count = schedule_timeline(self.sched, self.config, self.zone)
+        remaining_today = sum(1 for _, hhmm, _ in WEEKDAY_SCHEDULE if hhmm > "12:30")
+        self.assertEqual(count, remaining_today + 5 * len(WEEKDAY_SCHEDULE) + len(SUNDAY_SCHEDULE))
+        self.assertIsNone(self.sched.get_job("bell-20251027-1"))
+        self.assertIsNotNone(self.sched.get_job("bell-20251102-1"))  # 일요일
+
+    def test_daily_extension_does_not_touch_existing_jobs(self):
+        """날짜가 바뀌면 새 날만 추가하고 기존 작업은 그대로 유지"""
+        with self._at(MONDAY):
+            schedule_timeline(self.sched, self.config, self.zone)
+        existing = self.sched.get_job("bell-20251028-5")
+
+        with self._at(MONDAY + timedelta(days=1), 0, 1), \
+                patch.object(self.sched, "remove_all_jobs", side_effect=AssertionError("전체 삭제 금지")):
+            count = schedule_timeline(self.sched, self.config, self.zone)
+
+        self.assertEqual(count, len(WEEKDAY_SCHEDULE))
+        self.assertIsNotNone(self.sched.get_job("bell-20251103-1"))
+        self.assertIs(self.sched.get_job("bell-20251028-5"), existing)
+
+    def test_autoplay_off_schedules_today_only(self):
+        """autoplay_next_day=false면 오늘만 등록"""
+        self.config["autoplay_next_day"] = False
+        with self._at(MONDAY):
+            count = schedule_timeline(self.sched, self.config, self.zone)
+        self.assertEqual(count, len(WEEKDAY_SCHEDULE))
+
+    def test_refresh_job_extends_and_rearms(self):
+        """연장 작업은 타임라인을 연장하고 다음 날 연장 작업을 다시 등록"""
+        with self._at(MONDAY):
+            schedule_timeline(self.sched, self.config, self.zone)
+        app.schedule_next_day_refresh(self.sched, self.config, self.zone)
+        refresh_jobs = [j for j in self.sched.get_jobs() if j.id.startswith("daily-refresh-")]
+        self.assertEqual(len(refresh_jobs), 1)
+        self.assertIsNone(refresh_jobs[0].misfire_grace_time)
+
+        self.sched.remove_job(refresh_jobs[0].id)  # 실행 시 스케줄러가 제거하는 것과 동일
+        with self._at(MONDAY + timedelta(days=1), 0, 1):
+            refresh_jobs[0].func()
+        self.assertIsNotNone(self.sched.get_job("bell-20251103-1"))
+        self.assertEqual(len([j for j in self.sched.get_jobs() if j.id.startswith("daily-refresh-")]), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
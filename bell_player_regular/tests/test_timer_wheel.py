@@ -0,0 +1,169 @@
+"""
+계층형 타이머 휠 스케줄러 테스트
+"""
+
+import unittest
+import random
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+# 부모 디렉토리를 경로에 추가하여 app 모듈을 import 가능하게 함
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+from app import WEEKDAY_SCHEDULE, create_scheduler, get_tz, schedule_timeline
+from heap_scheduler import ConflictingIdError, JobLookupError
+from job_planner import PlannedJob
+from timer_wheel import TimerWheelScheduler
+
+BASE = datetime(2025, 10, 27, 0, 0, tzinfo=get_tz("Asia/Seoul"))
+
+
+def _noop():
+    pass
+
+
+class TestWheelAdvance(unittest.TestCase):
+    """가상 틱으로 휠을 진행시키는 테스트 (타이머 스레드 없음)"""
+
+    def setUp(self):
+        self.sched = TimerWheelScheduler(timezone=BASE.tzinfo)
+        self.sched._tick = self.sched._tick_of(BASE.timestamp())
+
+    def _advance_to(self, when):
+        return self.sched._advance(self.sched._tick_of(when.timestamp()))
+
+    def test_random_offsets_fire_once_in_order_never_early(self):
+        """초 단위부터 수개월 뒤까지 섞인 작업이 한 번씩, 시각 순서로, 일찍 울리지 않음"""
+        rng = random.Random(7)
+        offsets = [rng.choice([rng.uniform(0, 3), rng.uniform(0, 900), rng.uniform(0, 86400 * 3),
+                               rng.uniform(0, 86400 * 120)]) for _ in range(3000)]
+        self.sched.add_jobs(_noop, [(f"job-{i}", BASE + timedelta(seconds=s), ())
+                                    for i, s in enumerate(offsets)])
+        fired = []
+        now = BASE
+        while len(fired) < len(offsets):
+            now += timedelta(seconds=rng.choice([0.05, 1, 30, 3600, 86400]))
+            for job in self._advance_to(now):
+                self.assertLessEqual(job.next_run_time, now)
+                self.assertLess((now - job.next_run_time).total_seconds(), 86400 + 0.02)
+                fired.append(job)
+        self.assertEqual(len({j.id for j in fired}), len(offsets))
+        self.assertEqual([j.next_run_time for j in fired], sorted(j.next_run_time for j in fired))
+        self.assertEqual(self.sched.get_jobs(), [])
+
+    def test_fires_within_one_tick(self):
+        """틱 단위로 진행하면 최대 한 틱 늦게 울림"""
+        target = BASE + timedelta(seconds=12.345)
+        self.sched.add_job(_noop, "date", run_date=target, id="bell-1")
+        self.assertEqual(self._advance_to(target - timedelta(milliseconds=5)), [])
+        due = self._advance_to(target + timedelta(seconds=self.sched.tick_seconds))
+        self.assertEqual([j.id for j in due], ["bell-1"])
+
+    def test_cancel_and_reschedule(self):
+        """취소된 작업은 울리지 않고, 재조정한 작업은 새 시각에 울림"""
+        self.sched.add_job(_noop, "date", run_date=BASE + timedelta(hours=5), id="bell-a")
+        self.sched.add_job(_noop, "date", run_date=BASE + timedelta(hours=5), id="bell-b")
+        self.sched.remove_job("bell-a")
+        self.sched.reschedule_job("bell-b", trigger="date", run_date=BASE + timedelta(seconds=1))
+        self.assertEqual([j.id for j in self._advance_to(BASE + timedelta(seconds=2))], ["bell-b"])
+        self.assertEqual(self._advance_to(BASE + timedelta(days=1)), [])
+        with self.assertRaises(JobLookupError):
+            self.sched.remove_job("bell-a")
+
+    def test_clock_step_backwards(self):
+        """시계가 뒤로 간 뒤 재조정한 작업은 새 시각에 울리고, 다른 작업도 원래 시각에 울림"""
+        self.sched.add_job(_noop, "date", run_date=BASE + timedelta(minutes=30), id="bell-a")
+        self.sched.add_job(_noop, "date", run_date=BASE + timedelta(minutes=10), id="bell-b")
+        # 한 시간 뒤로 점프: shift_pending_jobs처럼 bell-a만 같은 크기만큼 옮김
+        stepped = BASE - timedelta(hours=1)
+        self.sched.reschedule_job("bell-a", trigger="date", run_date=stepped + timedelta(minutes=30))
+        self.assertEqual(self._advance_to(stepped + timedelta(minutes=29)), [])
+        due = self._advance_to(stepped + timedelta(minutes=30, seconds=1))
+        self.assertEqual([j.id for j in due], ["bell-a"])
+        self.assertEqual(self._advance_to(BASE + timedelta(minutes=9)), [])
+        self.assertEqual([j.id for j in self._advance_to(BASE + timedelta(minutes=10, seconds=1))], ["bell-b"])
+
+    def test_conflicting_id(self):
+        """replace_existing=False면 같은 id 거부, True면 교체"""
+        self.sched.add_job(_noop, "date", run_date=BASE + timedelta(hours=1), id="bell-a")
+        with self.assertRaises(ConflictingIdError):
+            self.sched.add_job(_noop, "date", run_date=BASE + timedelta(hours=2), id="bell-a")
+        self.sched.add_job(_noop, "date", run_date=BASE + timedelta(hours=2), id="bell-a",
+                           replace_existing=True)
+        self.assertEqual(len(self.sched.get_jobs()), 1)
+        self.assertEqual(self._advance_to(BASE + timedelta(hours=1, minutes=30)), [])
+
+    def test_overflow_beyond_wheel_range(self):
+        """휠 범위(약 1.4년)를 넘는 작업도 결국 울림"""
+        far = BASE + timedelta(days=600)
+        self.sched.add_job(_noop, "date", run_date=far, id="bell-far")
+        self.assertEqual(len(self.sched._overflow), 1)
+        self.assertEqual(self._advance_to(far - timedelta(days=1)), [])
+        self.assertEqual([j.id for j in self._advance_to(far + timedelta(seconds=1))], ["bell-far"])
+
+    def test_overflow_in_single_advance(self):
+        """한 번에 멀리 진행해도 overflow 작업을 늦지 않게 꺼냄"""
+        far = BASE + timedelta(days=600)
+        self.sched.add_job(_noop, "date", run_date=far, id="bell-far")
+        self.sched.add_job(_noop, "date", run_date=far + timedelta(days=1), id="bell-later")
+        due = self._advance_to(far + timedelta(days=2))
+        self.assertEqual([j.id for j in due], ["bell-far", "bell-later"])
+        self.assertEqual(self.sched._tick, self.sched._tick_of((far + timedelta(days=2)).timestamp()))
+
+
+class TestWheelRuntime(unittest.TestCase):
+    """타이머 스레드로 실제 실행"""
+
+    def test_jobs_fire_on_time(self):
+        """타이머 스레드가 작업을 예정 시각 직후에 실행"""
+        sched = TimerWheelScheduler()
+        done = threading.Event()
+        lateness = []
+
+        def fire(expected):
+            lateness.append(time.time() - expected)
+            if len(lateness) == 3:
+                done.set()
+
+        sched.start()
+        try:
+            start = datetime.now().astimezone() + timedelta(seconds=0.2)
+            for i in range(3):
+                run_at = start + timedelta(seconds=0.1 * i)
+                sched.add_job(fire, "date", run_date=run_at, args=[run_at.timestamp()], id=f"bell-{i}")
+            self.assertTrue(done.wait(5))
+        finally:
+            sched.shutdown()
+        self.assertTrue(all(-0.001 <= x < 0.1 for x in lateness), lateness)
+
+
+class TestWheelEngine(unittest.TestCase):
+    """app에서 wheel 엔진 사용"""
+
+    def test_create_and_bulk_schedule(self):
+        """scheduler_engine=wheel로 만들고 타임라인을 일괄 등록"""
+        zone = get_tz("Asia/Seoul")
+        sched = create_scheduler({"scheduler_engine": "wheel"}, zone, background=True)
+        self.assertIsInstance(sched, TimerWheelScheduler)
+        config = {"offset_corrected_firing": False, "timeline_days": 1}
+        with patch('app.get_current_time', return_value=datetime(2025, 10, 27, 0, 0)), \
+                patch.object(sched, "add_job", side_effect=AssertionError("일괄 등록 사용")):
+            count = schedule_timeline(sched, config, zone)
+        self.assertEqual(count, len(WEEKDAY_SCHEDULE))
+        self.assertEqual(len(sched.get_jobs()), len(WEEKDAY_SCHEDULE))
+
+    def test_add_jobs_accepts_planned_jobs(self):
+        """PlannedJob 목록을 그대로 등록"""
+        sched = TimerWheelScheduler(timezone=BASE.tzinfo)
+        count = sched.add_jobs(_noop, [PlannedJob("bell-1", BASE + timedelta(days=1), (1,))])
+        self.assertEqual(count, 1)
+        self.assertEqual(sched.get_job("bell-1").args, (1,))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+"""
+주간 종 인덱스 테스트
+"""
+
+import unittest
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 부모 디렉토리를 경로에 추가하여 app 모듈을 import 가능하게 함
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+from app import SUNDAY_SCHEDULE, WEEKDAY_SCHEDULE, get_tz, get_week_index, schedule_for_weekday
+from week_index import WeekIndex
+
+WEEKDAY = [(1, "08:00", "1교시"), (2, "1200", "점심"), (3, "18:30", "종례")]
+SUNDAY = [(1, "10:00", "일요 자습")]
+
+
+def _schedule(weekday):
+    return SUNDAY if weekday == 6 else WEEKDAY
+
+
+class TestWeekIndex(unittest.TestCase):
+    """next_bell / previous_bell / bells_between 테스트"""
+
+    def setUp(self):
+        self.zone = get_tz("Asia/Seoul")
+        self.index = WeekIndex.from_schedule(_schedule)
+
+    def _at(self, day, hh, mm, ss=0):
+        return datetime(2025, 10, day, hh, mm, ss, tzinfo=self.zone)  # 2025-10-27 = 월요일
+
+    def test_next_bell_same_day(self):
+        """같은 날의 다음 종"""
+        at, bell = self.index.next_bell(self._at(27, 9, 15))
+        self.assertEqual(at, self._at(27, 12, 0))
+        self.assertEqual((bell.index, bell.description), (2, "점심"))
+
+    def test_next_bell_exactly_on_time_is_excluded(self):
+        """정각에 조회하면 그 종은 이미 울린 것으로 보고 다음 종을 반환"""
+        at, _ = self.index.next_bell(self._at(27, 8, 0))
+        self.assertEqual(at, self._at(27, 12, 0))
+        at, _ = self.index.previous_bell(self._at(27, 8, 0))
+        self.assertEqual(at, self._at(27, 8, 0))
+
+    def test_next_bell_wraps_to_next_week(self):
+        """일요일 마지막 종 이후에는 다음 주 월요일 첫 종"""
+        at, bell = self.index.next_bell(datetime(2025, 11, 2, 11, 0, tzinfo=self.zone))
+        self.assertEqual(at, datetime(2025, 11, 3, 8, 0, tzinfo=self.zone))
+        self.assertEqual(bell.weekday, 0)
+
+    def test_previous_bell_wraps_to_last_week(self):
+        """월요일 첫 종 이전에는 지난주 일요일 종"""
+        at, bell = self.index.previous_bell(self._at(27, 7, 0))
+        self.assertEqual(at, self._at(26, 10, 0))
+        self.assertEqual(bell.description, "일요 자습")
+
+    def test_bells_between_spans_days(self):
+        """구간 안의 종을 여러 날에 걸쳐 시각 순으로 반환"""
+        found = list(self.index.bells_between(self._at(27, 12, 0), self._at(28, 12, 0)))
+        self.assertEqual([at for at, _ in found],
+                         [self._at(27, 12, 0), self._at(27, 18, 30), self._at(28, 8, 0)])
+
+    def test_bells_between_skips_started_minute(self):
+        """초가 지난 분의 종은 포함하지 않음"""
+        found = list(self.index.bells_between(self._at(27, 12, 0, 5), self._at(27, 19, 0)))
+        self.assertEqual([b.index for _, b in found], [3])
+
+    def test_bells_between_multiple_weeks(self):
+        """여러 주에 걸친 구간"""
+        start = self._at(27, 0, 0)
+        found = list(self.index.bells_between(start, start + timedelta(days=14)))
+        self.assertEqual(len(found), 2 * (6 * len(WEEKDAY) + len(SUNDAY)))
+
+    def test_for_weekday(self):
+        """요일별 종 목록"""
+        self.assertEqual([b.hhmm for b in self.index.for_weekday(6)], ["10:00"])
+        self.assertEqual([b.index for b in self.index.for_weekday(2)], [1, 2, 3])
+
+    def test_items_for_weekday(self):
+        """GUI 목록용 (인덱스, 시각 문자열, 설명) 형식"""
+        self.assertEqual(self.index.items_for_weekday(6), SUNDAY)
+        self.assertEqual(self.index.items_for_weekday(0)[1], (2, "1200", "점심"))
+
+    def test_empty_index(self):
+        """종이 없으면 None"""
+        empty = WeekIndex([])
+        self.assertIsNone(empty.next_bell(self._at(27, 9, 0)))
+        self.assertIsNone(empty.previous_bell(self._at(27, 9, 0)))
+        self.assertEqual(list(empty.bells_between(self._at(27, 0, 0), self._at(28, 0, 0))), [])
+
+
+class TestAppWeekIndex(unittest.TestCase):
+    """app 주간 인덱스 테스트"""
+
+    def test_matches_builtin_schedules(self):
+        """내장 스케줄과 같은 종 수"""
+        index = get_week_index()
+        self.assertEqual(len(index), 6 * len(WEEKDAY_SCHEDULE) + len(SUNDAY_SCHEDULE))
+        self.assertIs(schedule_for_weekday(6), SUNDAY_SCHEDULE)
+        self.assertIs(get_week_index(), index)
+
+    def test_items_match_builtin_lists(self):
+        """인덱스에서 꺼낸 요일 목록이 내장 평일/일요일 스케줄과 같음 (GUI 스케줄 표시)"""
+        index = get_week_index()
+        self.assertEqual(index.items_for_weekday(6), SUNDAY_SCHEDULE)
+        self.assertEqual(index.items_for_weekday(5), WEEKDAY_SCHEDULE)
+
+
+if __name__ == '__main__':
+    unittest.main()
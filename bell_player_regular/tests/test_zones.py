@@ -0,0 +1,147 @@
+"""
+다중 구역 스케줄 테스트
+"""
+
+import unittest
+import sys
+import tempfile
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+# 부모 디렉토리를 경로에 추가하여 app 모듈을 import 가능하게 함
+parent_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_dir))
+
+import app
+from app import SUNDAY_SCHEDULE, WEEKDAY_SCHEDULE, get_tz, schedule_timeline, validate_config
+from heap_scheduler import HeapScheduler
+from simulator import simulate
+from zones import ZoneDispatcher, parse_zones
+
+ZONES = [
+    {"name": "main", "sounds_dir": "/bell/main"},
+    {"name": "annex_2f", "sounds_dir": "/bell/annex", "volume": 0.5,
+     "weekday_schedule": [[1, "09:00", "조회"], {"index": 2, "time": "1300", "description": "오후"}],
+     "sunday_schedule": []},
+]
+
+
+class TestParseZones(unittest.TestCase):
+    """parse_zones 테스트"""
+
+    def test_defaults_and_overrides(self):
+        """스케줄을 생략하면 기본 스케줄, 지정한 설정만 덮어씀"""
+        main, annex = parse_zones(ZONES, WEEKDAY_SCHEDULE, SUNDAY_SCHEDULE)
+        self.assertEqual(main.weekday_schedule, list(WEEKDAY_SCHEDULE))
+        self.assertEqual(annex.weekday_schedule, [(1, "09:00", "조회"), (2, "13:00", "오후")])
+        self.assertEqual(annex.sunday_schedule, [])
+        self.assertEqual(annex.config_for({"volume": 1.0, "timezone": "Asia/Seoul"}),
+                         {"volume": 0.5, "timezone": "Asia/Seoul", "sounds_dir": "/bell/annex"})
+
+    def test_invalid_zones_are_skipped(self):
+        """이름/시각/볼륨이 잘못되었거나 중복된 구역은 제외"""
+        raw = ZONES + [
+            {"name": "bad name"},
+            {"name": "main"},
+            {"name": "late", "weekday_schedule": [[1, "25:00", "x"]]},
+            {"name": "loud", "volume": 3},
+            "not-a-dict",
+        ]
+        with self.assertLogs(level="WARNING"):
+            zones = parse_zones(raw, WEEKDAY_SCHEDULE, SUNDAY_SCHEDULE)
+        self.assertEqual([z.name for z in zones], ["main", "annex_2f"])
+
+    def test_validate_config_keeps_valid_zones(self):
+        """validate_config는 올바른 구역만 남김"""
+        with self.assertLogs(level="WARNING"):
+            validated = validate_config(dict(app.DEFAULT_CONFIG, zones=ZONES + [{"name": "x y"}]))
+        self.assertEqual([z["name"] for z in validated["zones"]], ["main", "annex_2f"])
+
+
+class TestZoneScheduling(unittest.TestCase):
+    """한 스케줄러로 여러 구역 등록"""
+
+    def setUp(self):
+        self.zone = get_tz("Asia/Seoul")
+        self.sched = HeapScheduler(timezone=self.zone)
+        self.config = {"offset_corrected_firing": False, "timeline_days": 1, "volume": 1.0, "zones": ZONES}
+
+    def test_jobs_per_zone(self):
+        """구역마다 구역 이름이 들어간 작업과 구역 설정"""
+        with patch('app.get_current_time', return_value=datetime(2025, 10, 27, 0, 0)):
+            count = schedule_timeline(self.sched, self.config, self.zone)
+        self.assertEqual(count, len(WEEKDAY_SCHEDULE) + 2)
+
+        job = self.sched.get_job("bell-annex_2f-20251027-2")
+        self.assertEqual(job.next_run_time, datetime(2025, 10, 27, 13, 0, tzinfo=self.zone))
+        index, live, _, target, zone_name, job_id = job.args
+        self.assertEqual((index, target, zone_name, job_id), (2, None, "annex_2f", "bell-annex_2f-20251027-2"))
+        self.assertEqual((live["sounds_dir"], live["volume"]), ("/bell/annex", 0.5))
+        self.assertEqual(self.sched.get_job("bell-main-20251027-1").args[1]["sounds_dir"], "/bell/main")
+        self.assertIsNone(self.sched.get_job("bell-20251027-1"))
+
+    def test_removed_zone_jobs_are_dropped(self):
+        """설정에서 빠진 구역의 작업은 삭제"""
+        with patch('app.get_current_time', return_value=datetime(2025, 10, 27, 0, 0)):
+            schedule_timeline(self.sched, self.config, self.zone)
+            plan = app.reconcile_schedule(self.sched, dict(self.config, zones=ZONES[:1]), self.zone)
+        self.assertEqual(len(plan.remove), 2)
+        self.assertFalse([j for j in self.sched.get_jobs() if j.id.startswith("bell-annex_2f-")])
+
+    def test_simulated_day_fires_each_zone(self):
+        """가상 시계 시뮬레이션에서 구역별 폴더로 울림"""
+        start = datetime(2025, 10, 27, 0, 0, tzinfo=self.zone)
+        with tempfile.TemporaryDirectory() as main_dir, tempfile.TemporaryDirectory() as annex_dir:
+            zones = [dict(ZONES[0], sounds_dir=main_dir), dict(ZONES[1], sounds_dir=annex_dir)]
+            records = simulate(dict(app.DEFAULT_CONFIG, zones=zones), start, start + timedelta(days=1))
+        by_dir = {}
+        for record in records:
+            by_dir.setdefault(record.sounds_dir, []).append(record.index)
+        self.assertEqual(by_dir[annex_dir], [1, 2])
+        self.assertEqual(len(by_dir[main_dir]), len(WEEKDAY_SCHEDULE))
+        self.assertEqual([r.at for r in records], sorted(r.at for r in records))
+
+
+class TestZoneDispatcher(unittest.TestCase):
+    """구역별 재생 작업자 테스트"""
+
+    def setUp(self):
+        self.dispatcher = ZoneDispatcher()
+
+    def tearDown(self):
+        self.dispatcher.shutdown()
+
+    def test_zones_do_not_block_each_other(self):
+        """한 구역의 긴 재생 중에도 다른 구역은 재생"""
+        release = threading.Event()
+        played = []
+        self.dispatcher.submit("a", release.wait, 5)
+        self.dispatcher.submit("b", played.append, "b")
+        self.dispatcher.join("b")
+        self.assertEqual(played, ["b"])
+        release.set()
+        self.dispatcher.join()
+
+    def test_same_zone_runs_in_order(self):
+        """같은 구역의 종은 순서대로 하나씩"""
+        played = []
+        for i in range(5):
+            self.dispatcher.submit("a", played.append, i)
+        self.dispatcher.join()
+        self.assertEqual(played, [0, 1, 2, 3, 4])
+        self.assertEqual(self.dispatcher.zones, ["a"])
+
+    def test_fire_bell_dispatches_to_zone_worker(self):
+        """구역 작업은 해당 구역 작업자 스레드에서 재생"""
+        threads = []
+        with patch('app.play_sound_for_index',
+                   side_effect=lambda *a, **k: threads.append(threading.current_thread().name)):
+            app.fire_bell(1, {}, None, None, "test_zone")
+            app.zone_dispatcher.join("test_zone")
+        self.assertEqual(threads, ["zone-test_zone"])
+
+
+if __name__ == '__main__':
+    unittest.main()
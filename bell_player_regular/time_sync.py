@@ -0,0 +1,586 @@
+"""
+외부 시간 동기화 서비스
+
+NTP/WorldTimeAPI 조회는 백그라운드 스레드에서만 수행하고, 측정된 오프셋
+(외부 시간 - 로컬 시간)을 마이크로초 단위로 저장합니다. get_current_time()처럼
+자주 호출되는 경로는 로컬 시계에 저장된 오프셋만 더하므로 네트워크를 기다리지 않습니다.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import statistics
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime, timedelta
+from typing import Callable, Deque, Dict, List, NamedTuple, Optional, Tuple, Union
+
+from clock_watch import steady_clock
+
+
+class TimeSample(NamedTuple):
+    """시간 소스 한 번의 측정 결과 (단위: 초)"""
+    offset: float  # 외부 시간 - 로컬 시간
+    delay: float  # 왕복 지연 (RTT)
+    source: str  # 서버 이름 또는 API 이름
+    dispersion: float = 0.0
+
+
+TimeSource = Callable[[], Optional[TimeSample]]
+
+
+class SyncRecord(NamedTuple):
+    """동기화 시도 한 번의 기록 (텔레메트리 링 버퍼 항목)"""
+    at: float  # 시도 시각 (time.time())
+    ok: bool
+    offset: Optional[float] = None  # 측정 오프셋 (초)
+    delay: Optional[float] = None  # RTT (초)
+    dispersion: Optional[float] = None
+    source: Optional[str] = None
+    error: Optional[float] = None  # 측정 직전 드리프트 모델 예측 오차 (초)
+
+    def to_dict(self) -> dict:
+        return {
+            "at": datetime.fromtimestamp(self.at).isoformat(timespec="milliseconds"),
+            "ok": self.ok,
+            "offset_ms": _ms(self.offset),
+            "rtt_ms": _ms(self.delay),
+            "dispersion_ms": _ms(self.dispersion),
+            "source": self.source,
+            "prediction_error_ms": _ms(self.error),
+        }
+
+
+def _ms(seconds: Optional[float]) -> Optional[float]:
+    return None if seconds is None else round(seconds * 1000, 3)
+
+
+def _write_json_atomic(path: str, data: dict) -> None:
+    """임시 파일에 쓴 뒤 교체해, 읽는 쪽이 반쯤 쓰인 파일을 보지 않게 합니다."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_path, path)
+
+
+def split_host_port(server: str, default_port: Union[int, str] = "ntp") -> Tuple[str, Union[int, str]]:
+    """'host' 또는 'host:port' 형식의 서버 주소를 (host, port)로 나눕니다."""
+    host, sep, port = server.rpartition(":")
+    if sep and host and port.isdigit() and ":" not in host:
+        return host, int(port)
+    return server, default_port
+
+
+def query_concurrently(queries: List[TimeSource], deadline: float) -> List[TimeSample]:
+    """모든 시간 소스를 병렬로 조회하고 전체 마감 시간 안에 도착한 측정값만 반환합니다.
+
+    마감 시간을 넘긴 조회는 기다리지 않고 버립니다 (각 조회의 자체 타임아웃으로 종료됨).
+    """
+    if not queries:
+        return []
+    executor = ThreadPoolExecutor(max_workers=len(queries), thread_name_prefix="time-query")
+    try:
+        futures = [executor.submit(q) for q in queries]
+        done, _ = wait(futures, timeout=max(0.0, deadline))
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    samples: List[TimeSample] = []
+    for future in done:
+        try:
+            sample = future.result()
+        except Exception as e:
+            logging.debug(f"시간 소스 조회 중 오류: {e}")
+            continue
+        if sample is not None:
+            samples.append(sample)
+    return samples
+
+
+def select_best_sample(samples: List[TimeSample], max_spread: float = 0.5) -> Optional[TimeSample]:
+    """측정값 중 가장 신뢰할 수 있는 값을 고릅니다.
+
+    오프셋 중앙값에서 max_spread(초) 이상 벗어난 값은 잘못된 서버로 보고 제외한 뒤,
+    남은 측정값 중 왕복 지연(RTT)이 가장 작은 값을 선택합니다.
+    """
+    if not samples:
+        return None
+    median = statistics.median(s.offset for s in samples)
+    good = [s for s in samples if abs(s.offset - median) <= max_spread] or list(samples)
+    return min(good, key=lambda s: s.delay)
+
+
+class SourceHealth:
+    """시간 소스 하나의 최근 상태 (성공/실패 횟수, 지연시간, 백오프)"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.successes = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.latency_ewma: Optional[float] = None
+        self.retry_at = 0.0  # steady_clock 기준, 이 시각 전에는 조회하지 않음
+
+    def as_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "successes": self.successes,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+            "latency_ms": None if self.latency_ewma is None else round(self.latency_ewma * 1000, 1),
+            "backoff_remaining": max(0.0, round(self.retry_at - steady_clock(), 1)),
+        }
+
+
+class SourceHealthRegistry:
+    """시간 소스별 상태를 기록하고 실패한 소스를 지수 백오프로 차단하는 서킷 브레이커
+
+    연속 실패가 n번이면 base_backoff * 2^(n-1)초(최대 max_backoff) 동안 해당 소스를
+    건너뛰므로, 네트워크가 끊긴 PC는 백오프 구간마다 타임아웃 비용을 한 번만 냅니다.
+    """
+
+    def __init__(self, base_backoff_seconds: float = 30.0, max_backoff_seconds: float = 1800.0,
+                 clock: Callable[[], float] = steady_clock):
+        self.base_backoff_seconds = float(base_backoff_seconds)
+        self.max_backoff_seconds = float(max_backoff_seconds)
+        self._clock = clock
+        self._sources: Dict[str, SourceHealth] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, name: str) -> SourceHealth:
+        health = self._sources.get(name)
+        if health is None:
+            health = self._sources[name] = SourceHealth(name)
+        return health
+
+    def allowed(self, name: str) -> bool:
+        """백오프 중이 아니면 True (백오프가 끝난 뒤 첫 조회는 시험 조회로 허용)"""
+        with self._lock:
+            return self._clock() >= self._get(name).retry_at
+
+    def record_success(self, name: str, latency: float) -> None:
+        with self._lock:
+            health = self._get(name)
+            health.successes += 1
+            health.consecutive_failures = 0
+            health.retry_at = 0.0
+            if health.latency_ewma is None:
+                health.latency_ewma = latency
+            else:
+                health.latency_ewma = 0.7 * health.latency_ewma + 0.3 * latency
+
+    def record_failure(self, name: str) -> float:
+        """실패를 기록하고 적용된 백오프(초)를 반환합니다."""
+        with self._lock:
+            health = self._get(name)
+            health.failures += 1
+            health.consecutive_failures += 1
+            backoff = min(self.max_backoff_seconds,
+                          self.base_backoff_seconds * 2 ** (health.consecutive_failures - 1))
+            health.retry_at = self._clock() + backoff
+        logging.debug(f"시간 소스 {name} 실패 {health.consecutive_failures}회 연속, {backoff:.0f}초 동안 건너뜀")
+        return backoff
+
+    def ordered(self, names: List[str]) -> List[str]:
+        """최근 상태가 좋은 순서(연속 실패 적은 순, 지연시간 짧은 순)로 정렬합니다."""
+        with self._lock:
+            def key(name: str):
+                health = self._get(name)
+                latency = health.latency_ewma if health.latency_ewma is not None else float("inf")
+                return (health.consecutive_failures, latency)
+            return sorted(names, key=key)
+
+    def available(self, names: List[str]) -> List[str]:
+        """백오프 중이 아닌 소스만 상태가 좋은 순서로 반환합니다."""
+        return [name for name in self.ordered(names) if self.allowed(name)]
+
+    def snapshot(self) -> List[dict]:
+        with self._lock:
+            return [h.as_dict() for h in self._sources.values()]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._sources.clear()
+
+
+class DriftModel:
+    """동기화 결과로 로컬 시계의 선형 드리프트를 추정하는 모델
+
+    offset(t) = intercept + slope * (t - t0) 형태로, t는 steady_clock() 값입니다.
+    RTT가 작은 측정값일수록 가중치를 크게 주는 가중 최소제곱으로 적합합니다.
+    """
+
+    def __init__(self, max_samples: int = 16, min_span_seconds: float = 300.0,
+                 max_drift_ppm: float = 500.0):
+        # (monotonic, offset, rtt)
+        self._points: Deque[Tuple[float, float, float]] = deque(maxlen=max_samples)
+        self.min_span_seconds = float(min_span_seconds)
+        self.max_drift_ppm = float(max_drift_ppm)
+        # 예측 경로에서 잠금 없이 읽도록 계수를 하나의 튜플로 교체합니다
+        self._coef: Tuple[float, float, float] = (0.0, 0.0, 0.0)  # (t0, intercept, slope)
+        # 관측 구간이 짧을 때 사용할 기울기 (이전 실행에서 저장된 추정값)
+        self._prior_slope = 0.0
+
+    @property
+    def sample_count(self) -> int:
+        return len(self._points)
+
+    @property
+    def drift_ppm(self) -> float:
+        """추정된 드리프트 (ppm, 양수면 로컬 시계가 느려지는 중)"""
+        return self._coef[2] * 1_000_000
+
+    @property
+    def points(self) -> List[Tuple[float, float, float]]:
+        return list(self._points)
+
+    def add(self, mono: float, offset: float, rtt: float) -> None:
+        self._points.append((float(mono), float(offset), max(0.0, float(rtt))))
+        self._fit()
+
+    def reset(self) -> None:
+        self._points.clear()
+        self._coef = (0.0, 0.0, 0.0)
+        self._prior_slope = 0.0
+
+    def shift(self, delta: float) -> None:
+        """모든 측정값과 예측값을 delta(초)만큼 이동합니다 (로컬 시계가 점프한 경우)."""
+        self._points = deque(((t, o + delta, r) for t, o, r in self._points),
+                             maxlen=self._points.maxlen)
+        t0, intercept, slope = self._coef
+        self._coef = (t0, intercept + delta, slope)
+
+    def seed(self, mono: float, offset: float, drift_ppm: float) -> None:
+        """저장된 상태로 모델을 초기화합니다 (측정값이 쌓이기 전까지 사용)."""
+        limit = self.max_drift_ppm
+        self._prior_slope = max(-limit, min(limit, float(drift_ppm))) / 1_000_000
+        if not self._points:
+            self._coef = (float(mono), float(offset), self._prior_slope)
+
+    def predict(self, mono: float) -> float:
+        """monotonic 시각 mono에서의 오프셋(초)을 예측합니다."""
+        t0, intercept, slope = self._coef
+        return intercept + slope * (mono - t0)
+
+    def _fit(self) -> None:
+        points = list(self._points)
+        t_last, offset_last, _ = points[-1]
+        if len(points) < 2 or t_last - points[0][0] < self.min_span_seconds:
+            # 관측 구간이 짧으면 기울기를 새로 추정하지 않고 최신 측정값을 사용
+            self._coef = (t_last, offset_last, self._prior_slope)
+            return
+
+        weights = [1.0 / (rtt + 0.001) ** 2 for _, _, rtt in points]
+        w_sum = sum(weights)
+        t_mean = sum(w * (t - t_last) for w, (t, _, _) in zip(weights, points)) / w_sum
+        o_mean = sum(w * o for w, (_, o, _) in zip(weights, points)) / w_sum
+        s_tt = sum(w * ((t - t_last) - t_mean) ** 2 for w, (t, _, _) in zip(weights, points))
+        s_to = sum(w * ((t - t_last) - t_mean) * (o - o_mean) for w, (t, o, _) in zip(weights, points))
+        slope = s_to / s_tt if s_tt > 0 else 0.0
+
+        limit = self.max_drift_ppm / 1_000_000
+        slope = max(-limit, min(limit, slope))
+        intercept = o_mean - slope * t_mean
+        self._coef = (t_last, intercept, slope)
+
+
+class TimeSyncService:
+    """로컬 시계와 외부 시간의 오프셋을 주기적으로 측정해 보관하는 서비스
+
+    측정 결과는 DriftModel에 누적되어 동기화 사이의 오프셋을 예측하며, 예측이 맞는
+    동안에는 동기화 주기를 max_interval_seconds까지 두 배씩 늘립니다.
+    성공/실패한 동기화 시도는 최근 history_size개까지 링 버퍼에 남아 status()로 조회됩니다.
+    """
+
+    def __init__(self, sources: List[TimeSource], interval_seconds: float = 600.0,
+                 retry_seconds: float = 60.0, max_interval_seconds: float = 21600.0,
+                 tolerance_seconds: float = 0.05, history_size: int = 32):
+        self._sources = list(sources)
+        self.interval_seconds = float(interval_seconds)
+        self.retry_seconds = float(retry_seconds)
+        self.max_interval_seconds = float(max_interval_seconds)
+        self.tolerance_seconds = float(tolerance_seconds)
+        self._current_interval = self.interval_seconds
+        self._model = DriftModel()
+        self._last_sample: Optional[TimeSample] = None
+        self._last_sample_wall: Optional[float] = None
+        self._restored_at: Optional[float] = None  # 상태 파일에서 복원한 오프셋의 측정 시각
+        self._restored_source: Optional[str] = None
+        self._history: Deque[SyncRecord] = deque(maxlen=max(1, int(history_size)))
+        self._consecutive_failures = 0
+        self.state_path: Optional[str] = None
+        self.status_path: Optional[str] = None
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._wakeup_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._listeners: List[Callable[["TimeSyncService"], None]] = []
+
+    @property
+    def model(self) -> DriftModel:
+        return self._model
+
+    @property
+    def offset_us(self) -> int:
+        """현재 시점의 예측 오프셋 (마이크로초)"""
+        return int(round(self._model.predict(steady_clock()) * 1_000_000))
+
+    @property
+    def drift_ppm(self) -> float:
+        return self._model.drift_ppm
+
+    @property
+    def current_interval(self) -> float:
+        """다음 동기화까지의 대기 시간 (초)"""
+        return self._current_interval
+
+    @property
+    def last_sample(self) -> Optional[TimeSample]:
+        with self._lock:
+            return self._last_sample
+
+    @property
+    def synced(self) -> bool:
+        return self.last_sample is not None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def predict_offset(self, mono: Optional[float] = None) -> float:
+        """monotonic 시각(기본: 현재)의 예측 오프셋(초)을 반환합니다."""
+        return self._model.predict(steady_clock() if mono is None else mono)
+
+    def now(self) -> datetime:
+        """로컬 시계 + 예측 오프셋. 네트워크를 사용하지 않습니다."""
+        return datetime.now() + timedelta(microseconds=self.offset_us)
+
+    def record_sample(self, sample: TimeSample, mono: Optional[float] = None) -> None:
+        """측정값을 드리프트 모델에 기록하고 다음 동기화 주기를 조정합니다."""
+        mono = steady_clock() if mono is None else mono
+        with self._lock:
+            had_model = self._model.sample_count > 0
+            error = abs(sample.offset - self._model.predict(mono)) if had_model else None
+            self._model.add(mono, sample.offset, sample.delay)
+            self._last_sample = sample
+            self._last_sample_wall = time.time()
+            self._consecutive_failures = 0
+            self._history.append(SyncRecord(self._last_sample_wall, True, sample.offset, sample.delay,
+                                            sample.dispersion, sample.source, error))
+            if error is not None and error <= self.tolerance_seconds and self._model.sample_count >= 3:
+                self._current_interval = min(self.max_interval_seconds, self._current_interval * 2)
+            else:
+                self._current_interval = self.interval_seconds
+        if error is not None:
+            logging.info(f"드리프트 모델 갱신: 예측 오차 {error * 1000:.1f}ms, "
+                         f"드리프트 {self.drift_ppm:+.1f}ppm, 다음 동기화 {self._current_interval:.0f}초 후")
+
+    def record_failure(self) -> None:
+        """모든 시간 소스가 실패한 동기화 시도를 기록합니다."""
+        with self._lock:
+            self._consecutive_failures += 1
+            self._history.append(SyncRecord(time.time(), False))
+
+    def history(self) -> List[SyncRecord]:
+        """최근 동기화 시도 기록 (오래된 것부터)"""
+        with self._lock:
+            return list(self._history)
+
+    def status(self) -> dict:
+        """GUI와 상태 파일에 쓰는 동기화 품질 요약"""
+        with self._lock:
+            sample = self._last_sample
+            measured_at = self._last_sample_wall
+            restored_at = self._restored_at if sample is None else None
+            restored_source = self._restored_source
+            failures = self._consecutive_failures
+            recent = [record.to_dict() for record in self._history]
+        now = time.time()
+        return {
+            "synced": sample is not None,
+            # 아직 실제 동기화 전이지만 저장된 오프셋을 복원해 쓰는 중인지와 그 측정 경과 시간
+            "restored": restored_at is not None,
+            "restored_source": restored_source if restored_at is not None else None,
+            "restored_age_seconds": round(now - restored_at, 1) if restored_at is not None else None,
+            "source": sample.source if sample else None,
+            "offset_ms": round(self.predict_offset() * 1000, 3),
+            "drift_ppm": round(self.drift_ppm, 3),
+            "last_offset_ms": _ms(sample.offset) if sample else None,
+            "rtt_ms": _ms(sample.delay) if sample else None,
+            "dispersion_ms": _ms(sample.dispersion) if sample else None,
+            "last_success_at": (datetime.fromtimestamp(measured_at).isoformat(timespec="seconds")
+                                if measured_at is not None else None),
+            "last_success_age_seconds": round(now - measured_at, 1) if measured_at is not None else None,
+            "consecutive_failures": failures,
+            "next_sync_seconds": self._current_interval,
+            "recent": recent,
+        }
+
+    def dump_status(self, path: str) -> bool:
+        """status()를 JSON 파일로 기록합니다 (외부 모니터링용)."""
+        try:
+            _write_json_atomic(path, self.status())
+            return True
+        except OSError as e:
+            logging.warning(f"시간 동기화 상태 파일 기록 실패: {e}")
+            return False
+
+    def finish_sync(self, sample: Optional[TimeSample]) -> bool:
+        """동기화 시도 결과를 기록하고, 성공 시 상태 저장과 리스너 알림까지 수행합니다."""
+        if sample is None:
+            self.record_failure()
+            logging.info("외부 시간 동기화 실패, 드리프트 모델 예측값 유지")
+            if self.status_path:
+                self.dump_status(self.status_path)
+            return False
+        logging.info(f"시간 동기화 측정: {sample.offset * 1000:+.1f}ms "
+                     f"(소스={sample.source}, RTT={sample.delay * 1000:.1f}ms)")
+        self.record_sample(sample)
+        if self.state_path:
+            self.save_state(self.state_path)
+        if self.status_path:
+            self.dump_status(self.status_path)
+        self._notify_listeners()
+        return True
+
+    def add_listener(self, listener: Callable[["TimeSyncService"], None]) -> None:
+        """동기화가 성공할 때마다 호출될 콜백을 등록합니다."""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def _notify_listeners(self) -> None:
+        for listener in list(self._listeners):
+            try:
+                listener(self)
+            except Exception as e:
+                logging.exception(f"시간 동기화 후속 처리 중 오류: {e}")
+
+    def apply_clock_step(self, jump_seconds: float) -> None:
+        """로컬 시계가 jump_seconds만큼 점프했을 때 오프셋을 보정합니다.
+
+        실제 시간은 연속이므로 오프셋(외부 - 로컬)은 점프 크기만큼 반대로 움직입니다.
+        점프가 시간 동기화에 의한 보정일 수도 있으므로 즉시 재동기화를 요청합니다.
+        """
+        with self._lock:
+            self._model.shift(-jump_seconds)
+            self._current_interval = self.interval_seconds
+        self.request_sync()
+
+    def sync_once(self) -> bool:
+        """시간 소스를 순서대로 조회해 첫 번째 성공한 측정값을 기록합니다."""
+        for source in self._sources:
+            try:
+                sample = source()
+            except Exception as e:
+                logging.debug(f"시간 소스 조회 중 오류: {e}")
+                continue
+            if sample is not None:
+                return self.finish_sync(sample)
+        return self.finish_sync(None)
+
+    def export_state(self) -> Optional[dict]:
+        """마지막 측정 오프셋과 드리프트 추정값 (측정한 적이 없으면 None)"""
+        with self._lock:
+            sample = self._last_sample
+            measured_at = self._last_sample_wall
+            drift_ppm = self._model.drift_ppm
+        if sample is None or measured_at is None:
+            return None
+        return {
+            "offset": self.predict_offset(),
+            "drift_ppm": drift_ppm,
+            "measured_at": measured_at,
+            "saved_at": time.time(),
+            "source": sample.source,
+            "delay": sample.delay,
+        }
+
+    def save_state(self, path: str) -> bool:
+        """마지막 측정 오프셋과 드리프트 추정값을 JSON 파일로 저장합니다."""
+        state = self.export_state()
+        if state is None:
+            return False
+        try:
+            _write_json_atomic(path, state)
+            return True
+        except OSError as e:
+            logging.warning(f"시간 동기화 상태 저장 실패: {e}")
+            return False
+
+    def load_state(self, path: str, max_age_seconds: float) -> bool:
+        """저장된 오프셋을 불러와 드리프트만큼 보정한 뒤 모델을 초기화합니다.
+
+        측정 시각이 max_age_seconds보다 오래됐거나 파일이 손상된 경우 무시합니다.
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as e:
+            logging.warning(f"시간 동기화 상태 파일을 읽을 수 없습니다: {e}")
+            return False
+        return self.restore_state(state, max_age_seconds)
+
+    def restore_state(self, state: dict, max_age_seconds: float) -> bool:
+        """export_state()로 만든 상태를 드리프트만큼 보정해 모델을 초기화합니다."""
+        try:
+            offset = float(state["offset"])
+            drift_ppm = float(state.get("drift_ppm", 0.0))
+            saved_at = float(state["saved_at"])
+            measured_at = float(state.get("measured_at", saved_at))
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            logging.warning(f"저장된 시간 동기화 상태가 잘못되었습니다: {e}")
+            return False
+
+        now = time.time()
+        age = now - measured_at
+        if now < saved_at or age > max_age_seconds:
+            logging.info(f"저장된 시간 오프셋이 너무 오래되어 무시합니다 ({age / 3600:.1f}시간 전 측정)")
+            return False
+
+        predicted = offset + drift_ppm / 1_000_000 * (now - saved_at)
+        source = state.get("source")
+        with self._lock:
+            self._model.seed(steady_clock(), predicted, drift_ppm)
+            self._restored_at = measured_at
+            self._restored_source = str(source) if source else None
+        logging.info(f"저장된 시간 오프셋 복원: {predicted * 1000:+.1f}ms "
+                     f"(드리프트 {drift_ppm:+.1f}ppm, {age / 60:.0f}분 전 측정)")
+        return True
+
+    def start(self) -> None:
+        """백그라운드 동기화 스레드를 시작합니다 (이미 실행 중이면 무시).
+
+        스레드마다 자기 종료 이벤트를 가지므로, stop()의 join이 시간 초과된 이전 스레드가
+        아직 조회 중이어도 새 스레드와 섞이지 않고 조회가 끝나는 대로 종료합니다.
+        """
+        if self.running:
+            return
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(self._stop_event,), name="time-sync", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self._wakeup_event.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=2.0)
+        self._thread = None
+
+    def request_sync(self) -> None:
+        """다음 동기화를 즉시 수행하도록 백그라운드 스레드를 깨웁니다."""
+        self._wakeup_event.set()
+
+    def _run(self, stop_event: threading.Event) -> None:
+        while not stop_event.is_set():
+            ok = self.sync_once()
+            delay = self._current_interval if ok else self.retry_seconds
+            self._wakeup_event.wait(timeout=delay)
+            self._wakeup_event.clear()
@@ -0,0 +1,294 @@
+"""
+asyncio 기반 시간 동기화 클라이언트
+
+time_sync.TimeSyncService의 스레드 기반 조회와 같은 일을 이벤트 루프 안에서 수행합니다.
+NTP는 loop.create_datagram_endpoint로 비동기 UDP 조회를 하고, WorldTimeAPI는
+연결을 재사용하는 작은 HTTP/1.1 클라이언트(http/https, Content-Length 또는 chunked 본문)로
+조회하므로, 제어 API 등 다른 I/O와
+함께 도는 데몬이 조회마다 스레드를 쓰지 않아도 됩니다.
+
+측정 결과는 같은 TimeSyncService에 기록되므로 get_current_time()이 그대로 사용합니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import ssl
+import struct
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from time_sync import SourceHealthRegistry, TimeSample, TimeSyncService, select_best_sample, split_host_port
+
+NTP_EPOCH_DELTA = 2208988800  # 1900-01-01 ~ 1970-01-01 (초)
+NTP_PACKET_FORMAT = "!B B B b 11I"
+NTP_PACKET_SIZE = struct.calcsize(NTP_PACKET_FORMAT)
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def _split_ntp(unix_time: float) -> Tuple[int, int]:
+    ntp_time = unix_time + NTP_EPOCH_DELTA
+    seconds = int(ntp_time)
+    return seconds, int((ntp_time - seconds) * 2 ** 32) & 0xFFFFFFFF
+
+
+def _join_ntp(seconds: int, fraction: int) -> float:
+    return seconds - NTP_EPOCH_DELTA + fraction / 2 ** 32
+
+
+class _NTPProtocol(asyncio.DatagramProtocol):
+    """요청 한 건의 응답을 기다리는 UDP 프로토콜"""
+
+    def __init__(self, expected_origin: Tuple[int, int]):
+        self.expected_origin = expected_origin
+        self.response: asyncio.Future = asyncio.get_running_loop().create_future()
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        if self.response.done() or len(data) < NTP_PACKET_SIZE:
+            return
+        # 다른 요청에 대한 늦은 응답은 originate 타임스탬프로 걸러냄
+        if struct.unpack("!II", data[24:32]) != self.expected_origin:
+            return
+        self.response.set_result((data, time.time()))
+
+    def error_received(self, exc: Exception) -> None:
+        if not self.response.done():
+            self.response.set_exception(exc)
+
+
+async def async_query_ntp(server: str, timeout: float) -> Optional[TimeSample]:
+    """NTP 서버 하나를 비동기로 조회해 오프셋을 측정합니다 (실패 시 None)."""
+    loop = asyncio.get_running_loop()
+    host, port = split_host_port(server, 123)
+    transport = None
+    try:
+        t0 = time.time()
+        origin = _split_ntp(t0)
+        request = bytearray(NTP_PACKET_SIZE)
+        request[0] = (0 << 6) | (3 << 3) | 3  # leap=0, version=3, mode=3(client)
+        request[40:48] = struct.pack("!II", *origin)
+
+        transport, protocol = await asyncio.wait_for(
+            loop.create_datagram_endpoint(lambda: _NTPProtocol(origin), remote_addr=(host, port)),
+            timeout,
+        )
+        transport.sendto(bytes(request))
+        remaining = max(0.0, timeout - (time.time() - t0))
+        data, t3 = await asyncio.wait_for(protocol.response, remaining)
+    except (asyncio.TimeoutError, OSError) as e:
+        logging.debug(f"NTP 서버 {server} 비동기 조회 실패: {e!r}")
+        return None
+    finally:
+        if transport is not None:
+            transport.close()
+
+    fields = struct.unpack(NTP_PACKET_FORMAT, data[:NTP_PACKET_SIZE])
+    if fields[0] & 0x7 not in (4, 5):  # server / broadcast
+        return None
+    t1 = _join_ntp(fields[11], fields[12])  # 서버 수신
+    t2 = _join_ntp(fields[13], fields[14])  # 서버 송신
+    return TimeSample(
+        offset=((t1 - t0) + (t2 - t3)) / 2.0,
+        delay=(t3 - t0) - (t2 - t1),
+        source=server,
+        dispersion=fields[5] / 2 ** 16,
+    )
+
+
+class AsyncHTTPClient:
+    """호스트별로 keep-alive 연결을 재사용하는 최소한의 비동기 HTTP/1.1 GET 클라이언트
+
+    http와 https(기본 인증서 검증)를 지원하고, 본문은 Content-Length, chunked 전송,
+    또는 (둘 다 없으면) 연결 종료까지 읽습니다. 그 밖의 Transfer-Encoding(gzip 등)은
+    오류를 기록하고 ValueError로 거부합니다.
+    """
+
+    def __init__(self, max_idle_per_host: int = 2):
+        self.max_idle_per_host = max_idle_per_host
+        self._idle: Dict[Tuple[str, str, int], List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]]] = {}
+        self.connections_opened = 0
+
+    async def _acquire(self, key: Tuple[str, str, int]):
+        idle = self._idle.get(key, [])
+        while idle:
+            reader, writer = idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer, True
+            writer.close()
+        self.connections_opened += 1
+        scheme, host, port = key
+        if scheme == "https":
+            reader, writer = await asyncio.open_connection(host, port, ssl=ssl.create_default_context())
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        return reader, writer, False
+
+    def _release(self, key: Tuple[str, str, int], reader, writer) -> None:
+        idle = self._idle.setdefault(key, [])
+        if len(idle) < self.max_idle_per_host and not writer.is_closing():
+            idle.append((reader, writer))
+        else:
+            writer.close()
+
+    async def get_json(self, url: str, timeout: float = 5.0):
+        """url에 GET 요청을 보내 JSON 본문을 반환합니다."""
+        parts = urlsplit(url)
+        if parts.scheme not in DEFAULT_PORTS:
+            raise ValueError(f"지원하지 않는 URL 스킴: {parts.scheme}")
+        key = (parts.scheme, parts.hostname, parts.port or DEFAULT_PORTS[parts.scheme])
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        return await asyncio.wait_for(self._get_json(key, path), timeout)
+
+    @staticmethod
+    async def _read_chunked(reader: asyncio.StreamReader) -> bytes:
+        """chunked 전송 본문을 읽습니다 (마지막 0 크기 청크 뒤의 trailer까지 소비)."""
+        body = bytearray()
+        while True:
+            size_line = await reader.readline()
+            if not size_line:
+                raise ConnectionError("chunked 본문 도중 연결이 종료되었습니다")
+            size = int(size_line.split(b";", 1)[0].strip(), 16)
+            if size == 0:
+                break
+            body += await reader.readexactly(size)
+            await reader.readexactly(2)  # 청크 끝의 CRLF
+        while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+            pass
+        return bytes(body)
+
+    async def _get_json(self, key: Tuple[str, str, int], path: str):
+        _, host, port = key
+        reader, writer, reused = await self._acquire(key)
+        keep_alive = True
+        try:
+            writer.write(
+                f"GET {path} HTTP/1.1\r\nHost: {host}:{port}\r\n"
+                f"Accept: application/json\r\nConnection: keep-alive\r\n\r\n".encode("ascii")
+            )
+            await writer.drain()
+
+            status_line = await reader.readline()
+            if not status_line and reused:
+                # 유휴 중에 서버가 닫은 연결이면 새 연결로 한 번 재시도
+                writer.close()
+                return await self._get_json(key, path)
+            if not status_line:
+                raise ConnectionError("서버가 응답 없이 연결을 종료했습니다")
+            status = int(status_line.split()[1])
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+            encoding = headers.get("transfer-encoding", "").lower()
+            if encoding == "chunked":
+                body = await self._read_chunked(reader)
+            elif encoding and encoding != "identity":
+                logging.error(f"지원하지 않는 Transfer-Encoding 응답 ({host}): {encoding}")
+                raise ValueError(f"지원하지 않는 Transfer-Encoding: {encoding}")
+            elif "content-length" in headers:
+                body = await reader.readexactly(int(headers["content-length"]))
+            else:
+                # 길이 정보가 없으면 서버가 연결을 닫을 때까지가 본문
+                body = await reader.read()
+                keep_alive = False
+        except BaseException:
+            writer.close()
+            raise
+
+        if not keep_alive or headers.get("connection", "").lower() == "close":
+            writer.close()
+        else:
+            self._release(key, reader, writer)
+        if status != 200:
+            raise ConnectionError(f"HTTP {status}")
+        return json.loads(body.decode("utf-8"))
+
+    async def close(self) -> None:
+        for idle in self._idle.values():
+            for _, writer in idle:
+                writer.close()
+        self._idle.clear()
+
+
+class AsyncTimeSyncClient:
+    """NTP(병렬) → WorldTimeAPI 순서로 비동기 조회해 TimeSyncService를 갱신합니다."""
+
+    def __init__(self, service: TimeSyncService, ntp_servers: List[str], worldtime_url: Optional[str],
+                 deadline: float = 3.0, health: Optional[SourceHealthRegistry] = None):
+        self.service = service
+        self.ntp_servers = list(ntp_servers)
+        self.worldtime_url = worldtime_url
+        self.deadline = float(deadline)
+        self.health = health or SourceHealthRegistry()
+        self.http = AsyncHTTPClient()
+
+    async def _query_ntp_tracked(self, server: str) -> Optional[TimeSample]:
+        t0 = time.monotonic()
+        sample = None
+        try:
+            sample = await async_query_ntp(server, self.deadline)
+        finally:
+            # 마감 시간에 취소된 조회도 실패로 기록
+            if sample is not None:
+                self.health.record_success(server, time.monotonic() - t0)
+            else:
+                self.health.record_failure(server)
+        return sample
+
+    async def ntp_sample(self) -> Optional[TimeSample]:
+        """백오프 중이 아닌 NTP 서버 전체를 한 번의 마감 시간 안에 조회합니다."""
+        candidates = self.health.available(self.ntp_servers)
+        if not candidates:
+            return None
+        tasks = [asyncio.ensure_future(self._query_ntp_tracked(server)) for server in candidates]
+        done, pending = await asyncio.wait(tasks, timeout=self.deadline)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)
+        samples = [t.result() for t in done if not t.cancelled() and t.exception() is None and t.result()]
+        return select_best_sample(samples)
+
+    async def worldtime_sample(self) -> Optional[TimeSample]:
+        name = "worldtimeapi"
+        if not self.worldtime_url or not self.health.allowed(name):
+            return None
+        try:
+            t0 = time.time()
+            data = await self.http.get_json(self.worldtime_url, timeout=self.deadline)
+            t1 = time.time()
+            parsed = datetime.fromisoformat(str(data["datetime"]).replace("Z", "+00:00"))
+        except (asyncio.TimeoutError, OSError, ConnectionError, ValueError, KeyError) as e:
+            logging.debug(f"WorldTimeAPI 비동기 조회 실패: {e!r}")
+            self.health.record_failure(name)
+            return None
+        self.health.record_success(name, t1 - t0)
+        return TimeSample(offset=parsed.timestamp() - (t0 + t1) / 2.0, delay=t1 - t0, source=name)
+
+    async def sync_once(self) -> bool:
+        """한 번 동기화해 성공하면 서비스에 측정값을 기록합니다.
+
+        finish_sync는 상태 파일 저장과 리스너(상태 저장소 기록, 작업 재조정)를 실행하므로
+        이벤트 루프를 막지 않도록 기본 실행기 스레드에서 호출합니다.
+        """
+        sample = await self.ntp_sample() or await self.worldtime_sample()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.service.finish_sync, sample)
+
+    async def run_forever(self) -> None:
+        """서비스의 동기화 주기(드리프트 모델에 따라 늘어남)에 맞춰 계속 동기화합니다."""
+        try:
+            while True:
+                ok = await self.sync_once()
+                await asyncio.sleep(self.service.current_interval if ok else self.service.retry_seconds)
+        finally:
+            await self.http.close()
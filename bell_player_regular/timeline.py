@@ -0,0 +1,168 @@
+"""
+롤링 다일(多日) 종 타임라인
+
+요일별 스케줄(WEEKDAY_SCHEDULE/SUNDAY_SCHEDULE)을 앞으로 며칠치 절대 발사 시각으로
+미리 펼쳐 둡니다. 날짜가 바뀌면 지난 날을 버리고 새 날 하루치만 덧붙이므로,
+자정마다 모든 작업을 지우고 다시 만드는 과정과 그 사이의 경쟁 구간이 없습니다.
+
+작업 id는 날짜가 포함된 "bell-YYYYMMDD-인덱스" 형식이라 여러 날의 같은 종이 겹치지 않습니다.
+구역(zones)을 쓰면 "bell-<구역>-YYYYMMDD-인덱스" 형식이 됩니다.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, NamedTuple, Sequence, Tuple
+
+# (인덱스, "HH:MM" 또는 "HHMM", 설명)
+ScheduleItem = Tuple[int, str, str]
+ScheduleForDate = Callable[[date], Sequence[ScheduleItem]]
+
+
+class TimelineEntry(NamedTuple):
+    """타임라인의 종 하나"""
+    job_id: str
+    run_at: datetime  # 실제(외부) 시간 기준 발사 시각 (시간대 포함)
+    index: int
+    hhmm: str
+    description: str
+
+
+def parse_hhmm(hhmm: str) -> Tuple[int, int]:
+    """"HH:MM" 또는 "HHMM"을 (시, 분)으로 변환합니다."""
+    hhmm = str(hhmm).replace(":", "").zfill(4)
+    return int(hhmm[:2]), int(hhmm[2:])
+
+
+def parse_schedule_items(raw: Any) -> List[ScheduleItem]:
+    """[[인덱스, "HH:MM", 설명], ...] 또는 [{index, time, description}, ...] 형식을 변환합니다."""
+    if not isinstance(raw, (list, tuple)):
+        raise ValueError(f"스케줄은 목록이어야 합니다: {raw!r}")
+    items = []
+    for item in raw:
+        if isinstance(item, dict):
+            idx, hhmm, description = item.get("index"), item.get("time"), item.get("description", "")
+        elif isinstance(item, (list, tuple)) and len(item) in (2, 3):
+            idx, hhmm, description = (list(item) + [""])[:3]
+        else:
+            raise ValueError(f"잘못된 스케줄 항목: {item!r}")
+        hour, minute = parse_hhmm(hhmm)
+        if not (0 <= hour < 24 and 0 <= minute < 60):
+            raise ValueError(f"잘못된 시각: {hhmm!r}")
+        items.append((int(idx), f"{hour:02d}:{minute:02d}", str(description)))
+    return items
+
+
+def at_hhmm(day: date, hhmm: str, zone) -> datetime:
+    """day 날짜의 hhmm 시각 (zone 시간대)"""
+    hour, minute = parse_hhmm(hhmm)
+    return datetime(day.year, day.month, day.day, hour, minute, tzinfo=zone)
+
+
+def bell_job_id(day: date, index: int, zone_name: str = "") -> str:
+    if zone_name:
+        return f"bell-{zone_name}-{day:%Y%m%d}-{index}"
+    return f"bell-{day:%Y%m%d}-{index}"
+
+
+def bell_job_day(job_id: str) -> date:
+    """bell_job_id로 만든 작업 id의 날짜"""
+    return datetime.strptime(job_id.rsplit("-", 2)[-2], "%Y%m%d").date()
+
+
+def compile_day(day: date, items: Sequence[ScheduleItem], zone, zone_name: str = "") -> List[TimelineEntry]:
+    """하루치 스케줄을 발사 시각 순서의 타임라인 항목으로 변환합니다."""
+    entries = [
+        TimelineEntry(bell_job_id(day, idx, zone_name), at_hhmm(day, hhmm, zone), idx, hhmm, description)
+        for idx, hhmm, description in items
+    ]
+    entries.sort(key=lambda e: e.run_at)
+    return entries
+
+
+class BellTimeline:
+    """오늘부터 horizon_days일치 종을 보관하고 날짜가 지나면 조금씩 연장합니다.
+
+    store(StateStore)를 주면 컴파일한 날을 저장해 두고, 스케줄 지문(fingerprint)이 같은
+    날은 재시작 후에도 저장된 계획을 그대로 씁니다.
+    """
+
+    def __init__(self, zone, schedule_for_date: ScheduleForDate, horizon_days: int = 7,
+                 zone_name: str = "", store=None, fingerprint: str = ""):
+        self.zone = zone
+        self.zone_name = zone_name
+        self.schedule_for_date = schedule_for_date
+        self.horizon_days = max(1, int(horizon_days))
+        self.store = store
+        self.fingerprint = fingerprint
+        self._days: Dict[date, List[TimelineEntry]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def days(self) -> List[date]:
+        with self._lock:
+            return sorted(self._days)
+
+    def extend(self, today: date) -> List[TimelineEntry]:
+        """today부터 horizon 안에서 아직 없는 날만 컴파일해 새로 추가된 항목을 반환합니다."""
+        added: List[TimelineEntry] = []
+        with self._lock:
+            for offset in range(self.horizon_days):
+                day = today + timedelta(days=offset)
+                if day in self._days:
+                    continue
+                entries = self._load_or_compile(day)
+                self._days[day] = entries
+                added.extend(entries)
+        return added
+
+    def _load_or_compile(self, day: date) -> List[TimelineEntry]:
+        if self.store is None:
+            return compile_day(day, self.schedule_for_date(day), self.zone, self.zone_name)
+        try:
+            entries = self.store.load_day(self.zone_name, day, self.fingerprint, self.zone)
+            if entries is None:
+                entries = compile_day(day, self.schedule_for_date(day), self.zone, self.zone_name)
+                self.store.save_day(self.zone_name, day, self.fingerprint, entries)
+            return entries
+        except Exception as e:
+            logging.warning(f"저장된 계획을 사용할 수 없어 다시 컴파일합니다 ({day}): {e}")
+            return compile_day(day, self.schedule_for_date(day), self.zone, self.zone_name)
+
+    def prune(self, today: date) -> List[TimelineEntry]:
+        """today 이전 날짜를 버리고 버린 항목을 반환합니다."""
+        removed: List[TimelineEntry] = []
+        with self._lock:
+            for day in [d for d in self._days if d < today]:
+                removed.extend(self._days.pop(day))
+        return removed
+
+    def invalidate(self) -> None:
+        """스케줄이 바뀌었을 때 다음 extend()에서 모든 날을 다시 컴파일하도록 비웁니다."""
+        with self._lock:
+            self._days.clear()
+
+    def entries(self) -> List[TimelineEntry]:
+        with self._lock:
+            return [e for day in sorted(self._days) for e in self._days[day]]
+
+    def pending(self, now: datetime) -> List[TimelineEntry]:
+        """now 이후에 울릴 항목"""
+        return [e for e in self.entries() if e.run_at > now]
+
+    def between(self, start: datetime, end: datetime) -> List[TimelineEntry]:
+        """start < 시각 <= end 인 항목 (구간에 걸친 날만 확인)"""
+        found: List[TimelineEntry] = []
+        with self._lock:
+            day = start.astimezone(self.zone).date()
+            last = end.astimezone(self.zone).date()
+            while day <= last:
+                found.extend(e for e in self._days.get(day, ()) if start < e.run_at <= end)
+                day += timedelta(days=1)
+        return found
+
+    def for_day(self, day: date) -> List[TimelineEntry]:
+        with self._lock:
+            return list(self._days.get(day, []))
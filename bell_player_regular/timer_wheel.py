@@ -0,0 +1,269 @@
+"""
+계층형 타이머 휠 스케줄러
+
+여러 구역 × 여러 날 × 안내 방송처럼 수십만 개의 일회성 작업을 미리 등록할 때
+heapq(삽입/재조정 O(log n))보다 가볍도록, 작업을 만료 틱에 해당하는 슬롯(dict)에
+넣는 계층형 타이머 휠을 사용합니다. 삽입과 취소는 O(1)이며, 먼 미래의 작업은 상위
+휠에 있다가 시간이 다가오면 하위 휠로 내려옵니다(cascade).
+
+- 틱 길이 tick_seconds(기본 10ms), 휠마다 256칸, 4단계: 약 2.56초 / 11분 / 46시간 / 1.4년
+- 그보다 먼 작업은 overflow에 두었다가 범위 안으로 들어오면 휠에 넣음
+- 만료 틱은 발사 시각을 올림해 계산하므로 일찍 울리지 않고 최대 한 틱 늦음
+
+HeapScheduler와 같은 API를 제공하고(scheduler_engine: wheel), 컴파일된 타임라인을
+한 번에 넣는 add_jobs()를 추가로 제공합니다.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from datetime import datetime, tzinfo
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from heap_scheduler import _UNDEFINED, MAX_WAIT_SECONDS, ConflictingIdError, HeapJob, HeapScheduler, JobLookupError
+
+WHEEL_BITS = 8
+WHEEL_SIZE = 1 << WHEEL_BITS
+WHEEL_MASK = WHEEL_SIZE - 1
+LEVELS = 4
+MAX_DELTA = 1 << (WHEEL_BITS * LEVELS)
+
+
+class WheelJob(HeapJob):
+    """휠 안의 위치(슬롯 dict, 단계)와 만료 틱을 기억하는 작업"""
+
+    __slots__ = ("_bucket", "_level", "_tick")
+
+
+class TimerWheelScheduler(HeapScheduler):
+    """계층형 타이머 휠로 일회성 작업을 실행하는 스케줄러 (HeapScheduler 호환)"""
+
+    def __init__(self, timezone: Optional[tzinfo] = None, blocking: bool = False,
+                 misfire_grace_time: float = 1.0, tick_seconds: float = 0.01):
+        super().__init__(timezone=timezone, blocking=blocking, misfire_grace_time=misfire_grace_time)
+        self.tick_seconds = float(tick_seconds)
+        self._wheels: List[List[Dict[str, WheelJob]]] = [
+            [{} for _ in range(WHEEL_SIZE)] for _ in range(LEVELS)
+        ]
+        self._counts = [0] * LEVELS
+        self._overflow: Dict[str, WheelJob] = {}
+        self._tick = self._tick_of(time.time()) - 1
+        self._jobs: Dict[str, WheelJob] = {}
+
+    def _tick_of(self, ts: float) -> int:
+        return math.floor(ts / self.tick_seconds)
+
+    # ----- 휠 조작 (self._lock 안에서 호출) -----
+
+    def _place(self, job: WheelJob) -> None:
+        # 이미 지난 작업은 다음 틱 칸에 넣되 job._tick(실제 만료 틱)은 그대로 둠
+        # (시계가 뒤로 가 휠을 다시 맞출 때 원래 시각으로 다시 넣을 수 있도록)
+        tick = max(job._tick, self._tick + 1)
+        delta = tick - self._tick
+        if delta >= MAX_DELTA:
+            job._bucket, job._level = self._overflow, -1
+            self._overflow[job.id] = job
+            return
+        level = 0
+        while delta >= WHEEL_SIZE:
+            delta >>= WHEEL_BITS
+            level += 1
+        bucket = self._wheels[level][(tick >> (WHEEL_BITS * level)) & WHEEL_MASK]
+        bucket[job.id] = job
+        job._bucket, job._level = bucket, level
+        self._counts[level] += 1
+
+    def _unplace(self, job: WheelJob) -> None:
+        del job._bucket[job.id]
+        if job._level >= 0:
+            self._counts[job._level] -= 1
+        job._bucket = None
+
+    def _cascade(self, level: int) -> int:
+        """level 휠의 현재 칸 작업을 하위 휠로 내리고 그 칸 번호를 반환합니다."""
+        index = (self._tick >> (WHEEL_BITS * level)) & WHEEL_MASK
+        bucket = self._wheels[level][index]
+        if bucket:
+            jobs = list(bucket.values())
+            bucket.clear()
+            self._counts[level] -= len(jobs)
+            for job in jobs:
+                self._place(job)
+        return index
+
+    def _rescan_overflow(self) -> None:
+        for job in [j for j in self._overflow.values() if j._tick - self._tick < MAX_DELTA]:
+            del self._overflow[job.id]
+            self._place(job)
+
+    def _rebase(self, tick: int) -> None:
+        """벽시계가 뒤로 갔을 때 현재 틱을 tick으로 되돌리고 모든 작업을 만료 틱 기준으로 다시 넣습니다."""
+        for level in self._wheels:
+            for bucket in level:
+                bucket.clear()
+        self._overflow.clear()
+        self._counts = [0] * LEVELS
+        self._tick = tick
+        for job in self._jobs.values():
+            self._place(job)
+
+    def _advance(self, target: int) -> List[WheelJob]:
+        """target 틱까지 시간을 진행하고 만료된 작업을 순서대로 꺼냅니다."""
+        due: List[WheelJob] = []
+        if target < self._tick:
+            logging.info(f"시계가 {(self._tick - target) * self.tick_seconds:.1f}초 뒤로 감: 타이머 휠 재정렬")
+            self._rebase(target)
+        if self._overflow:
+            self._rescan_overflow()
+        while self._tick < target:
+            # 빈 틱은 건너뛰고 작업이 있는 칸이나 cascade 경계로 바로 이동
+            step = self._next_step()
+            if step is None and self._overflow:
+                # 휠이 비고 overflow만 있으면 가장 이른 작업이 범위에 들어오는 틱으로 이동
+                enter = min(j._tick for j in self._overflow.values()) - MAX_DELTA + 1
+                if enter <= target:
+                    self._tick = max(self._tick, enter)
+                    self._rescan_overflow()
+                    continue
+            if step is None or self._tick + step > target:
+                self._tick = target
+                break
+            self._tick += step
+            if self._tick & WHEEL_MASK == 0:
+                level = 1
+                while level < LEVELS and self._cascade(level) == 0:
+                    level += 1
+                if level == LEVELS and self._overflow:
+                    self._rescan_overflow()
+            bucket = self._wheels[0][self._tick & WHEEL_MASK]
+            if bucket:
+                jobs = sorted(bucket.values(), key=lambda j: (j._fire_at, j._seq))
+                bucket.clear()
+                self._counts[0] -= len(jobs)
+                for job in jobs:
+                    job._bucket = None
+                    del self._jobs[job.id]
+                due.extend(jobs)
+        return due
+
+    def _next_step(self) -> Optional[int]:
+        """다음에 확인해야 할 틱까지 남은 틱 수 (작업이 없으면 None).
+
+        작업이 있는 가장 낮은 휠에서 다음으로 차 있는 칸(하위 휠이면 그 칸이 cascade되는
+        경계)을 찾고, 이번 바퀴에 없으면 한 단계 위 휠의 경계를 반환합니다.
+        """
+        for level in range(LEVELS):
+            if not self._counts[level]:
+                continue
+            shift = WHEEL_BITS * level
+            pos = (self._tick >> shift) & WHEEL_MASK
+            base = (self._tick >> shift) << shift
+            slots = self._wheels[level]
+            for k in range(pos + 1, WHEEL_SIZE):
+                if slots[k]:
+                    return base + ((k - pos) << shift) - self._tick
+            return base + ((WHEEL_SIZE - pos) << shift) - self._tick
+        return None  # overflow만 남았으면 _advance에서 따로 처리
+
+    # ----- 작업 관리 -----
+
+    def _new_job(self, job_id: str, func: Callable, args, kwargs, when: datetime,
+                 grace, name: Optional[str] = None) -> WheelJob:
+        job = WheelJob(job_id, func, args, kwargs, when, grace, name)
+        job._tick = math.ceil(job._fire_at / self.tick_seconds)
+        job._bucket = None
+        job._seq = next(self._counter)
+        return job
+
+    def _store(self, job: WheelJob, replace_existing: bool) -> None:
+        old = self._jobs.get(job.id)
+        if old is not None:
+            if not replace_existing:
+                raise ConflictingIdError(job.id)
+            self._unplace(old)
+        self._jobs[job.id] = job
+        self._place(job)
+
+    def add_job(self, func: Callable, trigger=None, args=None, kwargs=None,
+                id: Optional[str] = None, name: Optional[str] = None,
+                misfire_grace_time=_UNDEFINED, replace_existing: bool = False,
+                run_date: Optional[datetime] = None, **_ignored) -> WheelJob:
+        job_id = id or f"job-{next(self._counter)}"
+        when = self._resolve_run_date(trigger, run_date)
+        grace = self.misfire_grace_time if misfire_grace_time is _UNDEFINED else misfire_grace_time
+        with self._lock:
+            job = self._new_job(job_id, func, args, kwargs, when, grace, name)
+            self._store(job, replace_existing)
+        self._wakeup.set()
+        return job
+
+    def add_jobs(self, func: Callable, planned: Iterable[Tuple[str, datetime, tuple]],
+                 misfire_grace_time=_UNDEFINED) -> int:
+        """(id, 실행 시각, 인자) 목록을 한 번의 잠금으로 등록합니다 (같은 id는 교체)."""
+        grace = self.misfire_grace_time if misfire_grace_time is _UNDEFINED else misfire_grace_time
+        count = 0
+        with self._lock:
+            for job_id, run_at, args in planned:
+                # 시간대가 있는 시각은 변환하지 않고 그대로 사용 (대량 등록 비용 절감)
+                when = run_at if run_at.tzinfo is not None else self._resolve_run_date(None, run_at)
+                self._store(self._new_job(job_id, func, args, None, when, grace), True)
+                count += 1
+        self._wakeup.set()
+        return count
+
+    def get_jobs(self) -> List[WheelJob]:
+        with self._lock:
+            return sorted(self._jobs.values(), key=lambda j: (j._fire_at, j._seq))
+
+    def reschedule_job(self, job_id: str, trigger=None,
+                       run_date: Optional[datetime] = None, **_ignored) -> WheelJob:
+        when = self._resolve_run_date(trigger, run_date)
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                raise JobLookupError(job_id)
+            self._unplace(job)
+            job.next_run_time = when
+            job._fire_at = when.timestamp()
+            job._tick = math.ceil(job._fire_at / self.tick_seconds)
+            job._seq = next(self._counter)
+            self._place(job)
+        self._wakeup.set()
+        return job
+
+    def remove_job(self, job_id: str) -> None:
+        with self._lock:
+            job = self._jobs.pop(job_id, None)
+            if job is None:
+                raise JobLookupError(job_id)
+            self._unplace(job)
+
+    def remove_all_jobs(self) -> None:
+        with self._lock:
+            for level in self._wheels:
+                for bucket in level:
+                    bucket.clear()
+            self._overflow.clear()
+            self._counts = [0] * LEVELS
+            self._jobs.clear()
+        self._wakeup.set()
+
+    # ----- 실행 -----
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            now = time.time()
+            with self._lock:
+                self._wakeup.clear()
+                due = [] if self._paused else self._advance(self._tick_of(now))
+                ticks = None if self._paused else self._next_step()
+            for job in due:
+                self._dispatch(job, now)
+            if ticks is None:
+                timeout = MAX_WAIT_SECONDS
+            else:
+                timeout = min(MAX_WAIT_SECONDS, (self._tick + ticks) * self.tick_seconds - time.time())
+            self._wakeup.wait(max(0.0, timeout))
+        logging.debug("TimerWheelScheduler 종료")
@@ -0,0 +1,128 @@
+"""
+주간 종 인덱스
+
+요일별 스케줄을 "주 시작(월요일 00:00)부터 몇 분째"인지로 한 번만 변환해 정렬해 둡니다.
+다음 종, 이전 종, 구간 안의 종 조회는 bisect로 O(log n)에 찾으므로 GUI 시계처럼 자주
+호출되는 곳에서 "HH:MM" 문자열을 매번 다시 파싱하거나 목록 전체를 훑지 않습니다.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timedelta
+from typing import Callable, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from timeline import ScheduleItem, parse_hhmm
+
+MINUTES_PER_DAY = 24 * 60
+MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
+
+
+class WeekBell(NamedTuple):
+    """주간 인덱스의 종 하나"""
+    minute_of_week: int  # 월요일 00:00부터의 분
+    index: int
+    hhmm: str
+    description: str
+
+    @property
+    def weekday(self) -> int:
+        return self.minute_of_week // MINUTES_PER_DAY
+
+    @property
+    def hour(self) -> int:
+        return self.minute_of_week % MINUTES_PER_DAY // 60
+
+    @property
+    def minute(self) -> int:
+        return self.minute_of_week % 60
+
+
+def _minute_of_week(now: datetime) -> int:
+    return now.weekday() * MINUTES_PER_DAY + now.hour * 60 + now.minute
+
+
+def _week_start(now: datetime) -> date:
+    return now.date() - timedelta(days=now.weekday())
+
+
+class WeekIndex:
+    """요일별 스케줄을 컴파일한 정렬된 주간 인덱스.
+
+    조회 함수에 넘기는 now는 스케줄과 같은 시간대의 시각이어야 하며, 반환되는 발사 시각은
+    now와 같은 tzinfo를 가집니다. 인덱스는 만든 뒤 바뀌지 않으므로 여러 스레드에서 공유해도 됩니다.
+    """
+
+    def __init__(self, bells: Iterable[WeekBell]):
+        self._bells: List[WeekBell] = sorted(bells)
+        self._minutes: List[int] = [b.minute_of_week for b in self._bells]
+
+    @classmethod
+    def from_schedule(cls, schedule_for_weekday: Callable[[int], Sequence[ScheduleItem]]) -> "WeekIndex":
+        """schedule_for_weekday(요일 0~6)가 돌려주는 (인덱스, "HH:MM", 설명) 목록으로 만듭니다."""
+        bells = []
+        for weekday in range(7):
+            for idx, hhmm, description in schedule_for_weekday(weekday):
+                hour, minute = parse_hhmm(hhmm)
+                bells.append(WeekBell(weekday * MINUTES_PER_DAY + hour * 60 + minute, idx, hhmm, description))
+        return cls(bells)
+
+    def __len__(self) -> int:
+        return len(self._bells)
+
+    def for_weekday(self, weekday: int) -> List[WeekBell]:
+        """해당 요일의 종 목록 (시각 순)"""
+        lo = bisect_left(self._minutes, weekday * MINUTES_PER_DAY)
+        hi = bisect_left(self._minutes, (weekday + 1) * MINUTES_PER_DAY)
+        return self._bells[lo:hi]
+
+    def items_for_weekday(self, weekday: int) -> List[ScheduleItem]:
+        """해당 요일의 [(인덱스, "HH:MM", 설명), ...] (화면 목록용, 시각 순)"""
+        return [(b.index, b.hhmm, b.description) for b in self.for_weekday(weekday)]
+
+    @staticmethod
+    def occurrence(bell: WeekBell, week_start: date, tzinfo=None) -> datetime:
+        """week_start(월요일)로 시작하는 주에서 bell이 울리는 시각"""
+        day = week_start + timedelta(days=bell.weekday)
+        return datetime(day.year, day.month, day.day, bell.hour, bell.minute, tzinfo=tzinfo)
+
+    def next_bell(self, now: datetime) -> Optional[Tuple[datetime, WeekBell]]:
+        """now 이후(초과) 처음 울릴 종과 그 시각"""
+        if not self._bells:
+            return None
+        i = bisect_right(self._minutes, _minute_of_week(now))
+        week = _week_start(now)
+        if i == len(self._bells):
+            i, week = 0, week + timedelta(days=7)
+        bell = self._bells[i]
+        return self.occurrence(bell, week, now.tzinfo), bell
+
+    def previous_bell(self, now: datetime) -> Optional[Tuple[datetime, WeekBell]]:
+        """now 또는 그 이전에 마지막으로 울린 종과 그 시각"""
+        if not self._bells:
+            return None
+        i = bisect_right(self._minutes, _minute_of_week(now)) - 1
+        week = _week_start(now)
+        if i < 0:
+            i, week = len(self._bells) - 1, week - timedelta(days=7)
+        bell = self._bells[i]
+        return self.occurrence(bell, week, now.tzinfo), bell
+
+    def bells_between(self, start: datetime, end: datetime) -> Iterator[Tuple[datetime, WeekBell]]:
+        """start <= 시각 < end 인 종을 시각 순으로 하나씩 돌려줍니다 (여러 주에 걸쳐도 됨)."""
+        if not self._bells or end <= start:
+            return
+        # 초 단위가 있으면 그 분의 종은 이미 지났으므로 다음 분부터
+        first = _minute_of_week(start) + (1 if (start.second or start.microsecond) else 0)
+        week = _week_start(start)
+        if first >= MINUTES_PER_WEEK:
+            first, week = first - MINUTES_PER_WEEK, week + timedelta(days=7)
+        i = bisect_left(self._minutes, first)
+        while True:
+            if i == len(self._bells):
+                i, week = 0, week + timedelta(days=7)
+            at = self.occurrence(self._bells[i], week, start.tzinfo)
+            if at >= end:
+                return
+            yield at, self._bells[i]
+            i += 1
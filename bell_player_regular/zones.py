@@ -0,0 +1,188 @@
+"""
+다중 구역(건물/층) 종 스케줄
+
+config.yaml의 zones 목록으로 구역마다 스케줄, 사운드 폴더, 볼륨을 따로 정의하고
+한 프로세스의 스케줄러(타이머 하나)로 모든 구역의 종을 울립니다. 재생은 구역마다
+작업자 스레드 하나가 순서대로 처리하므로 한 구역의 긴 재생이 다른 구역의 종을
+막지 않고, 같은 구역의 종끼리는 겹쳐 울리지 않습니다.
+
+예:
+    zones:
+    - name: main
+      sounds_dir: D:\\bell\\main
+    - name: annex_2f
+      sounds_dir: D:\\bell\\annex
+      volume: 0.6
+      weekday_schedule:
+      - [1, "06:30", "기상종소리"]
+      sunday_schedule: []
+    - name: site_12
+      weekday_schedule_file: schedules/site_12.weekday.csv
+
+weekday_schedule_file/sunday_schedule_file은 schedule_files의 CSV/YAML 파일입니다
+(schedule_import로 만든 구역별 파일을 그대로 쓸 수 있음).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import re
+import threading
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+
+import yaml
+
+from schedule_files import schedule_files
+from timeline import ScheduleItem, parse_schedule_items
+
+# 구역별로 덮어쓸 수 있는 설정 키
+ZONE_CONFIG_KEYS = ("sounds_dir", "sounds_dir_sunday", "volume", "sound_ext", "prefer_mci")
+
+# 작업 id("bell-<구역>-YYYYMMDD-인덱스")에 들어가므로 글자/숫자/밑줄만 허용
+_ZONE_NAME = re.compile(r"^\w+$")
+
+
+def valid_zone_name(name: str) -> bool:
+    return bool(_ZONE_NAME.match(name))
+
+
+class BellZone(NamedTuple):
+    """구역 하나의 정의"""
+    name: str  # 빈 문자열은 zones 설정이 없을 때의 기본 구역
+    weekday_schedule: List[ScheduleItem]
+    sunday_schedule: List[ScheduleItem]
+    overrides: Dict[str, Any]
+
+    def schedule_for_date(self, day) -> List[ScheduleItem]:
+        return self.sunday_schedule if day.weekday() == 6 else self.weekday_schedule
+
+    def config_for(self, base: dict) -> dict:
+        """기본 설정에 이 구역의 설정을 덮어쓴 dict"""
+        merged = dict(base)
+        merged.update(self.overrides)
+        return merged
+
+
+def _zone_schedule(entry: dict, kind: str, default: Sequence[ScheduleItem], base_dir: str) -> List[ScheduleItem]:
+    """구역의 kind("weekday"/"sunday") 스케줄: 직접 쓴 목록 > 스케줄 파일 > 기본 스케줄"""
+    if f"{kind}_schedule" in entry:
+        return parse_schedule_items(entry[f"{kind}_schedule"])
+    path = str(entry.get(f"{kind}_schedule_file") or "").strip()
+    if path:
+        if base_dir and not os.path.isabs(path):
+            path = os.path.join(base_dir, path)
+        try:
+            return schedule_files.load(path).items()
+        except OSError as e:
+            raise ValueError(f"스케줄 파일을 읽을 수 없음: {e}") from e
+    return list(default)
+
+
+def parse_zones(raw: Any, default_weekday: Sequence[ScheduleItem],
+                default_sunday: Sequence[ScheduleItem], base_dir: str = "") -> List[BellZone]:
+    """설정의 zones 목록을 구역 정의로 변환합니다.
+
+    스케줄을 생략한 구역은 기본 평일/일요일 스케줄을 사용합니다. 스케줄 파일의 상대 경로는
+    base_dir 기준입니다. 잘못된 구역과 중복된 이름은 경고를 남기고 건너뜁니다.
+    """
+    if not raw:
+        return []
+    if not isinstance(raw, list):
+        logging.warning(f"zones 설정은 목록이어야 합니다: {raw!r}")
+        return []
+    zones: List[BellZone] = []
+    seen = set()
+    for entry in raw:
+        try:
+            if not isinstance(entry, dict):
+                raise ValueError("구역 정의는 dict여야 합니다")
+            name = str(entry.get("name", "")).strip()
+            if not valid_zone_name(name):
+                raise ValueError(f"구역 이름은 글자/숫자/밑줄만 사용할 수 있습니다: {name!r}")
+            if name in seen:
+                raise ValueError(f"중복된 구역 이름: {name}")
+            weekday = _zone_schedule(entry, "weekday", default_weekday, base_dir)
+            sunday = _zone_schedule(entry, "sunday", default_sunday, base_dir)
+            overrides = {key: entry[key] for key in ZONE_CONFIG_KEYS if key in entry}
+            if "volume" in overrides:
+                volume = float(overrides["volume"])
+                if not 0.0 <= volume <= 1.0:
+                    raise ValueError(f"볼륨 범위 초과: {volume}")
+                overrides["volume"] = volume
+        except (KeyError, TypeError, ValueError, yaml.YAMLError) as e:
+            logging.warning(f"잘못된 구역 설정을 건너뜀 ({entry!r}): {e}")
+            continue
+        seen.add(name)
+        zones.append(BellZone(name, weekday, sunday, overrides))
+    return zones
+
+
+class ZoneDispatcher:
+    """구역마다 작업자 스레드 하나로 재생 작업을 순서대로 실행합니다.
+
+    작업자는 구역의 첫 종이 울릴 때 만들어지고 프로세스가 끝날 때까지 재사용됩니다.
+    """
+
+    def __init__(self):
+        self._queues: Dict[str, "queue.Queue"] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def zones(self) -> List[str]:
+        with self._lock:
+            return sorted(self._queues)
+
+    def submit(self, zone_name: str, func: Callable, *args) -> None:
+        with self._lock:
+            q = self._queues.get(zone_name)
+            if q is None:
+                q = self._queues[zone_name] = queue.Queue()
+                threading.Thread(target=self._worker, args=(zone_name, q),
+                                 name=f"zone-{zone_name}", daemon=True).start()
+        q.put((func, args))
+
+    @staticmethod
+    def _worker(zone_name: str, q: "queue.Queue") -> None:
+        while True:
+            item = q.get()
+            try:
+                if item is None:
+                    return
+                func, args = item
+                func(*args)
+            except Exception as e:
+                logging.exception(f"구역 {zone_name} 재생 작업 오류: {e}")
+            finally:
+                q.task_done()
+
+    def clear(self) -> int:
+        """아직 시작하지 않은 재생 작업을 버리고 버린 개수를 반환합니다."""
+        dropped = 0
+        with self._lock:
+            queues = list(self._queues.values())
+        for q in queues:
+            while True:
+                try:
+                    q.get_nowait()
+                except queue.Empty:
+                    break
+                q.task_done()
+                dropped += 1
+        return dropped
+
+    def join(self, zone_name: Optional[str] = None) -> None:
+        """대기 중인 재생 작업이 모두 끝날 때까지 기다립니다."""
+        with self._lock:
+            queues = [q for name, q in self._queues.items() if zone_name in (None, name)]
+        for q in queues:
+            q.join()
+
+    def shutdown(self) -> None:
+        """모든 작업자를 종료합니다 (남은 작업은 버림)."""
+        self.clear()
+        with self._lock:
+            queues, self._queues = list(self._queues.values()), {}
+        for q in queues:
+            q.put(None)